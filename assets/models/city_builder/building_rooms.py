@@ -8,7 +8,548 @@ import bpy
 import bmesh
 import random
 import math
-from mathutils import Vector
+import numpy as np
+from mathutils import Vector, Euler, Matrix
+
+# Shared random generator for vectorized draws
+_rng = np.random.default_rng()
+
+# Unit cube geometry, matching bpy.ops.mesh.primitive_cube_add(size=1.0)
+CUBE_VERTS = np.array([
+    (-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+    (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5),
+], dtype=np.float32)
+CUBE_FACES = [(0, 1, 3, 2), (2, 3, 7, 6), (6, 7, 5, 4), (4, 5, 1, 0), (2, 6, 4, 0), (7, 3, 1, 5)]
+CUBE_FACE_ARRAY = np.array(CUBE_FACES)
+
+# Frequently used rotation angles
+_RAD45 = math.radians(45)
+_RAD90 = math.radians(90)
+_RAD180 = math.radians(180)
+_RAD270 = math.radians(270)
+
+# (cos, sin) samples of evenly spaced angles around the circle, keyed by sample count
+_ANGLE_TABLE = {}
+
+# Cylinder face corners and sides per face, keyed by vertex count
+_CYLINDER_LOOPS = {}
+
+# Unit UV sphere vertices and faces, keyed by (segments, ring_count)
+_SPHERE_TABLE = {}
+
+# Shared materials, keyed by their shader parameters and mapped to material names
+_material_cache = {}
+
+# Build shared materials without node trees, for solid viewport previews
+_flat_materials = False
+
+# Front, right, back and left walls as (x offset, y offset, z rotation, width axis),
+# with offsets in fractions of the room size
+_WALL_LAYOUT = (
+    (0.0, -0.5, 0.0, 0),
+    (0.5, 0.0, _RAD90, 1),
+    (0.0, 0.5, 0.0, 0),
+    (-0.5, 0.0, _RAD90, 1),
+)
+_WALL_OFFSETS = np.array([wall[:2] for wall in _WALL_LAYOUT])
+
+# Front, right, back and left secure vault weapon racks as (x offset, y offset, z rotation, spread axis),
+# with offsets in fractions of the room size
+_RACK_LAYOUT = (
+    (0.0, -0.3, 0.0, 0),
+    (0.3, 0.0, _RAD90, 1),
+    (0.0, 0.3, 0.0, 0),
+    (-0.3, 0.0, _RAD90, 1),
+)
+
+# Mesh shapes queued by plan_mesh_shape until apply_mesh_plans runs
+_mesh_plans = []
+
+# Scratch coordinate buffer shared by all foreach_get/foreach_set calls on small meshes
+_COBUF = np.empty(256 * 3, dtype=np.float32)
+
+
+def seed_rng():
+    """Reseed the shared numpy generator from the random module state"""
+    global _rng
+    _rng = np.random.default_rng(random.getrandbits(64))
+
+
+def unit_circle(count):
+    """Return read-only cos and sin arrays for count evenly spaced angles starting at 0"""
+    table = _ANGLE_TABLE.get(count)
+    if table is None:
+        angles = np.arange(count) * (2.0 * math.pi / count)
+        table = (np.cos(angles), np.sin(angles))
+        for values in table:
+            values.flags.writeable = False
+        _ANGLE_TABLE[count] = table
+
+    return table
+
+
+def create_flat_material(name, color, metallic=0.0, roughness=0.5):
+    """Create a node-less material that only sets the base color, metallic and roughness"""
+    material = bpy.data.materials.new(name=name)
+    material.diffuse_color = color
+    material.metallic = metallic
+    material.roughness = roughness
+
+    return material
+
+
+def get_principled_group():
+    """Return the shared node group wrapping a Principled BSDF behind color, metallic and roughness inputs"""
+    group = bpy.data.node_groups.get("Principled_Group")
+    if group is not None:
+        return group
+
+    group = bpy.data.node_groups.new("Principled_Group", 'ShaderNodeTree')
+    group.interface.new_socket(name="Base Color", in_out='INPUT', socket_type='NodeSocketColor')
+    group.interface.new_socket(name="Metallic", in_out='INPUT', socket_type='NodeSocketFloat')
+    group.interface.new_socket(name="Roughness", in_out='INPUT', socket_type='NodeSocketFloat')
+    ior_socket = group.interface.new_socket(name="IOR", in_out='INPUT', socket_type='NodeSocketFloat')
+    ior_socket.default_value = 1.5
+    group.interface.new_socket(name="BSDF", in_out='OUTPUT', socket_type='NodeSocketShader')
+    nodes = group.nodes
+    links = group.links
+
+    # Create nodes
+    group_input = nodes.new(type='NodeGroupInput')
+    group_output = nodes.new(type='NodeGroupOutput')
+    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+
+    # Connect nodes
+    links.new(group_input.outputs['Base Color'], principled.inputs['Base Color'])
+    links.new(group_input.outputs['Metallic'], principled.inputs['Metallic'])
+    links.new(group_input.outputs['Roughness'], principled.inputs['Roughness'])
+    links.new(group_input.outputs['IOR'], principled.inputs['IOR'])
+    links.new(principled.outputs['BSDF'], group_output.inputs['BSDF'])
+
+    return group
+
+
+def get_principled_template():
+    """Return the bare material, wired to the shared Principled group, that shared materials are copied from"""
+    template = bpy.data.materials.get("Principled_Template")
+    if template is not None:
+        return template
+
+    template = bpy.data.materials.new(name="Principled_Template")
+    template.use_nodes = True
+    nodes = template.node_tree.nodes
+    links = template.node_tree.links
+
+    # Keep the default output and swap the default Principled BSDF for the group
+    output = nodes["Material Output"]
+    nodes.remove(nodes["Principled BSDF"])
+    principled = nodes.new(type='ShaderNodeGroup')
+    principled.node_tree = get_principled_group()
+    principled.name = "Principled"
+
+    # Connect nodes
+    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+
+    return template
+
+
+def get_shared_material(name, color, metallic=0.0, roughness=0.5, ior=1.5):
+    """Return the Principled material for this color/metallic/roughness/IOR, creating it on first use"""
+    key = (tuple(color), metallic, roughness, ior, _flat_materials)
+    material = bpy.data.materials.get(_material_cache.get(key, ""))
+    if material is not None:
+        return material
+
+    # Preview builds only need the viewport display values
+    if _flat_materials:
+        material = create_flat_material(name, color, metallic, roughness)
+        _material_cache[key] = material.name
+        return material
+
+    # Copy the pre-wired template and only set the group inputs
+    material = get_principled_template().copy()
+    material.name = name
+    principled = material.node_tree.nodes["Principled"]
+
+    # Set properties
+    principled.inputs['Base Color'].default_value = color
+    principled.inputs['Metallic'].default_value = metallic
+    principled.inputs['Roughness'].default_value = roughness
+    principled.inputs['IOR'].default_value = ior
+
+    _material_cache[key] = material.name
+
+    return material
+
+
+def get_shared_emission_material(name, color, strength=1.0):
+    """Return the emission material for this color/strength, creating it on first use"""
+    key = ("EMISSION", tuple(color), strength, _flat_materials)
+    material = bpy.data.materials.get(_material_cache.get(key, ""))
+    if material is not None:
+        return material
+
+    # Preview builds only need the viewport display color
+    if _flat_materials:
+        material = create_flat_material(name, color)
+        _material_cache[key] = material.name
+        return material
+
+    material = bpy.data.materials.new(name=name)
+    material.use_nodes = True
+    nodes = material.node_tree.nodes
+    links = material.node_tree.links
+
+    # Keep the default output and swap the default Principled BSDF for an emission node
+    output = nodes["Material Output"]
+    nodes.remove(nodes["Principled BSDF"])
+    emission = nodes.new(type='ShaderNodeEmission')
+
+    # Set properties
+    emission.inputs['Color'].default_value = color
+    emission.inputs['Strength'].default_value = strength
+
+    # Connect nodes
+    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+
+    _material_cache[key] = material.name
+
+    return material
+
+
+def random_palette_color(low, high, bins=8):
+    """Pick a random RGBA color from a bins-per-channel palette spanning low..high"""
+    steps = (_rng.integers(0, bins, size=3) + 0.5) / bins
+    r, g, b = np.round(low + (high - low) * steps, 3).tolist()
+
+    return (r, g, b, 1.0)
+
+
+def create_mesh_from_loops(name, verts, loop_verts, loop_totals):
+    """Create a mesh from vertex coordinates and a flat list of face corners, filling it with foreach_set"""
+    verts = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+    loop_totals = np.asarray(loop_totals, dtype=np.int32)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", verts.ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", np.asarray(loop_verts, dtype=np.int32))
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", np.cumsum(loop_totals) - loop_totals)
+    mesh.update(calc_edges=True)
+
+    return mesh
+
+
+def create_mesh_from_faces(name, verts, faces):
+    """Create a mesh from vertex coordinates and an (n, k) face array or a list of face tuples"""
+    if isinstance(faces, np.ndarray):
+        return create_mesh_from_loops(name, verts, faces.ravel(), np.full(len(faces), faces.shape[1]))
+
+    return create_mesh_from_loops(name, verts, np.concatenate(faces), [len(face) for face in faces])
+
+
+def create_cube_mesh(name, scale=(1.0, 1.0, 1.0)):
+    """Create a cube mesh of the given dimensions through the data API"""
+    # Scale the coordinates into the shared buffer
+    co = _COBUF[:len(CUBE_VERTS) * 3]
+    np.multiply(CUBE_VERTS, scale, out=co.reshape(-1, 3))
+
+    return create_mesh_from_faces(name, co, CUBE_FACE_ARRAY)
+
+
+def cylinder_loops(vertices):
+    """Return cached read-only face corner and face size arrays of a capped cylinder"""
+    table = _CYLINDER_LOOPS.get(vertices)
+    if table is None:
+        # Side quads followed by the bottom and top caps
+        i = np.arange(vertices) * 2
+        sides = np.column_stack((i, (i + 2) % (2 * vertices), (i + 3) % (2 * vertices), i + 1))
+        loop_verts = np.concatenate((sides.ravel(), i[::-1], i + 1)).astype(np.int32)
+        loop_totals = np.append(np.full(vertices, 4, dtype=np.int32), (vertices, vertices))
+        table = (loop_verts, loop_totals)
+        for values in table:
+            values.flags.writeable = False
+        _CYLINDER_LOOPS[vertices] = table
+
+    return table
+
+
+def create_cylinder_mesh(name, vertices=32, radius=1.0, depth=2.0):
+    """Create a capped cylinder mesh through the data API"""
+    cos_a, sin_a = unit_circle(vertices)
+    ring = np.column_stack((-radius * sin_a, radius * cos_a))
+    verts = np.empty((vertices * 2, 3), dtype=np.float32)
+    verts[0::2, :2] = ring
+    verts[1::2, :2] = ring
+    verts[0::2, 2] = -depth / 2
+    verts[1::2, 2] = depth / 2
+
+    return create_mesh_from_loops(name, verts, *cylinder_loops(vertices))
+
+
+def create_torus_mesh(name, major_radius=1.0, minor_radius=0.25, major_segments=48, minor_segments=12):
+    """Create a torus mesh around the Z axis through the data API"""
+    cos_u, sin_u = unit_circle(major_segments)
+    cos_v, sin_v = unit_circle(minor_segments)
+    ring = major_radius + minor_radius * cos_v[None, :]
+    verts = np.empty((major_segments, minor_segments, 3), dtype=np.float32)
+    verts[:, :, 0] = ring * cos_u[:, None]
+    verts[:, :, 1] = ring * sin_u[:, None]
+    verts[:, :, 2] = minor_radius * sin_v[None, :]
+
+    # One quad per (major, minor) cell, wrapping in both directions
+    i = np.arange(major_segments)[:, None]
+    j = np.arange(minor_segments)[None, :]
+    i1 = (i + 1) % major_segments
+    j1 = (j + 1) % minor_segments
+    faces = np.stack((i * minor_segments + j, i1 * minor_segments + j,
+                      i1 * minor_segments + j1, i * minor_segments + j1), axis=-1).reshape(-1, 4)
+
+    return create_mesh_from_faces(name, verts.reshape(-1, 3), faces)
+
+
+def uv_sphere_geometry(segments=32, ring_count=16, radius=1.0):
+    """Return the vertex array and face tuples of a UV sphere with poles on the Z axis"""
+    table = _SPHERE_TABLE.get((segments, ring_count))
+    if table is None:
+        theta = np.arange(1, ring_count)[:, None] * (math.pi / ring_count)
+        cos_phi, sin_phi = unit_circle(segments)
+        rings = np.empty((ring_count - 1, segments, 3), dtype=np.float32)
+        rings[:, :, 0] = np.sin(theta) * cos_phi[None, :]
+        rings[:, :, 1] = np.sin(theta) * sin_phi[None, :]
+        rings[:, :, 2] = np.cos(theta)
+        unit_verts = np.concatenate((((0.0, 0.0, 1.0),), rings.reshape(-1, 3), ((0.0, 0.0, -1.0),)))
+        unit_verts.flags.writeable = False
+
+        # Triangle fans at the poles, quads between neighbouring rings
+        bottom = len(unit_verts) - 1
+        faces = [(0, 1 + k, 1 + (k + 1) % segments) for k in range(segments)]
+        for r in range(ring_count - 2):
+            start = 1 + r * segments
+            faces.extend((start + k, start + segments + k, start + segments + (k + 1) % segments, start + (k + 1) % segments)
+                         for k in range(segments))
+        start = 1 + (ring_count - 2) * segments
+        faces.extend((bottom, start + (k + 1) % segments, start + k) for k in range(segments))
+
+        table = (unit_verts, tuple(faces))
+        _SPHERE_TABLE[(segments, ring_count)] = table
+
+    unit_verts, faces = table
+
+    return unit_verts * radius, faces
+
+
+def create_uv_sphere_mesh(name, segments=32, ring_count=16, radius=1.0):
+    """Create a UV sphere mesh with poles on the Z axis through the data API"""
+    verts, faces = uv_sphere_geometry(segments, ring_count, radius)
+
+    return create_mesh_from_faces(name, verts, faces)
+
+
+def create_circle_mesh(name, vertices=32, radius=1.0):
+    """Create a circle filled with a single n-gon in the XY plane through the data API"""
+    cos_a, sin_a = unit_circle(vertices)
+    verts = np.zeros((vertices, 3), dtype=np.float32)
+    verts[:, 0] = -radius * sin_a
+    verts[:, 1] = radius * cos_a
+
+    return create_mesh_from_loops(name, verts, np.arange(vertices), (vertices,))
+
+
+def grid_geometry(x_subdivisions=10, y_subdivisions=10, size=2.0):
+    """Return the vertex and quad index arrays of a flat grid in the XY plane"""
+    xs = np.linspace(-size / 2, size / 2, x_subdivisions + 1, dtype=np.float32)
+    ys = np.linspace(-size / 2, size / 2, y_subdivisions + 1, dtype=np.float32)
+    verts = np.zeros((len(ys), len(xs), 3), dtype=np.float32)
+    verts[:, :, 0] = xs
+    verts[:, :, 1] = ys[:, None]
+
+    row = x_subdivisions + 1
+    corners = (np.arange(y_subdivisions)[:, None] * row + np.arange(x_subdivisions)).ravel()
+    faces = np.column_stack((corners, corners + 1, corners + row + 1, corners + row))
+
+    return verts.reshape(-1, 3), faces
+
+
+def create_grid_mesh(name, x_subdivisions=10, y_subdivisions=10, size=2.0):
+    """Create a flat grid mesh in the XY plane through the data API"""
+    verts, faces = grid_geometry(x_subdivisions, y_subdivisions, size)
+
+    return create_mesh_from_faces(name, verts, faces)
+
+
+def create_mesh_object(name, mesh, location, collection=None, rotation_z=0.0):
+    """Create an object for the given mesh, turned rotation_z about Z, and link it to collection (default: the active one)"""
+    obj = bpy.data.objects.new(name, mesh)
+    if rotation_z:
+        # Write location and heading in one matrix assignment
+        obj.matrix_basis = Matrix.LocRotScale(location, Euler((0.0, 0.0, rotation_z)), None)
+    else:
+        obj.location = location
+    (collection or bpy.context.collection).objects.link(obj)
+
+    return obj
+
+
+def link_mesh_objects(names, mesh, locations, collection, rotations_z=None):
+    """Create one object per name sharing mesh, place it and link it to collection"""
+    locations = np.reshape(locations, (-1, 3)).tolist()
+    if rotations_z is None:
+        rotations_z = [0.0] * len(locations)
+    else:
+        rotations_z = np.broadcast_to(rotations_z, len(locations)).tolist()
+
+    # Only the new objects are touched, so objects already in the collection keep their transforms
+    for name, location, rotation_z in zip(names, locations, rotations_z):
+        obj = bpy.data.objects.new(name, mesh)
+        obj.location = location
+        if rotation_z:
+            obj.rotation_euler.z = rotation_z
+        collection.objects.link(obj)
+
+
+def create_cube_object(name, location, scale=(1.0, 1.0, 1.0), collection=None):
+    """Create a cube object without going through bpy.ops"""
+    return create_mesh_object(name, create_cube_mesh(name, scale), location, collection)
+
+
+def create_cylinder_object(name, location, vertices=32, radius=1.0, depth=2.0, collection=None):
+    """Create a cylinder object without going through bpy.ops"""
+    return create_mesh_object(name, create_cylinder_mesh(name, vertices, radius, depth), location, collection)
+
+
+def transform_mesh(mesh, scale=(1.0, 1.0, 1.0), rotation=(0.0, 0.0, 0.0)):
+    """Bake a scale and XYZ euler rotation into the mesh vertex coordinates"""
+    # Scale, then rotate, in a single C-level pass over the vertices
+    mesh.transform(Matrix.LocRotScale(None, Euler(rotation), scale))
+    mesh.update()
+
+
+def rotation_matrix(rotation):
+    """Return the 3x3 matrix of an XYZ euler rotation as a float32 array"""
+    return np.array(Euler(rotation).to_matrix(), dtype=np.float32)
+
+
+def distort_verts(verts, jitter, threshold, z_side=0):
+    """Jitter the (N, 3) vertices whose random roll exceeds threshold, in place
+
+    z_side=1 or -1 limits the jitter to the top or bottom vertices.
+    """
+    moved = _rng.random(len(verts)) > threshold
+    if z_side:
+        moved &= verts[:, 2] * z_side > 0
+    verts[moved] += _rng.uniform(-1.0, 1.0, (np.count_nonzero(moved), 3)) * jitter
+
+
+def plan_mesh_shape(mesh, scale, jitter=(0.0, 0.0, 0.0), threshold=1.0, z_side=0, rotation=(0.0, 0.0, 0.0)):
+    """Queue a scale, random jitter and rotation of the mesh vertices for apply_mesh_plans"""
+    _mesh_plans.append((mesh, scale, jitter, threshold, z_side, rotation))
+
+
+def apply_mesh_plans():
+    """Apply every queued mesh shape, batching the meshes that share a vertex count"""
+    groups = {}
+    for plan in _mesh_plans:
+        groups.setdefault(len(plan[0].vertices), []).append(plan)
+    _mesh_plans.clear()
+
+    for count, plans in groups.items():
+        meshes, scales, jitters, thresholds, z_sides, rotations = zip(*plans)
+        size = count * 3
+        co = np.empty(len(meshes) * size, dtype=np.float32)
+        for i, mesh in enumerate(meshes):
+            mesh.vertices.foreach_get("co", co[i * size:(i + 1) * size])
+        verts = co.reshape(len(meshes), count, 3)
+
+        # Scale
+        verts *= np.array(scales, dtype=np.float32)[:, None, :]
+
+        # Distort the vertices whose roll exceeds the threshold, limited to the top (z_side=1)
+        # or bottom (z_side=-1) vertices where requested
+        sides = np.array(z_sides, dtype=np.float32)[:, None]
+        moved = _rng.random(verts.shape[:2]) > np.array(thresholds, dtype=np.float32)[:, None]
+        moved &= (sides == 0) | (verts[:, :, 2] * sides > 0)
+        offsets = _rng.uniform(-1.0, 1.0, verts.shape).astype(np.float32)
+        verts += offsets * np.array(jitters, dtype=np.float32)[:, None, :] * moved[:, :, None]
+
+        # Rotate
+        matrices = np.array([rotation_matrix(rotation) for rotation in rotations])
+        verts[:] = np.einsum('kij,knj->kni', matrices, verts)
+
+        for i, mesh in enumerate(meshes):
+            mesh.vertices.foreach_set("co", co[i * size:(i + 1) * size])
+            mesh.update()
+
+
+def join_mesh_objects(name, objects, collection=None):
+    """Merge the mesh objects into one object at the first object's location and remove the originals
+
+    Each object's transform is baked into the merged vertices; the merged mesh keeps the first object's materials.
+    """
+    origin = np.array(objects[0].location, dtype=np.float32)
+    verts = []
+    loop_totals = []
+    loop_verts = []
+    material_indices = []
+    offset = 0
+    for obj in objects:
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", totals)
+        indices = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", indices)
+        slots = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("material_index", slots)
+
+        # Bake the object transform, relative to the merged origin
+        matrix = np.array(obj.matrix_basis, dtype=np.float32)
+        verts.append(co.reshape(-1, 3) @ matrix[:3, :3].T + (matrix[:3, 3] - origin))
+        loop_totals.append(totals)
+        loop_verts.append(indices + offset)
+        material_indices.append(slots)
+        offset += len(mesh.vertices)
+
+    joined_mesh = create_mesh_from_loops(name, np.concatenate(verts), np.concatenate(loop_verts), np.concatenate(loop_totals))
+    for material in objects[0].data.materials:
+        joined_mesh.materials.append(material)
+    joined_mesh.polygons.foreach_set("material_index", np.concatenate(material_indices))
+
+    # Remove the originals along with their single-user meshes, now copied into the joined mesh
+    for obj in objects:
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(mesh)
+
+    return create_mesh_object(name, joined_mesh, origin.tolist(), collection)
+
+
+def merge_static_objects(prefix, objects, collection=None):
+    """Join the objects that share the same materials into one object per material set
+
+    Objects whose mesh has several users stay as they are, so linked duplicates keep sharing one datablock.
+    """
+    groups = {}
+    for obj in objects:
+        # Collection instances and other empties have no mesh to join
+        if obj.type != 'MESH':
+            continue
+
+        # Joining a linked duplicate would copy its shared geometry into a single-user mesh
+        if obj.data.users > 1:
+            continue
+        groups.setdefault(tuple(obj.data.materials), []).append(obj)
+
+    merged = []
+    for group in groups.values():
+        if len(group) > 1:
+            merged.append(join_mesh_objects(f"{prefix}_Static_{len(merged)}", group, collection))
+
+    return merged
+
 
 def create_neotech_rooms(neotech_objects, materials, interior_materials):
     """Create rooms per floor for NeoTech Labs Tower (Upper Tier)"""
@@ -2395,6 +2936,9 @@ def create_black_nexus_rooms(black_nexus_objects, materials, interior_materials)
 
         room_positions[room_name] = (room_x, room_y, room_z)
 
+    # Look up the corridor interior material once
+    interior_material = interior_materials["BlackNexus_Interior"]
+
     # Create corridors
     for corridor in corridor_data:
         start_name = corridor["start"]
@@ -2445,7 +2989,7 @@ def create_black_nexus_rooms(black_nexus_objects, materials, interior_materials)
             bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
 
             # Assign material
-            corridor_obj.data.materials.append(interior_materials["BlackNexus_Interior"])
+            corridor_obj.data.materials.append(interior_material)
 
             room_objects.append(corridor_obj)
 
@@ -3759,6 +4303,9 @@ def create_wire_nest_rooms(wire_nest_objects, materials, interior_materials):
 
         room_positions[room_name] = (room_x, room_y, room_z)
 
+    # Look up the corridor interior material once
+    interior_material = interior_materials["WireNest_Interior"]
+
     # Create corridors
     for corridor in corridor_data:
         start_name = corridor["start"]
@@ -3790,7 +4337,7 @@ def create_wire_nest_rooms(wire_nest_objects, materials, interior_materials):
                 corridor_obj.name = f"WireNest_Vertical_Corridor_{start_name}_to_{end_name}"
 
                 # Assign material
-                corridor_obj.data.materials.append(interior_materials["WireNest_Interior"])
+                corridor_obj.data.materials.append(interior_material)
 
                 room_objects.append(corridor_obj)
 
@@ -3813,7 +4360,7 @@ def create_wire_nest_rooms(wire_nest_objects, materials, interior_materials):
                         rung.name = f"WireNest_Ladder_Rung_{start_name}_to_{end_name}_{i}"
 
                         # Assign material
-                        rung.data.materials.append(interior_materials["WireNest_Interior"])
+                        rung.data.materials.append(interior_material)
 
                         room_objects.append(rung)
                 else:  # Create spiral stairs
@@ -3843,7 +4390,7 @@ def create_wire_nest_rooms(wire_nest_objects, materials, interior_materials):
                         bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
 
                         # Assign material
-                        step.data.materials.append(interior_materials["WireNest_Interior"])
+                        step.data.materials.append(interior_material)
 
                         room_objects.append(step)
             else:
@@ -3886,7 +4433,7 @@ def create_wire_nest_rooms(wire_nest_objects, materials, interior_materials):
                 bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
 
                 # Assign material
-                corridor_obj.data.materials.append(interior_materials["WireNest_Interior"])
+                corridor_obj.data.materials.append(interior_material)
 
                 room_objects.append(corridor_obj)
 
@@ -3900,12 +4447,652 @@ def create_wire_nest_rooms(wire_nest_objects, materials, interior_materials):
     return rooms_collection
 
 
+def create_rust_vault_main_room(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Rust Vault main room with workstations and cooling pipes"""
+    # Create central table with workstations
+    table = create_cube_object("RustVault_Central_Table", (room_x, room_y, room_z + 0.5), (room_size[0] * 0.6, room_size[1] * 0.4, 1.0), collection=rooms_collection)
+
+    # Create rusty table material
+    table_material = bpy.data.materials.new(name="RustVault_TableMaterial")
+    table_material.use_nodes = True
+    nodes = table_material.node_tree.nodes
+    links = table_material.node_tree.links
+
+    # Clear default nodes
+    nodes.clear()
+
+    # Create nodes
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    noise = nodes.new(type='ShaderNodeTexNoise')
+    mapping = nodes.new(type='ShaderNodeMapping')
+    texcoord = nodes.new(type='ShaderNodeTexCoord')
+    colorramp = nodes.new(type='ShaderNodeValToRGB')
+
+    # Set properties
+    principled.inputs['Base Color'].default_value = (0.3, 0.2, 0.15, 1.0)  # Rusty brown
+    principled.inputs['Metallic'].default_value = 0.7
+    principled.inputs['Roughness'].default_value = 0.9
+
+    noise.inputs['Scale'].default_value = 15.0
+    noise.inputs['Detail'].default_value = 10.0
+    noise.inputs['Roughness'].default_value = 0.8
+
+    # Setup color ramp for rust effect
+    colorramp.color_ramp.elements[0].position = 0.3
+    colorramp.color_ramp.elements[0].color = (0.4, 0.15, 0.05, 1.0)  # Heavy rust color
+    colorramp.color_ramp.elements[1].position = 0.7
+    colorramp.color_ramp.elements[1].color = (0.25, 0.2, 0.15, 1.0)  # Metal color
+
+    # Connect nodes
+    links.new(texcoord.outputs['Object'], mapping.inputs['Vector'])
+    links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
+    links.new(noise.outputs['Fac'], colorramp.inputs['Fac'])
+    links.new(colorramp.outputs['Color'], principled.inputs['Base Color'])
+    links.new(colorramp.outputs['Color'], principled.inputs['Roughness'])
+    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+
+    # Assign material
+    table.data.materials.append(table_material)
+
+    # Create workstations around table
+    station_count = 8
+    station_step = room_size[0] * 0.25
+    station_offset_y = room_size[1] * 0.15
+    station_offset_x = room_size[0] * 0.3
+    for i in range(station_count):
+        # Calculate position around table
+        if i < 3:  # Front side
+            station_x = room_x - station_step + i * station_step
+            station_y = room_y - station_offset_y
+            rotation_z = 0
+        elif i < 6:  # Back side
+            station_x = room_x - station_step + (i-3) * station_step
+            station_y = room_y + station_offset_y
+            rotation_z = _RAD180
+        elif i == 6:  # Left side
+            station_x = room_x - station_offset_x
+            station_y = room_y
+            rotation_z = _RAD90
+        else:  # Right side
+            station_x = room_x + station_offset_x
+            station_y = room_y
+            rotation_z = _RAD270
+
+        # Create monitor
+        monitor = create_cube_object(f"RustVault_Monitor_{i}", (station_x, station_y, room_z + 1.0), collection=rooms_collection)
+
+        # Scale and rotate monitor, distort vertices slightly for worn look
+        plan_mesh_shape(monitor.data, (0.4, 0.05, 0.3), (0.02, 0.0, 0.02), 0.8, rotation=(0.0, 0.0, rotation_z))
+
+        # Create monitor screen material
+        monitor_material = bpy.data.materials.new(name=f"RustVault_MonitorMaterial_{i}")
+        monitor_material.use_nodes = True
+        nodes = monitor_material.node_tree.nodes
+        links = monitor_material.node_tree.links
+
+        # Clear default nodes
+        nodes.clear()
+
+        # Create nodes
+        output = nodes.new(type='ShaderNodeOutputMaterial')
+        emission = nodes.new(type='ShaderNodeEmission')
+
+        # Set properties with random color
+        r, g, b = _rng.uniform((0.0, 0.3, 0.0), (0.3, 0.8, 0.3)).tolist()
+        emission.inputs['Color'].default_value = (r, g, b, 1.0)
+        emission.inputs['Strength'].default_value = 1.0
+
+        # Connect nodes
+        links.new(emission.outputs['Emission'], output.inputs['Surface'])
+
+        # Assign material
+        monitor.data.materials.append(monitor_material)
+
+        # Create keyboard
+        keyboard_y_offset = 0.2 if rotation_z < _RAD90 else -0.2
+
+        keyboard = create_cube_object(f"RustVault_Keyboard_{i}", (station_x, station_y + keyboard_y_offset, room_z + 0.55), collection=rooms_collection)
+
+        # Scale and rotate keyboard, distort vertices slightly for worn look
+        plan_mesh_shape(keyboard.data, (0.3, 0.15, 0.05), (0.01, 0.01, 0.0), 0.8, rotation=(0.0, 0.0, rotation_z))
+
+        # Assign material
+        keyboard.data.materials.append(interior_materials["RustVault_Interior"])
+
+        # Create chair (repurposed furniture)
+        chair_y_offset = 0.4 if rotation_z < _RAD90 else -0.4
+
+        chair = create_cube_object(f"RustVault_Chair_{i}", (station_x, station_y + chair_y_offset, room_z + 0.3), collection=rooms_collection)
+
+        # Scale chair and distort vertices for makeshift look
+        plan_mesh_shape(chair.data, (0.3, 0.3, 0.3), (0.05, 0.05, 0.05), 0.6)
+
+        # Create chair material
+        chair_material = get_shared_material("RustVault_ChairMaterial", (0.2, 0.2, 0.2, 1.0), roughness=0.9)  # Dark gray
+
+        # Assign material
+        chair.data.materials.append(chair_material)
+
+    # Create cooling system pipes
+    pipe_count = 8
+    pipe_angle_step = 2 * math.pi / pipe_count
+    pipe_radius_x = room_size[0] * 0.45
+    pipe_radius_y = room_size[1] * 0.45
+    for i in range(pipe_count):
+        # Calculate pipe position
+        angle = i * pipe_angle_step
+        pipe_x = room_x + pipe_radius_x * math.cos(angle)
+        pipe_y = room_y + pipe_radius_y * math.sin(angle)
+
+        # Create pipe
+        pipe = create_cylinder_object(f"RustVault_Cooling_Pipe_{i}", (pipe_x, pipe_y, room_z + room_size[2]/2), 8, 0.1, room_size[2], collection=rooms_collection)
+
+        # Create pipe material
+        pipe_material = bpy.data.materials.new(name=f"RustVault_PipeMaterial_{i}")
+        pipe_material.use_nodes = True
+        nodes = pipe_material.node_tree.nodes
+        links = pipe_material.node_tree.links
+
+        # Clear default nodes
+        nodes.clear()
+
+        # Create nodes
+        output = nodes.new(type='ShaderNodeOutputMaterial')
+        principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+        noise = nodes.new(type='ShaderNodeTexNoise')
+        mapping = nodes.new(type='ShaderNodeMapping')
+        texcoord = nodes.new(type='ShaderNodeTexCoord')
+        colorramp = nodes.new(type='ShaderNodeValToRGB')
+
+        # Set properties
+        principled.inputs['Metallic'].default_value = 0.8
+        principled.inputs['Roughness'].default_value = 0.6
+
+        noise.inputs['Scale'].default_value = 10.0
+        noise.inputs['Detail'].default_value = 8.0
+        noise.inputs['Roughness'].default_value = 0.6
+
+        # Setup color ramp for rust effect
+        colorramp.color_ramp.elements[0].position = 0.4
+        colorramp.color_ramp.elements[0].color = (0.35, 0.2, 0.1, 1.0)  # Rust color
+        colorramp.color_ramp.elements[1].position = 0.6
+        colorramp.color_ramp.elements[1].color = (0.6, 0.6, 0.6, 1.0)  # Metal color
+
+        # Connect nodes
+        links.new(texcoord.outputs['Object'], mapping.inputs['Vector'])
+        links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
+        links.new(noise.outputs['Fac'], colorramp.inputs['Fac'])
+        links.new(colorramp.outputs['Color'], principled.inputs['Base Color'])
+        links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+
+        # Assign material
+        pipe.data.materials.append(pipe_material)
+
+
+# Possible server light channel values; column c holds the choices for channel c
+_SERVER_LIGHT_PALETTE = np.array([
+    [0.0, 0.0, 1.0],
+    [0.0, 1.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0],
+], dtype=np.float32)
+
+
+def get_server_light_material():
+    """Get the shared server light material, whose emission color comes from each object's color"""
+    key = ("SERVER_LIGHT", _flat_materials)
+    light_material = bpy.data.materials.get(_material_cache.get(key, ""))
+    if light_material is not None:
+        return light_material
+
+    # Preview builds only need a white viewport display color, tinted by each light's object color
+    if _flat_materials:
+        light_material = create_flat_material("RustVault_ServerLight_Material", (1.0, 1.0, 1.0, 1.0))
+        _material_cache[key] = light_material.name
+        return light_material
+
+    light_material = bpy.data.materials.new(name="RustVault_ServerLight_Material")
+    light_material.use_nodes = True
+    nodes = light_material.node_tree.nodes
+    links = light_material.node_tree.links
+
+    # Clear default nodes
+    nodes.clear()
+
+    # Create nodes
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    emission = nodes.new(type='ShaderNodeEmission')
+    object_info = nodes.new(type='ShaderNodeObjectInfo')
+
+    # Set properties
+    emission.inputs['Strength'].default_value = 3.0
+
+    # Connect nodes
+    links.new(object_info.outputs['Color'], emission.inputs['Color'])
+    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+
+    _material_cache[key] = light_material.name
+
+    return light_material
+
+
+def create_rust_vault_server_farm(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Rust Vault server farm with old repurposed servers"""
+    # All server lights share one small cube mesh and material, and differ only by object color
+    light_material = get_server_light_material()
+    light_mesh = create_cube_mesh("RustVault_Server_Light", (0.02, 0.02, 0.02))
+    light_mesh.materials.append(light_material)
+
+    # Server lights are created unlinked and linked in a single pass at the end
+    pending_lights = []
+
+    # Calculate rack positions (three on the left side, three on the right)
+    rack_count = 6
+    rack_xs = room_x + np.array([-0.3, 0.0, 0.3, -0.3, 0.0, 0.3]) * room_size[0]
+    rack_ys = room_y + np.array([-0.2, -0.2, -0.2, 0.2, 0.2, 0.2]) * room_size[1]
+
+    # Calculate server unit positions for every rack at once
+    unit_count = 8
+    unit_zs = room_z + 0.2 + np.arange(unit_count) * (room_size[2] * 0.8 / unit_count)
+    server_locations = np.empty((rack_count, unit_count, 3))
+    server_locations[:, :, 0] = rack_xs[:, None]
+    server_locations[:, :, 1] = rack_ys[:, None]
+    server_locations[:, :, 2] = unit_zs[None, :]
+    light_locations = (server_locations + (0.2, 0.0, 0.0)).tolist()
+    server_locations = server_locations.tolist()
+    rack_xs = rack_xs.tolist()
+    rack_ys = rack_ys.tolist()
+
+    # Precompute object and material names outside the creation loops
+    rack_names = [f"RustVault_Server_Rack_{i}" for i in range(rack_count)]
+    server_names = [[f"RustVault_Server_{i}_{j}" for j in range(unit_count)] for i in range(rack_count)]
+    light_names = [[f"RustVault_Server_Light_{i}_{j}" for j in range(unit_count)] for i in range(rack_count)]
+
+    # Create server racks
+    for i in range(rack_count):
+        rack_x = rack_xs[i]
+        rack_y = rack_ys[i]
+
+        # Create server rack
+        rack = create_cube_object(rack_names[i], (rack_x, rack_y, room_z + room_size[2]/2), collection=rooms_collection)
+
+        # Scale rack and distort vertices for worn look
+        plan_mesh_shape(rack.data, (0.5, 0.5, room_size[2] * 0.9), (0.05, 0.05, 0.0), 0.8)
+
+        # Create rack material
+        rack_material = get_shared_material("RustVault_RackMaterial", (0.2, 0.2, 0.2, 1.0), metallic=0.7, roughness=0.8)  # Dark gray
+
+        # Assign material
+        rack.data.materials.append(rack_material)
+
+        # Draw the light colors for the whole rack at once
+        color_idx = _rng.integers(0, len(_SERVER_LIGHT_PALETTE), size=(unit_count, 3))
+        light_colors = _SERVER_LIGHT_PALETTE[color_idx, [0, 1, 2]].tolist()
+
+        # Create server units in rack
+        for j in range(unit_count):
+            server = create_cube_object(server_names[i][j], server_locations[i][j], collection=rooms_collection)
+
+            # Scale server and distort vertices for worn look
+            plan_mesh_shape(server.data, (0.45, 0.45, 0.1), (0.02, 0.02, 0.0), 0.8)
+
+            # Create server material
+            server_material = get_shared_material("RustVault_ServerMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.5, roughness=0.7)  # Very dark gray
+
+            # Assign material
+            server.data.materials.append(server_material)
+
+            # Create server lights
+            light = bpy.data.objects.new(light_names[i][j], light_mesh)
+            light.location = light_locations[i][j]
+
+            # Set random light color on the object
+            r, g, b = light_colors[j]
+            light.color = (r, g, b, 1.0)
+
+            pending_lights.append(light)
+
+    # Link all server lights at once
+    for light in pending_lights:
+        rooms_collection.objects.link(light)
+
+    # Create cooling system
+    cooling = create_cube_object("RustVault_Cooling_System", (room_x, room_y, room_z + 0.3), (room_size[0] * 0.8, room_size[1] * 0.1, 0.2), collection=rooms_collection)
+
+    # Create cooling system material
+    cooling_material = get_shared_material("RustVault_CoolingMaterial", (0.3, 0.3, 0.3, 1.0), metallic=0.8, roughness=0.6)  # Gray
+
+    # Assign material
+    cooling.data.materials.append(cooling_material)
+
+    # Create cooling fans
+    fan_count = 4
+    fan_xs = (room_x + (-0.3 + 0.2 * np.arange(fan_count)) * room_size[0]).tolist()
+    for i in range(fan_count):
+        fan_x = fan_xs[i]
+
+        fan = create_cylinder_object(f"RustVault_Cooling_Fan_{i}", (fan_x, room_y, room_z + 0.4), 16, 0.15, 0.05, collection=rooms_collection)
+
+        # Rotate fan to face upward
+        transform_mesh(fan.data, rotation=(_RAD90, 0.0, 0.0))
+
+        # Assign material
+        fan.data.materials.append(interior_materials["RustVault_Interior"])
+
+        # Create fan blades
+        blades = create_cylinder_object(f"RustVault_Fan_Blades_{i}", (fan_x, room_y, room_z + 0.41), 3, 0.14, 0.02, collection=rooms_collection)
+
+        # Rotate blades to face upward
+        transform_mesh(blades.data, rotation=(_RAD90, 0.0, 0.0))
+
+        # Create blades material
+        blades_material = get_shared_material("RustVault_BladesMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.5, roughness=0.7)  # Very dark gray
+
+        # Assign material
+        blades.data.materials.append(blades_material)
+
+
+def create_rust_vault_sleeping_area(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Rust Vault sleeping area with makeshift beds"""
+    # Calculate bed positions (three on the left side, three on the right)
+    bed_count = 6
+    bed_xs = (room_x + np.repeat([-0.3, 0.3], 3) * room_size[0]).tolist()
+    bed_ys = (room_y + np.tile([-0.3, 0.0, 0.3], 2) * room_size[1]).tolist()
+
+    # Create bed and pillow materials, shared by every bed
+    bed_material = create_flat_material("RustVault_BedMaterial", (0.2, 0.2, 0.3, 1.0), roughness=0.9)  # Dark blue-gray
+    pillow_material = create_flat_material("RustVault_PillowMaterial", (0.3, 0.3, 0.4, 1.0), roughness=0.9)  # Dark blue-gray
+
+    # Create beds
+    for i in range(bed_count):
+        bed_x = bed_xs[i]
+        bed_y = bed_ys[i]
+
+        # Create bed base
+        bed = create_cube_object(f"RustVault_Bed_{i}", (bed_x, bed_y, room_z + 0.3), collection=rooms_collection)
+
+        # Scale bed and distort vertices for makeshift look
+        plan_mesh_shape(bed.data, (0.5, 1.8, 0.2), (0.05, 0.05, 0.02), 0.7)
+
+        # Assign material
+        bed.data.materials.append(bed_material)
+
+        # Create pillow
+        pillow = create_cube_object(f"RustVault_Pillow_{i}", (bed_x, bed_y + 0.7, room_z + 0.4), collection=rooms_collection)
+
+        # Scale pillow and distort vertices for worn look
+        plan_mesh_shape(pillow.data, (0.4, 0.3, 0.1), (0.05, 0.05, 0.02), 0.5)
+
+        # Assign material
+        pillow.data.materials.append(pillow_material)
+
+        # Create blanket
+        blanket = create_cube_object(f"RustVault_Blanket_{i}", (bed_x, bed_y - 0.2, room_z + 0.35), collection=rooms_collection)
+
+        # Scale blanket and distort vertices for rumpled look
+        plan_mesh_shape(blanket.data, (0.45, 1.2, 0.05), (0.05, 0.05, 0.03), 0.3)
+
+        # Create blanket material with random color
+        r, g, b = _rng.uniform(0.2, 0.4, 3).tolist()
+        blanket_material = create_flat_material(f"RustVault_BlanketMaterial_{i}", (r, g, b, 1.0), roughness=0.9)
+
+        # Assign material
+        blanket.data.materials.append(blanket_material)
+
+        # Create personal storage box
+        box = create_cube_object(f"RustVault_Storage_Box_{i}", (bed_x, bed_y - 0.8, room_z + 0.2), collection=rooms_collection)
+
+        # Scale box and distort vertices for worn look
+        plan_mesh_shape(box.data, (0.4, 0.4, 0.2), (0.02, 0.02, 0.02), 0.7)
+
+        # Assign material
+        box.data.materials.append(interior_materials["RustVault_Interior"])
+
+    # Create central heating unit
+    heater = create_cylinder_object("RustVault_Heating_Unit", (room_x, room_y, room_z + room_size[2]/2), 8, 0.3, room_size[2] * 0.8, collection=rooms_collection)
+
+    # Create heater material
+    heater_material = create_flat_material("RustVault_HeaterMaterial", (0.3, 0.2, 0.2, 1.0), metallic=0.7, roughness=0.8)  # Rusty red-brown
+
+    # Assign material
+    heater.data.materials.append(heater_material)
+
+
+def create_rust_vault_faraday_cage(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Rust Vault Faraday cage room with metal mesh walls"""
+    # Create central workstation
+    workstation = create_cube_object("RustVault_Faraday_Workstation", (room_x, room_y, room_z + 0.5), (room_size[0] * 0.5, room_size[1] * 0.5, 1.0), collection=rooms_collection)
+
+    # Assign material
+    workstation.data.materials.append(interior_materials["RustVault_Interior"])
+
+    # Create secure terminal
+    terminal = create_cube_object("RustVault_Secure_Terminal", (room_x, room_y, room_z + 1.0), (0.5, 0.3, 0.4), collection=rooms_collection)
+
+    # Create terminal material
+    terminal_material = get_shared_material("RustVault_TerminalMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.5, roughness=0.7)  # Very dark gray
+
+    # Assign material
+    terminal.data.materials.append(terminal_material)
+
+    # Create terminal screen
+    screen = create_mesh_object("RustVault_Terminal_Screen", create_grid_mesh("RustVault_Terminal_Screen", 1, 1, 1.0), (room_x, room_y - 0.15, room_z + 1.0), collection=rooms_collection)
+
+    # Scale and rotate screen
+    transform_mesh(screen.data, (0.4, 0.3, 1.0), (_RAD90, 0.0, 0.0))
+
+    # Create screen material
+    screen_material = bpy.data.materials.new(name="RustVault_ScreenMaterial")
+    screen_material.use_nodes = True
+    nodes = screen_material.node_tree.nodes
+    links = screen_material.node_tree.links
+
+    # Clear default nodes
+    nodes.clear()
+
+    # Create nodes
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    emission = nodes.new(type='ShaderNodeEmission')
+
+    # Set properties
+    emission.inputs['Color'].default_value = (0.0, 0.5, 0.1, 1.0)  # Green
+    emission.inputs['Strength'].default_value = 1.0
+
+    # Connect nodes
+    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+
+    # Assign material
+    screen.data.materials.append(screen_material)
+
+    # Create chair
+    chair = create_cube_object("RustVault_Faraday_Chair", (room_x, room_y + 0.5, room_z + 0.3), collection=rooms_collection)
+
+    # Scale chair and distort vertices for makeshift look
+    plan_mesh_shape(chair.data, (0.3, 0.3, 0.3), (0.05, 0.05, 0.05), 0.7)
+
+    # Assign material
+    chair.data.materials.append(interior_materials["RustVault_Interior"])
+
+    # Create metal mesh walls (Faraday cage) as a single mesh, inset 0.05 from the room walls
+    grid_verts, grid_faces = grid_geometry(20, 20, 1.0)
+    wall_verts = []
+    wall_faces = []
+    for wall_idx, (wall_dx, wall_dy, wall_rot_z, width_axis) in enumerate(_WALL_LAYOUT):
+        # Scale and rotate the grid, then offset it from the room center
+        verts = grid_verts * (room_size[width_axis] * 0.9, room_size[2] * 0.9, 1.0)
+        verts = verts @ rotation_matrix((_RAD90, 0.0, wall_rot_z)).T
+        verts += (wall_dx * (room_size[0] - 0.1), wall_dy * (room_size[1] - 0.1), 0.0)
+
+        wall_verts.append(verts)
+        wall_faces.append(grid_faces + wall_idx * len(grid_verts))
+
+    mesh_data = bpy.data.meshes.new("RustVault_Faraday_Mesh")
+    mesh_data.from_pydata(np.concatenate(wall_verts), [], np.concatenate(wall_faces).tolist())
+    mesh_data.update()
+    mesh_wall = create_mesh_object("RustVault_Faraday_Mesh", mesh_data, (room_x, room_y, room_z + room_size[2]/2), collection=rooms_collection)
+
+    # Create mesh material
+    mesh_material = get_shared_material("RustVault_MeshMaterial", (0.7, 0.7, 0.7, 1.0), metallic=1.0, roughness=0.3)  # Light gray
+
+    # Assign material
+    mesh_wall.data.materials.append(mesh_material)
+
+    # Create one secure container mesh holding both the box and its keypad
+    container_mesh = bpy.data.meshes.new("RustVault_Secure_Container")
+    container_verts = np.concatenate((CUBE_VERTS * 0.3, CUBE_VERTS * (0.1, 0.02, 0.1) + (0.0, -0.15, 0.0)))
+    container_faces = np.concatenate((CUBE_FACE_ARRAY, CUBE_FACE_ARRAY + len(CUBE_VERTS)))
+    container_mesh.from_pydata(container_verts, [], container_faces.tolist())
+
+    # Create container and keypad materials
+    container_material = get_shared_material("RustVault_ContainerMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.9, roughness=0.2)  # Very dark gray
+    keypad_material = get_shared_material("RustVault_KeypadMaterial", (0.2, 0.2, 0.2, 1.0), metallic=0.5, roughness=0.7)  # Dark gray
+
+    # Assign materials, slot 0 to the box faces and slot 1 to the keypad faces
+    container_mesh.materials.append(container_material)
+    container_mesh.materials.append(keypad_material)
+    container_mesh.polygons.foreach_set("material_index", np.repeat((0, 1), len(CUBE_FACES)))
+    container_mesh.update()
+
+    # Create secure storage containers
+    container_count = 3
+    container_step = room_size[0] * 0.3
+    container_y = room_y - room_size[1] * 0.3
+    for i in range(container_count):
+        container_x = room_x - container_step + i * container_step
+
+        create_mesh_object(f"RustVault_Secure_Container_{i}", container_mesh, (container_x, container_y, room_z + 0.3), collection=rooms_collection)
+
+
+def create_rust_vault_kitchen(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Rust Vault kitchen/common area with repurposed furniture"""
+    # Create central table
+    table = create_cube_object("RustVault_Kitchen_Table", (room_x, room_y, room_z + 0.5), collection=rooms_collection)
+
+    # Scale table and distort vertices for repurposed look
+    plan_mesh_shape(table.data, (room_size[0] * 0.5, room_size[1] * 0.4, 1.0), (0.05, 0.05, 0.05), 0.7)
+
+    # Assign material
+    table.data.materials.append(interior_materials["RustVault_Interior"])
+
+    # Create chairs around table
+    chair_count = 6
+    chair_step = room_size[0] * 0.2
+    chair_offset_y = room_size[1] * 0.25
+    for i in range(chair_count):
+        # Calculate chair position
+        if i < 3:  # Front side
+            chair_x = room_x - chair_step + i * chair_step
+            chair_y = room_y - chair_offset_y
+        else:  # Back side
+            chair_x = room_x - chair_step + (i-3) * chair_step
+            chair_y = room_y + chair_offset_y
+
+        chair = create_cube_object(f"RustVault_Kitchen_Chair_{i}", (chair_x, chair_y, room_z + 0.3), collection=rooms_collection)
+
+        # Scale chair and distort vertices for repurposed look
+        plan_mesh_shape(chair.data, (0.3, 0.3, 0.3), (0.05, 0.05, 0.05), 0.6)
+
+        # Create chair material with random color
+        chair_material = get_shared_material("RustVault_Kitchen_ChairMaterial", random_palette_color(0.2, 0.4), roughness=0.9)
+
+        # Assign material
+        chair.data.materials.append(chair_material)
+
+    # Create kitchen counter
+    counter = create_cube_object("RustVault_Kitchen_Counter", (room_x - room_size[0] * 0.3, room_y, room_z + 0.5), (room_size[0] * 0.2, room_size[1] * 0.7, 1.0), collection=rooms_collection)
+
+    # Assign material
+    counter.data.materials.append(interior_materials["RustVault_Interior"])
+
+    # Create sink
+    sink = create_cube_object("RustVault_Sink", (room_x - room_size[0] * 0.3, room_y - room_size[1] * 0.2, room_z + 1.0), collection=rooms_collection)
+
+    # Scale sink
+    plan_mesh_shape(sink.data, (0.15, 0.15, 0.1))
+
+    # Create sink material
+    sink_material = get_shared_material("RustVault_SinkMaterial", (0.7, 0.7, 0.7, 1.0), metallic=0.9, roughness=0.4)  # Light gray
+
+    # Assign material
+    sink.data.materials.append(sink_material)
+
+    # Create faucet
+    faucet = create_cylinder_object("RustVault_Faucet", (room_x - room_size[0] * 0.3, room_y - room_size[1] * 0.2, room_z + 1.15), 8, 0.02, 0.2, collection=rooms_collection)
+
+    # Rotate faucet
+    transform_mesh(faucet.data, rotation=(_RAD90, 0.0, 0.0))
+
+    # Assign material
+    faucet.data.materials.append(sink_material)
+
+    # Create cooking equipment
+    for i in range(3):
+        equipment_x = room_x - room_size[0] * 0.3
+        equipment_y = room_y + room_size[1] * (0.1 + i * 0.15)
+
+        equipment = create_cylinder_object(f"RustVault_Cooking_Equipment_{i}", (equipment_x, equipment_y, room_z + 1.0), 16, 0.15, 0.1, collection=rooms_collection)
+
+        # Create equipment material
+        equipment_material = get_shared_material("RustVault_EquipmentMaterial", (0.3, 0.3, 0.3, 1.0), metallic=0.8, roughness=0.4)  # Gray
+
+        # Assign material
+        equipment.data.materials.append(equipment_material)
+
+    # Create food storage shelves
+    shelves = create_cube_object("RustVault_Food_Shelves", (room_x + room_size[0] * 0.3, room_y, room_z + 1.0), (room_size[0] * 0.2, room_size[1] * 0.7, 2.0), collection=rooms_collection)
+
+    # Assign material
+    shelves.data.materials.append(interior_materials["RustVault_Interior"])
+
+    # Create food containers on shelves as a single mesh, four containers per shelf level
+    container_count = 12
+    container_idx = np.arange(container_count)
+    container_offsets = np.zeros((container_count, 3), dtype=np.float32)
+    container_offsets[:, 1] = (container_idx % 4 * 0.2 - 0.3) * room_size[1]
+    container_offsets[:, 2] = container_idx // 4 * 0.6
+    container_verts = CUBE_VERTS * 0.15 + container_offsets[:, None, :]
+    container_faces = CUBE_FACE_ARRAY + container_idx[:, None, None] * len(CUBE_VERTS)
+
+    containers_mesh = bpy.data.meshes.new("RustVault_Food_Containers")
+    containers_mesh.from_pydata(container_verts.reshape(-1, 3), [], container_faces.reshape(-1, 4).tolist())
+
+    # Create container materials with random colors, one material slot per distinct material
+    container_materials = []
+    material_indices = np.empty(container_count, dtype=np.int32)
+    for i in range(container_count):
+        container_material = get_shared_material("RustVault_Food_ContainerMaterial", random_palette_color(0.2, 0.8), roughness=0.9)
+        if container_material not in container_materials:
+            container_materials.append(container_material)
+            containers_mesh.materials.append(container_material)
+        material_indices[i] = container_materials.index(container_material)
+
+    # Assign materials
+    containers_mesh.polygons.foreach_set("material_index", np.repeat(material_indices, len(CUBE_FACES)))
+    containers_mesh.update()
+
+    create_mesh_object("RustVault_Food_Containers", containers_mesh, (room_x + room_size[0] * 0.3, room_y, room_z + 0.3), collection=rooms_collection)
+
+
+# Room-specific builders for the Rust Vault, keyed by room name
+RUST_VAULT_ROOM_BUILDERS = {
+    "Main_Room": create_rust_vault_main_room,
+    "Server_Farm": create_rust_vault_server_farm,
+    "Sleeping_Area": create_rust_vault_sleeping_area,
+    "Faraday_Cage": create_rust_vault_faraday_cage,
+    "Kitchen": create_rust_vault_kitchen,
+}
+
+
 def create_rust_vault_rooms(rust_vault_objects, materials, interior_materials):
     """Create rooms for Rust Vault (Lower Tier hacker den)
 	Neon Crucible - Rust Vault Rooms Implementation
 	Blender 4.2 Python Script for generating rooms per floor for the Rust Vault building
 	in the Neon Crucible cyberpunk world.
 	"""
+    # Seed the numpy generator once so a seeded random module reproduces the whole vault
+    seed_rng()
+
     # Extract objects from the rust_vault_objects dictionary
     building = rust_vault_objects.get("building")
     collection = rust_vault_objects.get("collection")
@@ -3921,8 +5108,6 @@ def create_rust_vault_rooms(rust_vault_objects, materials, interior_materials):
     else:
         rooms_collection = bpy.data.collections["RustVault_Rooms"]
 
-    room_objects = []
-
     # Get building location and dimensions
     building_loc = building.location
     building_size = building.dimensions
@@ -3961,7 +5146,8 @@ def create_rust_vault_rooms(rust_vault_objects, materials, interior_materials):
         }
     ]
 
-    # Create each room
+    # Create each room, recording its absolute position for the corridors
+    room_positions = {}
     for room_data in rooms_data:
         room_name = room_data["name"]
         room_pos = room_data["position"]
@@ -3972,4181 +5158,1111 @@ def create_rust_vault_rooms(rust_vault_objects, materials, interior_materials):
         room_x = building_loc[0] + room_pos[0]
         room_y = building_loc[1] + room_pos[1]
         room_z = building_loc[2] - building_size.z/2 + building_size.z * 0.1 + floor_level * building_size.z * 0.3
+        room_positions[room_name] = (room_x, room_y, room_z)
 
         # Create room floor
-        bpy.ops.mesh.primitive_cube_add(
-            size=1.0,
-            enter_editmode=True,
-            align='WORLD',
-            location=(room_x, room_y, room_z)
-        )
-        floor = bpy.context.active_object
-        floor.name = f"RustVault_{room_name}_Floor"
-
-        # Edit the floor to make it look worn and rusty
-        bm = bmesh.from_edit_mesh(floor.data)
-
-        # Scale floor
-        for v in bm.verts:
-            v.co.x *= room_size[0]
-            v.co.y *= room_size[1]
-            v.co.z *= 0.1
-
-        # Distort vertices slightly for worn look
-        for v in bm.verts:
-            if v.co.z > 0 and random.random() > 0.6:
-                v.co.z += random.uniform(-0.05, 0.05)
+        floor = create_cube_object(f"RustVault_{room_name}_Floor", (room_x, room_y, room_z), collection=rooms_collection)
 
-        # Update mesh
-        bmesh.update_edit_mesh(floor.data)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Scale floor and distort vertices slightly for worn look
+        plan_mesh_shape(floor.data, (room_size[0], room_size[1], 0.1), (0.0, 0.0, 0.05), 0.6, z_side=1)
 
         # Assign material
         floor.data.materials.append(interior_materials["RustVault_Interior"])
 
-        room_objects.append(floor)
-
         # Create room ceiling
-        bpy.ops.mesh.primitive_cube_add(
-            size=1.0,
-            enter_editmode=True,
-            align='WORLD',
-            location=(room_x, room_y, room_z + room_size[2])
-        )
-        ceiling = bpy.context.active_object
-        ceiling.name = f"RustVault_{room_name}_Ceiling"
-
-        # Edit the ceiling to make it look worn and rusty
-        bm = bmesh.from_edit_mesh(ceiling.data)
-
-        # Scale ceiling
-        for v in bm.verts:
-            v.co.x *= room_size[0]
-            v.co.y *= room_size[1]
-            v.co.z *= 0.1
-
-        # Distort vertices slightly for worn look
-        for v in bm.verts:
-            if v.co.z < 0 and random.random() > 0.6:
-                v.co.z += random.uniform(-0.05, 0.05)
+        ceiling = create_cube_object(f"RustVault_{room_name}_Ceiling", (room_x, room_y, room_z + room_size[2]), collection=rooms_collection)
 
-        # Update mesh
-        bmesh.update_edit_mesh(ceiling.data)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Scale ceiling and distort vertices slightly for worn look
+        plan_mesh_shape(ceiling.data, (room_size[0], room_size[1], 0.1), (0.0, 0.0, 0.05), 0.6, z_side=-1)
 
         # Assign material
         ceiling.data.materials.append(interior_materials["RustVault_Interior"])
 
-        room_objects.append(ceiling)
-
         # Create room walls
-        for wall_idx in range(4):
-            # Determine wall position
-            if wall_idx == 0:  # Front wall
-                wall_x = room_x
-                wall_y = room_y - room_size[1]/2
-                wall_rot_z = 0
-                wall_width = room_size[0]
-            elif wall_idx == 1:  # Right wall
-                wall_x = room_x + room_size[0]/2
-                wall_y = room_y
-                wall_rot_z = math.radians(90)
-                wall_width = room_size[1]
-            elif wall_idx == 2:  # Back wall
-                wall_x = room_x
-                wall_y = room_y + room_size[1]/2
-                wall_rot_z = 0
-                wall_width = room_size[0]
-            else:  # Left wall
-                wall_x = room_x - room_size[0]/2
-                wall_y = room_y
-                wall_rot_z = math.radians(90)
-                wall_width = room_size[1]
+        for wall_idx, (wall_dx, wall_dy, wall_rot_z, width_axis) in enumerate(_WALL_LAYOUT):
+            wall_x = room_x + wall_dx * room_size[0]
+            wall_y = room_y + wall_dy * room_size[1]
+            wall_width = room_size[width_axis]
 
             # Create wall
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=True,
-                align='WORLD',
-                location=(wall_x, wall_y, room_z + room_size[2]/2)
-            )
-            wall = bpy.context.active_object
-            wall.name = f"RustVault_{room_name}_Wall_{wall_idx}"
-
-            # Edit the wall to make it look worn and rusty
-            bm = bmesh.from_edit_mesh(wall.data)
-
-            # Scale wall
-            for v in bm.verts:
-                v.co.x *= wall_width
-                v.co.y *= 0.1
-                v.co.z *= room_size[2]
-
-            # Distort vertices slightly for worn look
-            for v in bm.verts:
-                if random.random() > 0.8:
-                    v.co.x += random.uniform(-0.05, 0.05)
-                    v.co.z += random.uniform(-0.05, 0.05)
+            wall = create_cube_object(f"RustVault_{room_name}_Wall_{wall_idx}", (wall_x, wall_y, room_z + room_size[2]/2), collection=rooms_collection)
 
-            # Update mesh
-            bmesh.update_edit_mesh(wall.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            # Rotate wall
-            wall.rotation_euler.z = wall_rot_z
-
-            # Apply rotation
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+            # Scale and rotate wall, distort vertices slightly for worn look
+            plan_mesh_shape(wall.data, (wall_width, 0.1, room_size[2]), (0.05, 0.0, 0.05), 0.8, rotation=(0.0, 0.0, wall_rot_z))
 
             # Assign material
             wall.data.materials.append(interior_materials["RustVault_Interior"])
 
-            room_objects.append(wall)
-
         # Add room-specific elements
-        if room_name == "Main_Room":
-            # Create workstations in the main room
-
-            # Create central table with workstations
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.5)
-            )
-            table = bpy.context.active_object
-            table.name = "RustVault_Central_Table"
-
-            # Scale table
-            table.scale.x = room_size[0] * 0.6
-            table.scale.y = room_size[1] * 0.4
-            table.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create rusty table material
-            table_material = bpy.data.materials.new(name="RustVault_TableMaterial")
-            table_material.use_nodes = True
-            nodes = table_material.node_tree.nodes
-            links = table_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-            noise = nodes.new(type='ShaderNodeTexNoise')
-            mapping = nodes.new(type='ShaderNodeMapping')
-            texcoord = nodes.new(type='ShaderNodeTexCoord')
-            colorramp = nodes.new(type='ShaderNodeValToRGB')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.3, 0.2, 0.15, 1.0)  # Rusty brown
-            principled.inputs['Metallic'].default_value = 0.7
-            principled.inputs['Roughness'].default_value = 0.9
-
-            noise.inputs['Scale'].default_value = 15.0
-            noise.inputs['Detail'].default_value = 10.0
-            noise.inputs['Roughness'].default_value = 0.8
-
-            # Setup color ramp for rust effect
-            colorramp.color_ramp.elements[0].position = 0.3
-            colorramp.color_ramp.elements[0].color = (0.4, 0.15, 0.05, 1.0)  # Heavy rust color
-            colorramp.color_ramp.elements[1].position = 0.7
-            colorramp.color_ramp.elements[1].color = (0.25, 0.2, 0.15, 1.0)  # Metal color
-
-            # Connect nodes
-            links.new(texcoord.outputs['Object'], mapping.inputs['Vector'])
-            links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-            links.new(noise.outputs['Fac'], colorramp.inputs['Fac'])
-            links.new(colorramp.outputs['Color'], principled.inputs['Base Color'])
-            links.new(colorramp.outputs['Color'], principled.inputs['Roughness'])
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            table.data.materials.append(table_material)
-
-            room_objects.append(table)
-
-            # Create workstations around table
-            station_count = 8
-            for i in range(station_count):
-                # Calculate position around table
-                if i < 3:  # Front side
-                    station_x = room_x - room_size[0] * 0.25 + i * room_size[0] * 0.25
-                    station_y = room_y - room_size[1] * 0.15
-                    rotation_z = 0
-                elif i < 6:  # Back side
-                    station_x = room_x - room_size[0] * 0.25 + (i-3) * room_size[0] * 0.25
-                    station_y = room_y + room_size[1] * 0.15
-                    rotation_z = math.radians(180)
-                elif i == 6:  # Left side
-                    station_x = room_x - room_size[0] * 0.3
-                    station_y = room_y
-                    rotation_z = math.radians(90)
-                else:  # Right side
-                    station_x = room_x + room_size[0] * 0.3
-                    station_y = room_y
-                    rotation_z = math.radians(270)
-
-                # Create monitor
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(station_x, station_y, room_z + 1.0)
-                )
-                monitor = bpy.context.active_object
-                monitor.name = f"RustVault_Monitor_{i}"
-
-                # Edit the monitor to make it look old and worn
-                bm = bmesh.from_edit_mesh(monitor.data)
-
-                # Scale monitor
-                for v in bm.verts:
-                    v.co.x *= 0.4
-                    v.co.y *= 0.05
-                    v.co.z *= 0.3
-
-                # Distort vertices slightly for worn look
-                for v in bm.verts:
-                    if random.random() > 0.8:
-                        v.co.x += random.uniform(-0.02, 0.02)
-                        v.co.z += random.uniform(-0.02, 0.02)
-
-                # Update mesh
-                bmesh.update_edit_mesh(monitor.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Rotate monitor
-                monitor.rotation_euler.z = rotation_z
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Create monitor screen material
-                monitor_material = bpy.data.materials.new(name=f"RustVault_MonitorMaterial_{i}")
-                monitor_material.use_nodes = True
-                nodes = monitor_material.node_tree.nodes
-                links = monitor_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                emission = nodes.new(type='ShaderNodeEmission')
-
-                # Set properties with random color
-                r = random.uniform(0.0, 0.3)
-                g = random.uniform(0.3, 0.8)
-                b = random.uniform(0.0, 0.3)
-                emission.inputs['Color'].default_value = (r, g, b, 1.0)
-                emission.inputs['Strength'].default_value = 1.0
-
-                # Connect nodes
-                links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-                # Assign material
-                monitor.data.materials.append(monitor_material)
-
-                room_objects.append(monitor)
-
-                # Create keyboard
-                keyboard_y_offset = 0.2 if rotation_z < math.radians(90) else -0.2
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(station_x, station_y + keyboard_y_offset, room_z + 0.55)
-                )
-                keyboard = bpy.context.active_object
-                keyboard.name = f"RustVault_Keyboard_{i}"
-
-                # Edit the keyboard to make it look worn
-                bm = bmesh.from_edit_mesh(keyboard.data)
-
-                # Scale keyboard
-                for v in bm.verts:
-                    v.co.x *= 0.3
-                    v.co.y *= 0.15
-                    v.co.z *= 0.05
-
-                # Distort vertices slightly for worn look
-                for v in bm.verts:
-                    if random.random() > 0.8:
-                        v.co.x += random.uniform(-0.01, 0.01)
-                        v.co.y += random.uniform(-0.01, 0.01)
-
-                # Update mesh
-                bmesh.update_edit_mesh(keyboard.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Rotate keyboard
-                keyboard.rotation_euler.z = rotation_z
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Assign material
-                keyboard.data.materials.append(interior_materials["RustVault_Interior"])
-
-                room_objects.append(keyboard)
-
-                # Create chair (repurposed furniture)
-                chair_y_offset = 0.4 if rotation_z < math.radians(90) else -0.4
+        room_builder = RUST_VAULT_ROOM_BUILDERS.get(room_name)
+        if room_builder:
+            room_builder(room_x, room_y, room_z, room_size, interior_materials, rooms_collection)
 
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(station_x, station_y + chair_y_offset, room_z + 0.3)
-                )
-                chair = bpy.context.active_object
-                chair.name = f"RustVault_Chair_{i}"
+    # Create connecting corridors between rooms
+    corridor_data = [
+        {
+            "start": "Main_Room",
+            "end": "Server_Farm",
+            "width": building_size.x * 0.1,
+            "height": building_size.z * 0.2
+        },
+        {
+            "start": "Main_Room",
+            "end": "Sleeping_Area",
+            "width": building_size.x * 0.1,
+            "height": building_size.z * 0.2
+        },
+        {
+            "start": "Main_Room",
+            "end": "Faraday_Cage",
+            "width": building_size.x * 0.1,
+            "height": building_size.z * 0.2
+        },
+        {
+            "start": "Main_Room",
+            "end": "Kitchen",
+            "width": building_size.x * 0.1,
+            "height": building_size.z * 0.2
+        }
+    ]
 
-                # Edit the chair to make it look makeshift and repurposed
-                bm = bmesh.from_edit_mesh(chair.data)
+    # Create corridors as a single mesh centered on the building
+    corridor_verts = []
+    corridor_faces = []
+    for corridor in corridor_data:
+        start_name = corridor["start"]
+        end_name = corridor["end"]
+        corridor_width = corridor["width"]
+        corridor_height = corridor["height"]
 
-                # Scale chair
-                for v in bm.verts:
-                    v.co.x *= 0.3
-                    v.co.y *= 0.3
-                    v.co.z *= 0.3
+        if start_name in room_positions and end_name in room_positions:
+            start_pos = room_positions[start_name]
+            end_pos = room_positions[end_name]
 
-                # Distort vertices for makeshift look
-                for v in bm.verts:
-                    if random.random() > 0.6:
-                        v.co.x += random.uniform(-0.05, 0.05)
-                        v.co.y += random.uniform(-0.05, 0.05)
-                        v.co.z += random.uniform(-0.05, 0.05)
+            # Calculate corridor direction and length
+            dx = end_pos[0] - start_pos[0]
+            dy = end_pos[1] - start_pos[1]
+            length = math.hypot(dx, dy)
+            angle = math.atan2(dy, dx)
 
-                # Update mesh
-                bmesh.update_edit_mesh(chair.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
+            # Create corridor
+            corridor_x = (start_pos[0] + end_pos[0]) / 2
+            corridor_y = (start_pos[1] + end_pos[1]) / 2
+            corridor_z = start_pos[2]  # Use start room's z position
 
-                # Create chair material
-                chair_material = bpy.data.materials.new(name=f"RustVault_ChairMaterial_{i}")
-                chair_material.use_nodes = True
-                nodes = chair_material.node_tree.nodes
-                links = chair_material.node_tree.links
+            # Scale corridor and distort vertices for worn look
+            verts = CUBE_VERTS * (length, corridor_width, corridor_height)
+            distort_verts(verts, (0.0, 0.05, 0.05), 0.8)
 
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
+            # Rotate corridor to point from start to end and move it into place
+            verts = verts @ rotation_matrix((0.0, 0.0, angle)).T
+            verts += (corridor_x - building_loc[0], corridor_y - building_loc[1], corridor_z + corridor_height/2 - building_loc[2])
 
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+            corridor_faces.append(CUBE_FACE_ARRAY + len(corridor_verts) * len(CUBE_VERTS))
+            corridor_verts.append(verts)
 
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.2, 0.2, 0.2, 1.0)  # Dark gray
-                principled.inputs['Roughness'].default_value = 0.9
+    if corridor_verts:
+        corridor_mesh = bpy.data.meshes.new("RustVault_Corridors")
+        corridor_mesh.from_pydata(np.concatenate(corridor_verts), [], np.concatenate(corridor_faces).tolist())
+        corridor_mesh.update()
+        corridor_obj = create_mesh_object("RustVault_Corridors", corridor_mesh, building_loc, collection=rooms_collection)
 
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+        # Assign material
+        corridor_obj.data.materials.append(interior_materials["RustVault_Interior"])
 
-                # Assign material
-                chair.data.materials.append(chair_material)
+    # Shape all queued room meshes in one batch
+    apply_mesh_plans()
 
-                room_objects.append(chair)
+    return rooms_collection
 
-            # Create cooling system pipes
-            pipe_count = 8
-            for i in range(pipe_count):
-                # Calculate pipe position
-                angle = i * (2 * math.pi / pipe_count)
-                pipe_x = room_x + room_size[0] * 0.45 * math.cos(angle)
-                pipe_y = room_y + room_size[1] * 0.45 * math.sin(angle)
 
-                # Create pipe
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=8,
-                    radius=0.1,
-                    depth=room_size[2],
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(pipe_x, pipe_y, room_z + room_size[2]/2)
-                )
-                pipe = bpy.context.active_object
-                pipe.name = f"RustVault_Cooling_Pipe_{i}"
+def get_militech_window_material():
+    """Get the shared red-tinted glass material of the Militech control room window"""
+    window_material = bpy.data.materials.get("MilitechArmory_WindowMaterial")
+    if window_material:
+        return window_material
 
-                # Create pipe material
-                pipe_material = bpy.data.materials.new(name=f"RustVault_PipeMaterial_{i}")
-                pipe_material.use_nodes = True
-                nodes = pipe_material.node_tree.nodes
-                links = pipe_material.node_tree.links
+    window_material = bpy.data.materials.new(name="MilitechArmory_WindowMaterial")
+    window_material.use_nodes = True
 
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
+    # The default node tree already links a Principled BSDF to the output
+    principled = window_material.node_tree.nodes["Principled BSDF"]
 
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-                noise = nodes.new(type='ShaderNodeTexNoise')
-                mapping = nodes.new(type='ShaderNodeMapping')
-                texcoord = nodes.new(type='ShaderNodeTexCoord')
-                colorramp = nodes.new(type='ShaderNodeValToRGB')
+    # Set properties
+    principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 0.2)  # Red tint
+    principled.inputs['Metallic'].default_value = 0.0
+    principled.inputs['Roughness'].default_value = 0.0
+    principled.inputs['IOR'].default_value = 1.45
+    principled.inputs['Transmission Weight'].default_value = 0.9  # Updated for Blender 4.2
 
-                # Set properties
-                principled.inputs['Metallic'].default_value = 0.8
-                principled.inputs['Roughness'].default_value = 0.6
+    return window_material
 
-                noise.inputs['Scale'].default_value = 10.0
-                noise.inputs['Detail'].default_value = 8.0
-                noise.inputs['Roughness'].default_value = 0.6
 
-                # Setup color ramp for rust effect
-                colorramp.color_ramp.elements[0].position = 0.4
-                colorramp.color_ramp.elements[0].color = (0.35, 0.2, 0.1, 1.0)  # Rust color
-                colorramp.color_ramp.elements[1].position = 0.6
-                colorramp.color_ramp.elements[1].color = (0.6, 0.6, 0.6, 1.0)  # Metal color
+def create_militech_room_shell(room_name, room_x, room_y, room_z, room_size, slab_mesh, wall_meshes, rooms_collection):
+    """Link the floor, ceiling and four walls of a Militech room from its shared shell meshes"""
+    # Create room floor
+    create_mesh_object(f"MilitechArmory_{room_name}_Floor", slab_mesh, (room_x, room_y, room_z), collection=rooms_collection)
+
+    # Create room ceiling
+    create_mesh_object(f"MilitechArmory_{room_name}_Ceiling", slab_mesh, (room_x, room_y, room_z + room_size[2]), collection=rooms_collection)
 
-                # Connect nodes
-                links.new(texcoord.outputs['Object'], mapping.inputs['Vector'])
-                links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
-                links.new(noise.outputs['Fac'], colorramp.inputs['Fac'])
-                links.new(colorramp.outputs['Color'], principled.inputs['Base Color'])
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                pipe.data.materials.append(pipe_material)
-
-                room_objects.append(pipe)
-
-        elif room_name == "Server_Farm":
-            # Create server farm with old repurposed servers
-
-            # Create server racks
-            rack_count = 6
-            for i in range(rack_count):
-                # Calculate rack position
-                if i < 3:  # Left side
-                    rack_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.3
-                    rack_y = room_y - room_size[1] * 0.2
-                else:  # Right side
-                    rack_x = room_x - room_size[0] * 0.3 + (i-3) * room_size[0] * 0.3
-                    rack_y = room_y + room_size[1] * 0.2
-
-                # Create server rack
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(rack_x, rack_y, room_z + room_size[2]/2)
-                )
-                rack = bpy.context.active_object
-                rack.name = f"RustVault_Server_Rack_{i}"
-
-                # Edit the rack to make it look worn and repurposed
-                bm = bmesh.from_edit_mesh(rack.data)
-
-                # Scale rack
-                for v in bm.verts:
-                    v.co.x *= 0.5
-                    v.co.y *= 0.5
-                    v.co.z *= room_size[2] * 0.9
-
-                # Distort vertices for worn look
-                for v in bm.verts:
-                    if random.random() > 0.8:
-                        v.co.x += random.uniform(-0.05, 0.05)
-                        v.co.y += random.uniform(-0.05, 0.05)
-
-                # Update mesh
-                bmesh.update_edit_mesh(rack.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Create rack material
-                rack_material = bpy.data.materials.new(name=f"RustVault_RackMaterial_{i}")
-                rack_material.use_nodes = True
-                nodes = rack_material.node_tree.nodes
-                links = rack_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.2, 0.2, 0.2, 1.0)  # Dark gray
-                principled.inputs['Metallic'].default_value = 0.7
-                principled.inputs['Roughness'].default_value = 0.8
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                rack.data.materials.append(rack_material)
-
-                room_objects.append(rack)
-
-                # Create server units in rack
-                unit_count = 8
-                for j in range(unit_count):
-                    unit_z = room_z + 0.2 + j * (room_size[2] * 0.8 / unit_count)
-
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=True,
-                        align='WORLD',
-                        location=(rack_x, rack_y, unit_z)
-                    )
-                    server = bpy.context.active_object
-                    server.name = f"RustVault_Server_{i}_{j}"
-
-                    # Edit the server to make it look worn and repurposed
-                    bm = bmesh.from_edit_mesh(server.data)
-
-                    # Scale server
-                    for v in bm.verts:
-                        v.co.x *= 0.45
-                        v.co.y *= 0.45
-                        v.co.z *= 0.1
-
-                    # Distort vertices for worn look
-                    for v in bm.verts:
-                        if random.random() > 0.8:
-                            v.co.x += random.uniform(-0.02, 0.02)
-                            v.co.y += random.uniform(-0.02, 0.02)
-
-                    # Update mesh
-                    bmesh.update_edit_mesh(server.data)
-                    bpy.ops.object.mode_set(mode='OBJECT')
-
-                    # Create server material
-                    server_material = bpy.data.materials.new(name=f"RustVault_ServerMaterial_{i}_{j}")
-                    server_material.use_nodes = True
-                    nodes = server_material.node_tree.nodes
-                    links = server_material.node_tree.links
-
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                    # Set properties
-                    principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Very dark gray
-                    principled.inputs['Metallic'].default_value = 0.5
-                    principled.inputs['Roughness'].default_value = 0.7
-
-                    # Connect nodes
-                    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                    # Assign material
-                    server.data.materials.append(server_material)
-
-                    room_objects.append(server)
-
-                    # Create server lights
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(rack_x + 0.2, rack_y, unit_z)
-                    )
-                    light = bpy.context.active_object
-                    light.name = f"RustVault_Server_Light_{i}_{j}"
-
-                    # Scale light
-                    light.scale.x = 0.02
-                    light.scale.y = 0.02
-                    light.scale.z = 0.02
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Create light material with random color
-                    light_material = bpy.data.materials.new(name=f"RustVault_ServerLight_Material_{i}_{j}")
-                    light_material.use_nodes = True
-                    nodes = light_material.node_tree.nodes
-                    links = light_material.node_tree.links
-
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    emission = nodes.new(type='ShaderNodeEmission')
-
-                    # Set properties with random color
-                    r = random.choice([0.0, 0.0, 1.0, 0.0])
-                    g = random.choice([0.0, 1.0, 0.0, 0.0])
-                    b = random.choice([1.0, 0.0, 0.0, 1.0])
-                    emission.inputs['Color'].default_value = (r, g, b, 1.0)
-                    emission.inputs['Strength'].default_value = 3.0
-
-                    # Connect nodes
-                    links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-                    # Assign material
-                    light.data.materials.append(light_material)
-
-                    room_objects.append(light)
-
-            # Create cooling system
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.3)
-            )
-            cooling = bpy.context.active_object
-            cooling.name = "RustVault_Cooling_System"
-
-            # Scale cooling system
-            cooling.scale.x = room_size[0] * 0.8
-            cooling.scale.y = room_size[1] * 0.1
-            cooling.scale.z = 0.2
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create cooling system material
-            cooling_material = bpy.data.materials.new(name="RustVault_CoolingMaterial")
-            cooling_material.use_nodes = True
-            nodes = cooling_material.node_tree.nodes
-            links = cooling_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.3, 0.3, 0.3, 1.0)  # Gray
-            principled.inputs['Metallic'].default_value = 0.8
-            principled.inputs['Roughness'].default_value = 0.6
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            cooling.data.materials.append(cooling_material)
-
-            room_objects.append(cooling)
-
-            # Create cooling fans
-            fan_count = 4
-            for i in range(fan_count):
-                fan_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.2
-
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=16,
-                    radius=0.15,
-                    depth=0.05,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(fan_x, room_y, room_z + 0.4)
-                )
-                fan = bpy.context.active_object
-                fan.name = f"RustVault_Cooling_Fan_{i}"
-
-                # Rotate fan to face upward
-                fan.rotation_euler.x = math.radians(90)
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Assign material
-                fan.data.materials.append(interior_materials["RustVault_Interior"])
-
-                room_objects.append(fan)
-
-                # Create fan blades
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=3,
-                    radius=0.14,
-                    depth=0.02,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(fan_x, room_y, room_z + 0.41)
-                )
-                blades = bpy.context.active_object
-                blades.name = f"RustVault_Fan_Blades_{i}"
-
-                # Rotate blades to face upward
-                blades.rotation_euler.x = math.radians(90)
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Create blades material
-                blades_material = bpy.data.materials.new(name=f"RustVault_BladesMaterial_{i}")
-                blades_material.use_nodes = True
-                nodes = blades_material.node_tree.nodes
-                links = blades_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Very dark gray
-                principled.inputs['Metallic'].default_value = 0.5
-                principled.inputs['Roughness'].default_value = 0.7
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                blades.data.materials.append(blades_material)
-
-                room_objects.append(blades)
-
-        elif room_name == "Sleeping_Area":
-            # Create sleeping area with makeshift beds
-
-            # Create beds
-            bed_count = 6
-            for i in range(bed_count):
-                # Calculate bed position
-                if i < 3:  # Left side
-                    bed_x = room_x - room_size[0] * 0.3
-                    bed_y = room_y - room_size[1] * 0.3 + i * room_size[1] * 0.3
-                else:  # Right side
-                    bed_x = room_x + room_size[0] * 0.3
-                    bed_y = room_y - room_size[1] * 0.3 + (i-3) * room_size[1] * 0.3
-
-                # Create bed base
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(bed_x, bed_y, room_z + 0.3)
-                )
-                bed = bpy.context.active_object
-                bed.name = f"RustVault_Bed_{i}"
-
-                # Edit the bed to make it look makeshift
-                bm = bmesh.from_edit_mesh(bed.data)
-
-                # Scale bed
-                for v in bm.verts:
-                    v.co.x *= 0.5
-                    v.co.y *= 1.8
-                    v.co.z *= 0.2
-
-                # Distort vertices for makeshift look
-                for v in bm.verts:
-                    if random.random() > 0.7:
-                        v.co.x += random.uniform(-0.05, 0.05)
-                        v.co.y += random.uniform(-0.05, 0.05)
-                        v.co.z += random.uniform(-0.02, 0.02)
-
-                # Update mesh
-                bmesh.update_edit_mesh(bed.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Create bed material
-                bed_material = bpy.data.materials.new(name=f"RustVault_BedMaterial_{i}")
-                bed_material.use_nodes = True
-                nodes = bed_material.node_tree.nodes
-                links = bed_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.2, 0.2, 0.3, 1.0)  # Dark blue-gray
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                bed.data.materials.append(bed_material)
-
-                room_objects.append(bed)
-
-                # Create pillow
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(bed_x, bed_y + 0.7, room_z + 0.4)
-                )
-                pillow = bpy.context.active_object
-                pillow.name = f"RustVault_Pillow_{i}"
-
-                # Edit the pillow to make it look worn
-                bm = bmesh.from_edit_mesh(pillow.data)
-
-                # Scale pillow
-                for v in bm.verts:
-                    v.co.x *= 0.4
-                    v.co.y *= 0.3
-                    v.co.z *= 0.1
-
-                # Distort vertices for worn look
-                for v in bm.verts:
-                    if random.random() > 0.5:
-                        v.co.x += random.uniform(-0.05, 0.05)
-                        v.co.y += random.uniform(-0.05, 0.05)
-                        v.co.z += random.uniform(-0.02, 0.02)
-
-                # Update mesh
-                bmesh.update_edit_mesh(pillow.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Create pillow material
-                pillow_material = bpy.data.materials.new(name=f"RustVault_PillowMaterial_{i}")
-                pillow_material.use_nodes = True
-                nodes = pillow_material.node_tree.nodes
-                links = pillow_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.3, 0.3, 0.4, 1.0)  # Dark blue-gray
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                pillow.data.materials.append(pillow_material)
-
-                room_objects.append(pillow)
-
-                # Create blanket
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(bed_x, bed_y - 0.2, room_z + 0.35)
-                )
-                blanket = bpy.context.active_object
-                blanket.name = f"RustVault_Blanket_{i}"
-
-                # Edit the blanket to make it look worn and rumpled
-                bm = bmesh.from_edit_mesh(blanket.data)
-
-                # Scale blanket
-                for v in bm.verts:
-                    v.co.x *= 0.45
-                    v.co.y *= 1.2
-                    v.co.z *= 0.05
-
-                # Distort vertices for rumpled look
-                for v in bm.verts:
-                    if random.random() > 0.3:
-                        v.co.x += random.uniform(-0.05, 0.05)
-                        v.co.y += random.uniform(-0.05, 0.05)
-                        v.co.z += random.uniform(-0.03, 0.03)
-
-                # Update mesh
-                bmesh.update_edit_mesh(blanket.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Create blanket material with random color
-                blanket_material = bpy.data.materials.new(name=f"RustVault_BlanketMaterial_{i}")
-                blanket_material.use_nodes = True
-                nodes = blanket_material.node_tree.nodes
-                links = blanket_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set random color
-                r = random.uniform(0.2, 0.4)
-                g = random.uniform(0.2, 0.4)
-                b = random.uniform(0.2, 0.4)
-                principled.inputs['Base Color'].default_value = (r, g, b, 1.0)
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                blanket.data.materials.append(blanket_material)
-
-                room_objects.append(blanket)
-
-                # Create personal storage box
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(bed_x, bed_y - 0.8, room_z + 0.2)
-                )
-                box = bpy.context.active_object
-                box.name = f"RustVault_Storage_Box_{i}"
-
-                # Edit the box to make it look worn
-                bm = bmesh.from_edit_mesh(box.data)
-
-                # Scale box
-                for v in bm.verts:
-                    v.co.x *= 0.4
-                    v.co.y *= 0.4
-                    v.co.z *= 0.2
-
-                # Distort vertices for worn look
-                for v in bm.verts:
-                    if random.random() > 0.7:
-                        v.co.x += random.uniform(-0.02, 0.02)
-                        v.co.y += random.uniform(-0.02, 0.02)
-                        v.co.z += random.uniform(-0.02, 0.02)
-
-                # Update mesh
-                bmesh.update_edit_mesh(box.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Assign material
-                box.data.materials.append(interior_materials["RustVault_Interior"])
-
-                room_objects.append(box)
-
-            # Create central heating unit
-            bpy.ops.mesh.primitive_cylinder_add(
-                vertices=8,
-                radius=0.3,
-                depth=room_size[2] * 0.8,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + room_size[2]/2)
-            )
-            heater = bpy.context.active_object
-            heater.name = "RustVault_Heating_Unit"
-
-            # Create heater material
-            heater_material = bpy.data.materials.new(name="RustVault_HeaterMaterial")
-            heater_material.use_nodes = True
-            nodes = heater_material.node_tree.nodes
-            links = heater_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.3, 0.2, 0.2, 1.0)  # Rusty red-brown
-            principled.inputs['Metallic'].default_value = 0.7
-            principled.inputs['Roughness'].default_value = 0.8
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            heater.data.materials.append(heater_material)
-
-            room_objects.append(heater)
-
-        elif room_name == "Faraday_Cage":
-            # Create Faraday cage room with metal mesh walls
-
-            # Create central workstation
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.5)
-            )
-            workstation = bpy.context.active_object
-            workstation.name = "RustVault_Faraday_Workstation"
-
-            # Scale workstation
-            workstation.scale.x = room_size[0] * 0.5
-            workstation.scale.y = room_size[1] * 0.5
-            workstation.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            workstation.data.materials.append(interior_materials["RustVault_Interior"])
-
-            room_objects.append(workstation)
-
-            # Create secure terminal
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 1.0)
-            )
-            terminal = bpy.context.active_object
-            terminal.name = "RustVault_Secure_Terminal"
-
-            # Scale terminal
-            terminal.scale.x = 0.5
-            terminal.scale.y = 0.3
-            terminal.scale.z = 0.4
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create terminal material
-            terminal_material = bpy.data.materials.new(name="RustVault_TerminalMaterial")
-            terminal_material.use_nodes = True
-            nodes = terminal_material.node_tree.nodes
-            links = terminal_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Very dark gray
-            principled.inputs['Metallic'].default_value = 0.5
-            principled.inputs['Roughness'].default_value = 0.7
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            terminal.data.materials.append(terminal_material)
-
-            room_objects.append(terminal)
-
-            # Create terminal screen
-            bpy.ops.mesh.primitive_plane_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y - 0.15, room_z + 1.0)
-            )
-            screen = bpy.context.active_object
-            screen.name = "RustVault_Terminal_Screen"
-
-            # Scale screen
-            screen.scale.x = 0.4
-            screen.scale.y = 0.3
-
-            # Rotate screen to face forward
-            screen.rotation_euler.x = math.radians(90)
-
-            # Apply transformations
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-            # Create screen material
-            screen_material = bpy.data.materials.new(name="RustVault_ScreenMaterial")
-            screen_material.use_nodes = True
-            nodes = screen_material.node_tree.nodes
-            links = screen_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            emission = nodes.new(type='ShaderNodeEmission')
-
-            # Set properties
-            emission.inputs['Color'].default_value = (0.0, 0.5, 0.1, 1.0)  # Green
-            emission.inputs['Strength'].default_value = 1.0
-
-            # Connect nodes
-            links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-            # Assign material
-            screen.data.materials.append(screen_material)
-
-            room_objects.append(screen)
-
-            # Create chair
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=True,
-                align='WORLD',
-                location=(room_x, room_y + 0.5, room_z + 0.3)
-            )
-            chair = bpy.context.active_object
-            chair.name = "RustVault_Faraday_Chair"
-
-            # Edit the chair to make it look makeshift
-            bm = bmesh.from_edit_mesh(chair.data)
-
-            # Scale chair
-            for v in bm.verts:
-                v.co.x *= 0.3
-                v.co.y *= 0.3
-                v.co.z *= 0.3
-
-            # Distort vertices for makeshift look
-            for v in bm.verts:
-                if random.random() > 0.7:
-                    v.co.x += random.uniform(-0.05, 0.05)
-                    v.co.y += random.uniform(-0.05, 0.05)
-                    v.co.z += random.uniform(-0.05, 0.05)
-
-            # Update mesh
-            bmesh.update_edit_mesh(chair.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            # Assign material
-            chair.data.materials.append(interior_materials["RustVault_Interior"])
-
-            room_objects.append(chair)
-
-            # Create metal mesh walls (Faraday cage)
-            for wall_idx in range(4):
-                # Determine wall position
-                if wall_idx == 0:  # Front wall
-                    wall_x = room_x
-                    wall_y = room_y - room_size[1]/2 + 0.05
-                    wall_rot_z = 0
-                    wall_width = room_size[0] * 0.9
-                elif wall_idx == 1:  # Right wall
-                    wall_x = room_x + room_size[0]/2 - 0.05
-                    wall_y = room_y
-                    wall_rot_z = math.radians(90)
-                    wall_width = room_size[1] * 0.9
-                elif wall_idx == 2:  # Back wall
-                    wall_x = room_x
-                    wall_y = room_y + room_size[1]/2 - 0.05
-                    wall_rot_z = 0
-                    wall_width = room_size[0] * 0.9
-                else:  # Left wall
-                    wall_x = room_x - room_size[0]/2 + 0.05
-                    wall_y = room_y
-                    wall_rot_z = math.radians(90)
-                    wall_width = room_size[1] * 0.9
-
-                # Create mesh wall
-                bpy.ops.mesh.primitive_grid_add(
-                    x_subdivisions=20,
-                    y_subdivisions=20,
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(wall_x, wall_y, room_z + room_size[2]/2)
-                )
-                mesh_wall = bpy.context.active_object
-                mesh_wall.name = f"RustVault_Faraday_Mesh_{wall_idx}"
-
-                # Scale mesh wall
-                mesh_wall.scale.x = wall_width
-                mesh_wall.scale.y = room_size[2] * 0.9
-
-                # Rotate mesh wall
-                mesh_wall.rotation_euler.x = math.radians(90)
-                mesh_wall.rotation_euler.z = wall_rot_z
-
-                # Apply transformations
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-                # Create mesh material
-                mesh_material = bpy.data.materials.new(name=f"RustVault_MeshMaterial_{wall_idx}")
-                mesh_material.use_nodes = True
-                nodes = mesh_material.node_tree.nodes
-                links = mesh_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.7, 0.7, 0.7, 1.0)  # Light gray
-                principled.inputs['Metallic'].default_value = 1.0
-                principled.inputs['Roughness'].default_value = 0.3
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                mesh_wall.data.materials.append(mesh_material)
-
-                room_objects.append(mesh_wall)
-
-            # Create secure storage containers
-            container_count = 3
-            for i in range(container_count):
-                container_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.3
-                container_y = room_y - room_size[1] * 0.3
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(container_x, container_y, room_z + 0.3)
-                )
-                container = bpy.context.active_object
-                container.name = f"RustVault_Secure_Container_{i}"
-
-                # Scale container
-                container.scale.x = 0.3
-                container.scale.y = 0.3
-                container.scale.z = 0.3
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create container material
-                container_material = bpy.data.materials.new(name=f"RustVault_ContainerMaterial_{i}")
-                container_material.use_nodes = True
-                nodes = container_material.node_tree.nodes
-                links = container_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Very dark gray
-                principled.inputs['Metallic'].default_value = 0.9
-                principled.inputs['Roughness'].default_value = 0.2
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                container.data.materials.append(container_material)
-
-                room_objects.append(container)
-
-                # Create keypad on container
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(container_x, container_y - 0.15, room_z + 0.3)
-                )
-                keypad = bpy.context.active_object
-                keypad.name = f"RustVault_Container_Keypad_{i}"
-
-                # Scale keypad
-                keypad.scale.x = 0.1
-                keypad.scale.y = 0.02
-                keypad.scale.z = 0.1
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create keypad material
-                keypad_material = bpy.data.materials.new(name=f"RustVault_KeypadMaterial_{i}")
-                keypad_material.use_nodes = True
-                nodes = keypad_material.node_tree.nodes
-                links = keypad_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.2, 0.2, 0.2, 1.0)  # Dark gray
-                principled.inputs['Metallic'].default_value = 0.5
-                principled.inputs['Roughness'].default_value = 0.7
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                keypad.data.materials.append(keypad_material)
-
-                room_objects.append(keypad)
-
-        elif room_name == "Kitchen":
-            # Create kitchen/common area with repurposed furniture
-
-            # Create central table
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=True,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.5)
-            )
-            table = bpy.context.active_object
-            table.name = "RustVault_Kitchen_Table"
-
-            # Edit the table to make it look repurposed
-            bm = bmesh.from_edit_mesh(table.data)
-
-            # Scale table
-            for v in bm.verts:
-                v.co.x *= room_size[0] * 0.5
-                v.co.y *= room_size[1] * 0.4
-                v.co.z *= 1.0
-
-            # Distort vertices for repurposed look
-            for v in bm.verts:
-                if random.random() > 0.7:
-                    v.co.x += random.uniform(-0.05, 0.05)
-                    v.co.y += random.uniform(-0.05, 0.05)
-                    v.co.z += random.uniform(-0.05, 0.05)
-
-            # Update mesh
-            bmesh.update_edit_mesh(table.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            # Assign material
-            table.data.materials.append(interior_materials["RustVault_Interior"])
-
-            room_objects.append(table)
-
-            # Create chairs around table
-            chair_count = 6
-            for i in range(chair_count):
-                # Calculate chair position
-                if i < 3:  # Front side
-                    chair_x = room_x - room_size[0] * 0.2 + i * room_size[0] * 0.2
-                    chair_y = room_y - room_size[1] * 0.25
-                else:  # Back side
-                    chair_x = room_x - room_size[0] * 0.2 + (i-3) * room_size[0] * 0.2
-                    chair_y = room_y + room_size[1] * 0.25
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=True,
-                    align='WORLD',
-                    location=(chair_x, chair_y, room_z + 0.3)
-                )
-                chair = bpy.context.active_object
-                chair.name = f"RustVault_Kitchen_Chair_{i}"
-
-                # Edit the chair to make it look repurposed
-                bm = bmesh.from_edit_mesh(chair.data)
-
-                # Scale chair
-                for v in bm.verts:
-                    v.co.x *= 0.3
-                    v.co.y *= 0.3
-                    v.co.z *= 0.3
-
-                # Distort vertices for repurposed look
-                for v in bm.verts:
-                    if random.random() > 0.6:
-                        v.co.x += random.uniform(-0.05, 0.05)
-                        v.co.y += random.uniform(-0.05, 0.05)
-                        v.co.z += random.uniform(-0.05, 0.05)
-
-                # Update mesh
-                bmesh.update_edit_mesh(chair.data)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Create chair material with random color
-                chair_material = bpy.data.materials.new(name=f"RustVault_ChairMaterial_{i}")
-                chair_material.use_nodes = True
-                nodes = chair_material.node_tree.nodes
-                links = chair_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set random color
-                r = random.uniform(0.2, 0.4)
-                g = random.uniform(0.2, 0.4)
-                b = random.uniform(0.2, 0.4)
-                principled.inputs['Base Color'].default_value = (r, g, b, 1.0)
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                chair.data.materials.append(chair_material)
-
-                room_objects.append(chair)
-
-            # Create kitchen counter
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x - room_size[0] * 0.3, room_y, room_z + 0.5)
-            )
-            counter = bpy.context.active_object
-            counter.name = "RustVault_Kitchen_Counter"
-
-            # Scale counter
-            counter.scale.x = room_size[0] * 0.2
-            counter.scale.y = room_size[1] * 0.7
-            counter.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            counter.data.materials.append(interior_materials["RustVault_Interior"])
-
-            room_objects.append(counter)
-
-            # Create sink
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=True,
-                align='WORLD',
-                location=(room_x - room_size[0] * 0.3, room_y - room_size[1] * 0.2, room_z + 1.0)
-            )
-            sink = bpy.context.active_object
-            sink.name = "RustVault_Sink"
-
-            # Edit the sink
-            bm = bmesh.from_edit_mesh(sink.data)
-
-            # Scale sink
-            for v in bm.verts:
-                v.co.x *= 0.15
-                v.co.y *= 0.15
-                v.co.z *= 0.1
-
-            # Update mesh
-            bmesh.update_edit_mesh(sink.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            # Create sink material
-            sink_material = bpy.data.materials.new(name="RustVault_SinkMaterial")
-            sink_material.use_nodes = True
-            nodes = sink_material.node_tree.nodes
-            links = sink_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.7, 0.7, 0.7, 1.0)  # Light gray
-            principled.inputs['Metallic'].default_value = 0.9
-            principled.inputs['Roughness'].default_value = 0.4
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            sink.data.materials.append(sink_material)
-
-            room_objects.append(sink)
-
-            # Create faucet
-            bpy.ops.mesh.primitive_cylinder_add(
-                vertices=8,
-                radius=0.02,
-                depth=0.2,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x - room_size[0] * 0.3, room_y - room_size[1] * 0.2, room_z + 1.15)
-            )
-            faucet = bpy.context.active_object
-            faucet.name = "RustVault_Faucet"
-
-            # Rotate faucet
-            faucet.rotation_euler.x = math.radians(90)
-
-            # Apply rotation
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-            # Assign material
-            faucet.data.materials.append(sink_material)
-
-            room_objects.append(faucet)
-
-            # Create cooking equipment
-            for i in range(3):
-                equipment_x = room_x - room_size[0] * 0.3
-                equipment_y = room_y + room_size[1] * (0.1 + i * 0.15)
-
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=16,
-                    radius=0.15,
-                    depth=0.1,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(equipment_x, equipment_y, room_z + 1.0)
-                )
-                equipment = bpy.context.active_object
-                equipment.name = f"RustVault_Cooking_Equipment_{i}"
-
-                # Create equipment material
-                equipment_material = bpy.data.materials.new(name=f"RustVault_EquipmentMaterial_{i}")
-                equipment_material.use_nodes = True
-                nodes = equipment_material.node_tree.nodes
-                links = equipment_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.3, 0.3, 0.3, 1.0)  # Gray
-                principled.inputs['Metallic'].default_value = 0.8
-                principled.inputs['Roughness'].default_value = 0.4
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                equipment.data.materials.append(equipment_material)
-
-                room_objects.append(equipment)
-
-            # Create food storage shelves
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x + room_size[0] * 0.3, room_y, room_z + 1.0)
-            )
-            shelves = bpy.context.active_object
-            shelves.name = "RustVault_Food_Shelves"
-
-            # Scale shelves
-            shelves.scale.x = room_size[0] * 0.2
-            shelves.scale.y = room_size[1] * 0.7
-            shelves.scale.z = 2.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            shelves.data.materials.append(interior_materials["RustVault_Interior"])
-
-            room_objects.append(shelves)
-
-            # Create food containers on shelves
-            container_count = 12
-            for i in range(container_count):
-                shelf_level = i // 4
-                shelf_position = i % 4
-
-                container_x = room_x + room_size[0] * 0.3
-                container_y = room_y - room_size[1] * 0.3 + shelf_position * room_size[1] * 0.2
-                container_z = room_z + 0.3 + shelf_level * 0.6
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(container_x, container_y, container_z)
-                )
-                container = bpy.context.active_object
-                container.name = f"RustVault_Food_Container_{i}"
-
-                # Scale container
-                container.scale.x = 0.15
-                container.scale.y = 0.15
-                container.scale.z = 0.15
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create container material with random color
-                container_material = bpy.data.materials.new(name=f"RustVault_ContainerMaterial_{i}")
-                container_material.use_nodes = True
-                nodes = container_material.node_tree.nodes
-                links = container_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set random color
-                r = random.uniform(0.2, 0.8)
-                g = random.uniform(0.2, 0.8)
-                b = random.uniform(0.2, 0.8)
-                principled.inputs['Base Color'].default_value = (r, g, b, 1.0)
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                container.data.materials.append(container_material)
-
-                room_objects.append(container)
-
-    # Create connecting corridors between rooms
-    corridor_data = [
-        {
-            "start": "Main_Room",
-            "end": "Server_Farm",
-            "width": building_size.x * 0.1,
-            "height": building_size.z * 0.2
-        },
-        {
-            "start": "Main_Room",
-            "end": "Sleeping_Area",
-            "width": building_size.x * 0.1,
-            "height": building_size.z * 0.2
-        },
-        {
-            "start": "Main_Room",
-            "end": "Faraday_Cage",
-            "width": building_size.x * 0.1,
-            "height": building_size.z * 0.2
-        },
-        {
-            "start": "Main_Room",
-            "end": "Kitchen",
-            "width": building_size.x * 0.1,
-            "height": building_size.z * 0.2
-        }
-    ]
-
-    # Find room positions
-    room_positions = {}
-    for room_data in rooms_data:
-        room_name = room_data["name"]
-        room_pos = room_data["position"]
-        floor_level = room_data["floor_level"]
-
-        # Calculate absolute position
-        room_x = building_loc[0] + room_pos[0]
-        room_y = building_loc[1] + room_pos[1]
-        room_z = building_loc[2] - building_size.z/2 + building_size.z * 0.1 + floor_level * building_size.z * 0.3
-
-        room_positions[room_name] = (room_x, room_y, room_z)
-
-    # Create corridors
-    for corridor in corridor_data:
-        start_name = corridor["start"]
-        end_name = corridor["end"]
-        corridor_width = corridor["width"]
-        corridor_height = corridor["height"]
-
-        if start_name in room_positions and end_name in room_positions:
-            start_pos = room_positions[start_name]
-            end_pos = room_positions[end_name]
-
-            # Calculate corridor direction and length
-            direction = Vector((end_pos[0], end_pos[1], 0)) - Vector((start_pos[0], start_pos[1], 0))
-            length = direction.length
-            direction.normalize()
-
-            # Create corridor
-            corridor_x = (start_pos[0] + end_pos[0]) / 2
-            corridor_y = (start_pos[1] + end_pos[1]) / 2
-            corridor_z = start_pos[2]  # Use start room's z position
-
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=True,
-                align='WORLD',
-                location=(corridor_x, corridor_y, corridor_z + corridor_height/2)
-            )
-            corridor_obj = bpy.context.active_object
-            corridor_obj.name = f"RustVault_Corridor_{start_name}_to_{end_name}"
-
-            # Edit the corridor to make it look worn
-            bm = bmesh.from_edit_mesh(corridor_obj.data)
-
-            # Scale corridor
-            for v in bm.verts:
-                v.co.x *= length
-                v.co.y *= corridor_width
-                v.co.z *= corridor_height
-
-            # Distort vertices for worn look
-            for v in bm.verts:
-                if random.random() > 0.8:
-                    v.co.y += random.uniform(-0.05, 0.05)
-                    v.co.z += random.uniform(-0.05, 0.05)
-
-            # Update mesh
-            bmesh.update_edit_mesh(corridor_obj.data)
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            # Rotate corridor to point from start to end
-            corridor_obj.rotation_euler.z = math.atan2(direction.y, direction.x)
-
-            # Apply rotation
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-            # Assign material
-            corridor_obj.data.materials.append(interior_materials["RustVault_Interior"])
-
-            room_objects.append(corridor_obj)
-
-    # Move all objects to the rooms collection
-    for obj in room_objects:
-        if obj.name not in rooms_collection.objects:
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            bpy.ops.object.move_to_collection(collection_index=bpy.data.collections.find(rooms_collection.name))
-
-    return rooms_collection
-
-
-def create_militech_armory_rooms(militech_objects, materials, interior_materials):
-    """Create rooms for Militech Armory (Upper Tier corporate weapons manufacturer)
-	Neon Crucible - Militech Armory Rooms Implementation
-	Blender 4.2 Python Script for generating rooms per floor for the Militech Armory building
-	in the Neon Crucible cyberpunk world.
-	"""
-    # Extract objects from the militech_objects dictionary
-    building = militech_objects.get("building")
-    collection = militech_objects.get("collection")
-
-    if not building or not collection:
-        print("Error: Missing required Militech Armory objects")
-        return None
-
-    # Create a subcollection for room objects
-    if "MilitechArmory_Rooms" not in bpy.data.collections:
-        rooms_collection = bpy.data.collections.new("MilitechArmory_Rooms")
-        collection.children.link(rooms_collection)
-    else:
-        rooms_collection = bpy.data.collections["MilitechArmory_Rooms"]
-
-    room_objects = []
-
-    # Get building location and dimensions
-    building_loc = building.location
-    building_size = building.dimensions
-
-    # Define room positions relative to building center
-    rooms_data = [
-        {
-            "name": "Security_Lobby",
-            "position": (0, 0, 0),
-            "size": (building_size.x * 0.7, building_size.y * 0.7, building_size.z * 0.15),
-            "floor_level": 0
-        },
-        {
-            "name": "Showroom",
-            "position": (0, 0, 0),
-            "size": (building_size.x * 0.7, building_size.y * 0.7, building_size.z * 0.15),
-            "floor_level": 1
-        },
-        {
-            "name": "Testing_Range",
-            "position": (building_size.x * 0.3, 0, 0),
-            "size": (building_size.x * 0.4, building_size.y * 0.8, building_size.z * 0.15),
-            "floor_level": 2
-        },
-        {
-            "name": "RD_Lab",
-            "position": (-building_size.x * 0.3, 0, 0),
-            "size": (building_size.x * 0.4, building_size.y * 0.8, building_size.z * 0.15),
-            "floor_level": 2
-        },
-        {
-            "name": "Secure_Vault",
-            "position": (0, -building_size.y * 0.3, 0),
-            "size": (building_size.x * 0.5, building_size.y * 0.4, building_size.z * 0.15),
-            "floor_level": 3
-        },
-        {
-            "name": "Executive_Office",
-            "position": (0, building_size.y * 0.3, 0),
-            "size": (building_size.x * 0.5, building_size.y * 0.4, building_size.z * 0.15),
-            "floor_level": 3
-        }
-    ]
-
-    # Create each room
-    for room_data in rooms_data:
-        room_name = room_data["name"]
-        room_pos = room_data["position"]
-        room_size = room_data["size"]
-        floor_level = room_data["floor_level"]
-
-        # Calculate absolute position
-        room_x = building_loc[0] + room_pos[0]
-        room_y = building_loc[1] + room_pos[1]
-        room_z = building_loc[2] - building_size.z/2 + building_size.z * 0.1 + floor_level * building_size.z * 0.2
-
-        # Create room floor
-        bpy.ops.mesh.primitive_cube_add(
-            size=1.0,
-            enter_editmode=False,
-            align='WORLD',
-            location=(room_x, room_y, room_z)
-        )
-        floor = bpy.context.active_object
-        floor.name = f"MilitechArmory_{room_name}_Floor"
-
-        # Scale floor
-        floor.scale.x = room_size[0]
-        floor.scale.y = room_size[1]
-        floor.scale.z = 0.1
-
-        # Apply scale
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-        # Assign material
-        floor.data.materials.append(interior_materials["Militech_Interior"])
-
-        room_objects.append(floor)
-
-        # Create room ceiling
-        bpy.ops.mesh.primitive_cube_add(
-            size=1.0,
-            enter_editmode=False,
-            align='WORLD',
-            location=(room_x, room_y, room_z + room_size[2])
-        )
-        ceiling = bpy.context.active_object
-        ceiling.name = f"MilitechArmory_{room_name}_Ceiling"
-
-        # Scale ceiling
-        ceiling.scale.x = room_size[0]
-        ceiling.scale.y = room_size[1]
-        ceiling.scale.z = 0.1
-
-        # Apply scale
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-        # Assign material
-        ceiling.data.materials.append(interior_materials["Militech_Interior"])
-
-        room_objects.append(ceiling)
-
-        # Create room walls
-        for wall_idx in range(4):
-            # Determine wall position
-            if wall_idx == 0:  # Front wall
-                wall_x = room_x
-                wall_y = room_y - room_size[1]/2
-                wall_rot_z = 0
-                wall_width = room_size[0]
-            elif wall_idx == 1:  # Right wall
-                wall_x = room_x + room_size[0]/2
-                wall_y = room_y
-                wall_rot_z = math.radians(90)
-                wall_width = room_size[1]
-            elif wall_idx == 2:  # Back wall
-                wall_x = room_x
-                wall_y = room_y + room_size[1]/2
-                wall_rot_z = 0
-                wall_width = room_size[0]
-            else:  # Left wall
-                wall_x = room_x - room_size[0]/2
-                wall_y = room_y
-                wall_rot_z = math.radians(90)
-                wall_width = room_size[1]
-
-            # Create wall
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(wall_x, wall_y, room_z + room_size[2]/2)
-            )
-            wall = bpy.context.active_object
-            wall.name = f"MilitechArmory_{room_name}_Wall_{wall_idx}"
-
-            # Scale wall
-            wall.scale.x = wall_width
-            wall.scale.y = 0.1
-            wall.scale.z = room_size[2]
-
-            # Rotate wall
-            wall.rotation_euler.z = wall_rot_z
-
-            # Apply transformations
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-            # Assign material
-            wall.data.materials.append(interior_materials["Militech_Interior"])
-
-            room_objects.append(wall)
-
-        # Add room-specific elements
-        if room_name == "Security_Lobby":
-            # Create reception desk
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y - room_size[1] * 0.2, room_z + 0.5)
-            )
-            desk = bpy.context.active_object
-            desk.name = "MilitechArmory_Reception_Desk"
-
-            # Scale desk
-            desk.scale.x = room_size[0] * 0.4
-            desk.scale.y = room_size[1] * 0.1
-            desk.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            desk.data.materials.append(interior_materials["Militech_Interior"])
-
-            room_objects.append(desk)
-
-            # Create security scanners
-            for i in range(2):
-                scanner_x = room_x - room_size[0] * 0.15 + i * room_size[0] * 0.3
-                scanner_y = room_y
-
-                # Create scanner base
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(scanner_x, scanner_y, room_z + 0.1)
-                )
-                scanner_base = bpy.context.active_object
-                scanner_base.name = f"MilitechArmory_Scanner_Base_{i}"
-
-                # Scale scanner base
-                scanner_base.scale.x = 0.5
-                scanner_base.scale.y = 0.5
-                scanner_base.scale.z = 0.1
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Assign material
-                scanner_base.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(scanner_base)
-
-                # Create scanner arch
-                bpy.ops.mesh.primitive_torus_add(
-                    major_radius=1.0,
-                    minor_radius=0.1,
-                    major_segments=16,
-                    minor_segments=8,
-                    align='WORLD',
-                    location=(scanner_x, scanner_y, room_z + 1.5)
-                )
-                scanner_arch = bpy.context.active_object
-                scanner_arch.name = f"MilitechArmory_Scanner_Arch_{i}"
-
-                # Scale scanner arch
-                scanner_arch.scale.x = 0.5
-                scanner_arch.scale.y = 0.5
-                scanner_arch.scale.z = 1.5
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create scanner material
-                scanner_material = bpy.data.materials.new(name=f"MilitechArmory_ScannerMaterial_{i}")
-                scanner_material.use_nodes = True
-                nodes = scanner_material.node_tree.nodes
-                links = scanner_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-                principled.inputs['Metallic'].default_value = 0.8
-                principled.inputs['Roughness'].default_value = 0.2
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                scanner_arch.data.materials.append(scanner_material)
-
-                room_objects.append(scanner_arch)
-
-            # Create security guards
-            for i in range(2):
-                guard_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.6
-                guard_y = room_y - room_size[1] * 0.3
-
-                # Create guard body
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(guard_x, guard_y, room_z + 1.0)
-                )
-                guard = bpy.context.active_object
-                guard.name = f"MilitechArmory_Guard_{i}"
-
-                # Scale guard
-                guard.scale.x = 0.4
-                guard.scale.y = 0.4
-                guard.scale.z = 1.0
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create guard material
-                guard_material = bpy.data.materials.new(name=f"MilitechArmory_GuardMaterial_{i}")
-                guard_material.use_nodes = True
-                nodes = guard_material.node_tree.nodes
-                links = guard_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black
-                principled.inputs['Roughness'].default_value = 0.7
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                guard.data.materials.append(guard_material)
-
-                room_objects.append(guard)
-
-                # Create guard head
-                bpy.ops.mesh.primitive_uv_sphere_add(
-                    radius=0.2,
-                    align='WORLD',
-                    location=(guard_x, guard_y, room_z + 1.8)
-                )
-                head = bpy.context.active_object
-                head.name = f"MilitechArmory_Guard_Head_{i}"
-
-                # Assign material
-                head.data.materials.append(guard_material)
-
-                room_objects.append(head)
-
-            # Create security cameras
-            for i in range(4):
-                angle = i * (math.pi / 2)
-                camera_x = room_x + room_size[0] * 0.45 * math.cos(angle)
-                camera_y = room_y + room_size[1] * 0.45 * math.sin(angle)
-
-                # Create camera base
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=8,
-                    radius=0.1,
-                    depth=0.2,
-                    align='WORLD',
-                    location=(camera_x, camera_y, room_z + room_size[2] - 0.1)
-                )
-                camera_base = bpy.context.active_object
-                camera_base.name = f"MilitechArmory_Camera_Base_{i}"
-
-                # Assign material
-                camera_base.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(camera_base)
-
-                # Create camera body
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=8,
-                    radius=0.05,
-                    depth=0.3,
-                    align='WORLD',
-                    location=(camera_x, camera_y, room_z + room_size[2] - 0.25)
-                )
-                camera_body = bpy.context.active_object
-                camera_body.name = f"MilitechArmory_Camera_Body_{i}"
-
-                # Rotate camera to point toward center
-                direction = Vector((room_x, room_y, 0)) - Vector((camera_x, camera_y, 0))
-                rot_angle = math.atan2(direction.y, direction.x)
-                camera_body.rotation_euler.z = rot_angle
-                camera_body.rotation_euler.x = math.radians(45)
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Assign material
-                camera_body.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(camera_body)
-
-                # Create camera lens
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=16,
-                    radius=0.03,
-                    depth=0.05,
-                    align='WORLD',
-                    location=(camera_x + 0.15 * math.cos(rot_angle),
-                              camera_y + 0.15 * math.sin(rot_angle),
-                              room_z + room_size[2] - 0.35)
-                )
-                camera_lens = bpy.context.active_object
-                camera_lens.name = f"MilitechArmory_Camera_Lens_{i}"
-
-                # Rotate lens to match body
-                camera_lens.rotation_euler.z = rot_angle
-                camera_lens.rotation_euler.x = math.radians(45)
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Create lens material
-                lens_material = bpy.data.materials.new(name=f"MilitechArmory_LensMaterial_{i}")
-                lens_material.use_nodes = True
-                nodes = lens_material.node_tree.nodes
-                links = lens_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.0, 0.0, 0.0, 1.0)  # Black
-                principled.inputs['Metallic'].default_value = 0.0
-                principled.inputs['Roughness'].default_value = 0.0
-                principled.inputs['IOR'].default_value = 2.0
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                camera_lens.data.materials.append(lens_material)
-
-                room_objects.append(camera_lens)
-
-            # Create waiting area
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x + room_size[0] * 0.3, room_y + room_size[1] * 0.3, room_z + 0.3)
-            )
-            waiting_area = bpy.context.active_object
-            waiting_area.name = "MilitechArmory_Waiting_Area"
-
-            # Scale waiting area
-            waiting_area.scale.x = room_size[0] * 0.2
-            waiting_area.scale.y = room_size[1] * 0.2
-            waiting_area.scale.z = 0.3
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            waiting_area.data.materials.append(interior_materials["Militech_Interior"])
-
-            room_objects.append(waiting_area)
-
-            # Create chairs in waiting area
-            for i in range(4):
-                chair_x = room_x + room_size[0] * (0.25 + (i % 2) * 0.1)
-                chair_y = room_y + room_size[1] * (0.25 + (i // 2) * 0.1)
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(chair_x, chair_y, room_z + 0.5)
-                )
-                chair = bpy.context.active_object
-                chair.name = f"MilitechArmory_Waiting_Chair_{i}"
-
-                # Scale chair
-                chair.scale.x = 0.3
-                chair.scale.y = 0.3
-                chair.scale.z = 0.3
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Assign material
-                chair.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(chair)
-
-        elif room_name == "Showroom":
-            # Create central display platform
-            bpy.ops.mesh.primitive_cylinder_add(
-                vertices=32,
-                radius=room_size[0] * 0.2,
-                depth=0.5,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.25)
-            )
-            platform = bpy.context.active_object
-            platform.name = "MilitechArmory_Display_Platform"
-
-            # Create platform material
-            platform_material = bpy.data.materials.new(name="MilitechArmory_PlatformMaterial")
-            platform_material.use_nodes = True
-            nodes = platform_material.node_tree.nodes
-            links = platform_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-            principled.inputs['Metallic'].default_value = 0.8
-            principled.inputs['Roughness'].default_value = 0.2
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            platform.data.materials.append(platform_material)
-
-            room_objects.append(platform)
-
-            # Create featured weapon on platform
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 1.0)
-            )
-            featured_weapon = bpy.context.active_object
-            featured_weapon.name = "MilitechArmory_Featured_Weapon"
-
-            # Scale weapon
-            featured_weapon.scale.x = 1.5
-            featured_weapon.scale.y = 0.3
-            featured_weapon.scale.z = 0.3
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create weapon material
-            weapon_material = bpy.data.materials.new(name="MilitechArmory_WeaponMaterial")
-            weapon_material.use_nodes = True
-            nodes = weapon_material.node_tree.nodes
-            links = weapon_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black
-            principled.inputs['Metallic'].default_value = 0.9
-            principled.inputs['Roughness'].default_value = 0.1
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            featured_weapon.data.materials.append(weapon_material)
-
-            room_objects.append(featured_weapon)
-
-            # Create weapon details
-            bpy.ops.mesh.primitive_cylinder_add(
-                vertices=16,
-                radius=0.1,
-                depth=1.0,
-                align='WORLD',
-                location=(room_x - 0.5, room_y, room_z + 1.0)
-            )
-            weapon_barrel = bpy.context.active_object
-            weapon_barrel.name = "MilitechArmory_Weapon_Barrel"
-
-            # Rotate barrel
-            weapon_barrel.rotation_euler.x = math.radians(90)
-
-            # Apply rotation
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-            # Assign material
-            weapon_barrel.data.materials.append(weapon_material)
-
-            room_objects.append(weapon_barrel)
-
-            # Create weapon display cases around the room
-            case_count = 8
-            for i in range(case_count):
-                angle = i * (2 * math.pi / case_count)
-                case_x = room_x + room_size[0] * 0.4 * math.cos(angle)
-                case_y = room_y + room_size[1] * 0.4 * math.sin(angle)
-
-                # Create display case
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(case_x, case_y, room_z + 0.5)
-                )
-                case = bpy.context.active_object
-                case.name = f"MilitechArmory_Display_Case_{i}"
-
-                # Scale case
-                case.scale.x = 0.8
-                case.scale.y = 0.8
-                case.scale.z = 1.0
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create case material
-                case_material = bpy.data.materials.new(name=f"MilitechArmory_CaseMaterial_{i}")
-                case_material.use_nodes = True
-                nodes = case_material.node_tree.nodes
-                links = case_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.3, 0.3, 0.3, 1.0)  # Gray
-                principled.inputs['Metallic'].default_value = 0.8
-                principled.inputs['Roughness'].default_value = 0.2
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                case.data.materials.append(case_material)
-
-                room_objects.append(case)
-
-                # Create weapon in case
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(case_x, case_y, room_z + 1.0)
-                )
-                weapon = bpy.context.active_object
-                weapon.name = f"MilitechArmory_Weapon_{i}"
-
-                # Scale weapon
-                weapon.scale.x = 0.7
-                weapon.scale.y = 0.2
-                weapon.scale.z = 0.2
-
-                # Rotate weapon to face center
-                direction = Vector((room_x, room_y, 0)) - Vector((case_x, case_y, 0))
-                rot_angle = math.atan2(direction.y, direction.x)
-                weapon.rotation_euler.z = rot_angle
-
-                # Apply transformations
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-                # Assign material
-                weapon.data.materials.append(weapon_material)
-
-                room_objects.append(weapon)
-
-            # Create holographic displays
-            for i in range(4):
-                holo_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.2
-                holo_y = room_y - room_size[1] * 0.4
-
-                bpy.ops.mesh.primitive_plane_add(
-                    size=1.0,
-                    align='WORLD',
-                    location=(holo_x, holo_y, room_z + 1.5)
-                )
-                holo = bpy.context.active_object
-                holo.name = f"MilitechArmory_Holographic_Display_{i}"
-
-                # Scale hologram
-                holo.scale.x = 0.5
-                holo.scale.y = 1.0
-
-                # Rotate hologram to be vertical
-                holo.rotation_euler.x = math.radians(90)
-
-                # Apply transformations
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-                # Create hologram material
-                holo_material = bpy.data.materials.new(name=f"MilitechArmory_HoloMaterial_{i}")
-                holo_material.use_nodes = True
-                nodes = holo_material.node_tree.nodes
-                links = holo_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                emission = nodes.new(type='ShaderNodeEmission')
-
-                # Set properties
-                emission.inputs['Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-                emission.inputs['Strength'].default_value = 1.0
-
-                # Connect nodes
-                links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-                # Assign material
-                holo.data.materials.append(holo_material)
-
-                room_objects.append(holo)
-
-        elif room_name == "Testing_Range":
-            # Create shooting lanes
-            lane_count = 5
-            for i in range(lane_count):
-                lane_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.15
-                lane_y = room_y
-
-                # Create lane divider
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(lane_x, lane_y, room_z + room_size[2]/2)
-                )
-                divider = bpy.context.active_object
-                divider.name = f"MilitechArmory_Lane_Divider_{i}"
-
-                # Scale divider
-                divider.scale.x = 0.1
-                divider.scale.y = room_size[1] * 0.8
-                divider.scale.z = room_size[2] * 0.8
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Assign material
-                divider.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(divider)
-
-                # Create shooting position
-                if i < lane_count - 1:
-                    position_x = lane_x + room_size[0] * 0.075
-                    position_y = room_y - room_size[1] * 0.35
-
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(position_x, position_y, room_z + 0.5)
-                    )
-                    position = bpy.context.active_object
-                    position.name = f"MilitechArmory_Shooting_Position_{i}"
-
-                    # Scale position
-                    position.scale.x = room_size[0] * 0.07
-                    position.scale.y = room_size[1] * 0.05
-                    position.scale.z = 0.5
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    position.data.materials.append(interior_materials["Militech_Interior"])
-
-                    room_objects.append(position)
-
-                    # Create weapon rest
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(position_x, position_y - 0.3, room_z + 1.0)
-                    )
-                    rest = bpy.context.active_object
-                    rest.name = f"MilitechArmory_Weapon_Rest_{i}"
-
-                    # Scale rest
-                    rest.scale.x = room_size[0] * 0.05
-                    rest.scale.y = room_size[1] * 0.02
-                    rest.scale.z = 0.1
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    rest.data.materials.append(interior_materials["Militech_Interior"])
-
-                    room_objects.append(rest)
-
-                    # Create test weapon
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(position_x, position_y - 0.3, room_z + 1.1)
-                    )
-                    weapon = bpy.context.active_object
-                    weapon.name = f"MilitechArmory_Test_Weapon_{i}"
-
-                    # Scale weapon
-                    weapon.scale.x = 0.7
-                    weapon.scale.y = 0.2
-                    weapon.scale.z = 0.1
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Create weapon material
-                    weapon_material = bpy.data.materials.new(name=f"MilitechArmory_TestWeaponMaterial_{i}")
-                    weapon_material.use_nodes = True
-                    nodes = weapon_material.node_tree.nodes
-                    links = weapon_material.node_tree.links
-
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                    # Set properties
-                    principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black
-                    principled.inputs['Metallic'].default_value = 0.9
-                    principled.inputs['Roughness'].default_value = 0.1
-
-                    # Connect nodes
-                    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                    # Assign material
-                    weapon.data.materials.append(weapon_material)
-
-                    room_objects.append(weapon)
-
-            # Create targets at the end of the range
-            for i in range(lane_count - 1):
-                target_x = room_x - room_size[0] * 0.225 + i * room_size[0] * 0.15
-                target_y = room_y + room_size[1] * 0.35
-
-                # Create target base
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(target_x, target_y, room_z + 0.5)
-                )
-                target_base = bpy.context.active_object
-                target_base.name = f"MilitechArmory_Target_Base_{i}"
-
-                # Scale target base
-                target_base.scale.x = 0.1
-                target_base.scale.y = 0.1
-                target_base.scale.z = 1.0
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Assign material
-                target_base.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(target_base)
-
-                # Create target
-                bpy.ops.mesh.primitive_circle_add(
-                    vertices=32,
-                    radius=0.5,
-                    fill_type='NGON',
-                    align='WORLD',
-                    location=(target_x, target_y, room_z + 1.5)
-                )
-                target = bpy.context.active_object
-                target.name = f"MilitechArmory_Target_{i}"
-
-                # Create target material
-                target_material = bpy.data.materials.new(name=f"MilitechArmory_TargetMaterial_{i}")
-                target_material.use_nodes = True
-                nodes = target_material.node_tree.nodes
-                links = target_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                target.data.materials.append(target_material)
-
-                room_objects.append(target)
-
-                # Create target rings
-                for j in range(3):
-                    ring_radius = 0.4 - j * 0.1
-
-                    bpy.ops.mesh.primitive_circle_add(
-                        vertices=32,
-                        radius=ring_radius,
-                        fill_type='NGON',
-                        align='WORLD',
-                        location=(target_x, target_y, room_z + 1.51)
-                    )
-                    ring = bpy.context.active_object
-                    ring.name = f"MilitechArmory_Target_Ring_{i}_{j}"
-
-                    # Create ring material
-                    ring_material = bpy.data.materials.new(name=f"MilitechArmory_RingMaterial_{i}_{j}")
-                    ring_material.use_nodes = True
-                    nodes = ring_material.node_tree.nodes
-                    links = ring_material.node_tree.links
-
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                    # Set properties
-                    if j % 2 == 0:
-                        principled.inputs['Base Color'].default_value = (0.0, 0.0, 0.0, 1.0)  # Black
-                    else:
-                        principled.inputs['Base Color'].default_value = (1.0, 1.0, 1.0, 1.0)  # White
-                    principled.inputs['Roughness'].default_value = 0.9
-
-                    # Connect nodes
-                    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                    # Assign material
-                    ring.data.materials.append(ring_material)
-
-                    room_objects.append(ring)
-
-            # Create control room
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y - room_size[1] * 0.45, room_z + room_size[2]/2)
-            )
-            control_room = bpy.context.active_object
-            control_room.name = "MilitechArmory_Control_Room"
-
-            # Scale control room
-            control_room.scale.x = room_size[0] * 0.3
-            control_room.scale.y = room_size[1] * 0.05
-            control_room.scale.z = room_size[2] * 0.8
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            control_room.data.materials.append(interior_materials["Militech_Interior"])
-
-            room_objects.append(control_room)
-
-            # Create control room window
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y - room_size[1] * 0.4, room_z + room_size[2]/2)
-            )
-            window = bpy.context.active_object
-            window.name = "MilitechArmory_Control_Window"
-
-            # Scale window
-            window.scale.x = room_size[0] * 0.28
-            window.scale.y = 0.05
-            window.scale.z = room_size[2] * 0.4
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create window material
-            window_material = bpy.data.materials.new(name="MilitechArmory_WindowMaterial")
-            window_material.use_nodes = True
-            nodes = window_material.node_tree.nodes
-            links = window_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 0.2)  # Red tint
-            principled.inputs['Metallic'].default_value = 0.0
-            principled.inputs['Roughness'].default_value = 0.0
-            principled.inputs['IOR'].default_value = 1.45
-            principled.inputs['Transmission Weight'].default_value = 0.9  # Updated for Blender 4.2
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            window.data.materials.append(window_material)
-
-            room_objects.append(window)
-
-        elif room_name == "RD_Lab":
-            # Create central workbench
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.5)
-            )
-            workbench = bpy.context.active_object
-            workbench.name = "MilitechArmory_RD_Workbench"
-
-            # Scale workbench
-            workbench.scale.x = room_size[0] * 0.7
-            workbench.scale.y = room_size[1] * 0.4
-            workbench.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Assign material
-            workbench.data.materials.append(interior_materials["Militech_Interior"])
-
-            room_objects.append(workbench)
-
-            # Create prototype weapons on workbench
-            for i in range(3):
-                prototype_x = room_x - room_size[0] * 0.2 + i * room_size[0] * 0.2
-                prototype_y = room_y
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(prototype_x, prototype_y, room_z + 1.0)
-                )
-                prototype = bpy.context.active_object
-                prototype.name = f"MilitechArmory_Prototype_{i}"
-
-                # Scale prototype
-                prototype.scale.x = 0.8
-                prototype.scale.y = 0.3
-                prototype.scale.z = 0.2
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create prototype material
-                prototype_material = bpy.data.materials.new(name=f"MilitechArmory_PrototypeMaterial_{i}")
-                prototype_material.use_nodes = True
-                nodes = prototype_material.node_tree.nodes
-                links = prototype_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.7, 0.7, 0.7, 1.0)  # Light gray
-                principled.inputs['Metallic'].default_value = 0.9
-                principled.inputs['Roughness'].default_value = 0.1
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                prototype.data.materials.append(prototype_material)
-
-                room_objects.append(prototype)
-
-                # Create prototype parts
-                parts_count = random.randint(3, 5)
-                for j in range(parts_count):
-                    part_x = prototype_x + random.uniform(-0.4, 0.4)
-                    part_y = prototype_y + random.uniform(-0.2, 0.2)
-
-                    # Randomize part shape
-                    if random.random() > 0.5:
-                        bpy.ops.mesh.primitive_cube_add(
-                            size=random.uniform(0.1, 0.2),
-                            align='WORLD',
-                            location=(part_x, part_y, room_z + 1.1)
-                        )
-                    else:
-                        bpy.ops.mesh.primitive_cylinder_add(
-                            vertices=8,
-                            radius=random.uniform(0.05, 0.1),
-                            depth=random.uniform(0.1, 0.3),
-                            align='WORLD',
-                            location=(part_x, part_y, room_z + 1.1)
-                        )
-
-                    part = bpy.context.active_object
-                    part.name = f"MilitechArmory_Prototype_Part_{i}_{j}"
-
-                    # Assign material
-                    part.data.materials.append(prototype_material)
-
-                    room_objects.append(part)
-
-            # Create equipment around the lab
-            equipment_types = ["3D_Printer", "Scanner", "Computer", "Testing_Rig"]
-            for i, eq_type in enumerate(equipment_types):
-                if i < 2:
-                    eq_x = room_x - room_size[0] * 0.3
-                    eq_y = room_y - room_size[1] * 0.3 + i * room_size[1] * 0.6
-                else:
-                    eq_x = room_x + room_size[0] * 0.3
-                    eq_y = room_y - room_size[1] * 0.3 + (i-2) * room_size[1] * 0.6
-
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(eq_x, eq_y, room_z + 0.5)
-                )
-                equipment = bpy.context.active_object
-                equipment.name = f"MilitechArmory_{eq_type}"
-
-                # Scale equipment
-                equipment.scale.x = 0.8
-                equipment.scale.y = 0.8
-                equipment.scale.z = 1.0
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create equipment material
-                equipment_material = bpy.data.materials.new(name=f"MilitechArmory_{eq_type}Material")
-                equipment_material.use_nodes = True
-                nodes = equipment_material.node_tree.nodes
-                links = equipment_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.3, 0.3, 0.3, 1.0)  # Gray
-                principled.inputs['Metallic'].default_value = 0.8
-                principled.inputs['Roughness'].default_value = 0.2
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                equipment.data.materials.append(equipment_material)
-
-                room_objects.append(equipment)
-
-                # Create equipment details
-                if eq_type == "3D_Printer":
-                    # Create printer head
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(eq_x, eq_y, room_z + 1.0)
-                    )
-                    printer_head = bpy.context.active_object
-                    printer_head.name = "MilitechArmory_Printer_Head"
-
-                    # Scale printer head
-                    printer_head.scale.x = 0.2
-                    printer_head.scale.y = 0.2
-                    printer_head.scale.z = 0.2
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    printer_head.data.materials.append(equipment_material)
-
-                    room_objects.append(printer_head)
-
-                    # Create printing platform
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(eq_x, eq_y, room_z + 0.7)
-                    )
-                    platform = bpy.context.active_object
-                    platform.name = "MilitechArmory_Printing_Platform"
-
-                    # Scale platform
-                    platform.scale.x = 0.6
-                    platform.scale.y = 0.6
-                    platform.scale.z = 0.1
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    platform.data.materials.append(equipment_material)
-
-                    room_objects.append(platform)
-
-                elif eq_type == "Scanner":
-                    # Create scanner arm
-                    bpy.ops.mesh.primitive_cylinder_add(
-                        vertices=8,
-                        radius=0.1,
-                        depth=1.0,
-                        align='WORLD',
-                        location=(eq_x, eq_y, room_z + 1.0)
-                    )
-                    scanner_arm = bpy.context.active_object
-                    scanner_arm.name = "MilitechArmory_Scanner_Arm"
-
-                    # Rotate arm
-                    scanner_arm.rotation_euler.x = math.radians(90)
-
-                    # Apply rotation
-                    bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                    # Assign material
-                    scanner_arm.data.materials.append(equipment_material)
-
-                    room_objects.append(scanner_arm)
-
-                    # Create scanner head
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(eq_x, eq_y + 0.5, room_z + 1.0)
-                    )
-                    scanner_head = bpy.context.active_object
-                    scanner_head.name = "MilitechArmory_Scanner_Head"
-
-                    # Scale scanner head
-                    scanner_head.scale.x = 0.3
-                    scanner_head.scale.y = 0.1
-                    scanner_head.scale.z = 0.2
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    scanner_head.data.materials.append(equipment_material)
-
-                    room_objects.append(scanner_head)
-
-                elif eq_type == "Computer":
-                    # Create monitor
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(eq_x, eq_y, room_z + 1.0)
-                    )
-                    monitor = bpy.context.active_object
-                    monitor.name = "MilitechArmory_Computer_Monitor"
-
-                    # Scale monitor
-                    monitor.scale.x = 0.6
-                    monitor.scale.y = 0.1
-                    monitor.scale.z = 0.4
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Create monitor screen material
-                    screen_material = bpy.data.materials.new(name="MilitechArmory_ScreenMaterial")
-                    screen_material.use_nodes = True
-                    nodes = screen_material.node_tree.nodes
-                    links = screen_material.node_tree.links
-
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    emission = nodes.new(type='ShaderNodeEmission')
-
-                    # Set properties
-                    emission.inputs['Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-                    emission.inputs['Strength'].default_value = 1.0
-
-                    # Connect nodes
-                    links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-                    # Assign material
-                    monitor.data.materials.append(screen_material)
-
-                    room_objects.append(monitor)
-
-                    # Create keyboard
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(eq_x, eq_y + 0.3, room_z + 0.6)
-                    )
-                    keyboard = bpy.context.active_object
-                    keyboard.name = "MilitechArmory_Computer_Keyboard"
-
-                    # Scale keyboard
-                    keyboard.scale.x = 0.4
-                    keyboard.scale.y = 0.2
-                    keyboard.scale.z = 0.05
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    keyboard.data.materials.append(equipment_material)
-
-                    room_objects.append(keyboard)
-
-                elif eq_type == "Testing_Rig":
-                    # Create testing platform
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(eq_x, eq_y, room_z + 0.7)
-                    )
-                    test_platform = bpy.context.active_object
-                    test_platform.name = "MilitechArmory_Testing_Platform"
-
-                    # Scale platform
-                    test_platform.scale.x = 0.6
-                    test_platform.scale.y = 0.6
-                    test_platform.scale.z = 0.1
-
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                    # Assign material
-                    test_platform.data.materials.append(equipment_material)
-
-                    room_objects.append(test_platform)
-
-                    # Create testing arms
-                    for j in range(2):
-                        arm_x = eq_x
-                        arm_y = eq_y - 0.3 + j * 0.6
-
-                        bpy.ops.mesh.primitive_cylinder_add(
-                            vertices=8,
-                            radius=0.05,
-                            depth=0.8,
-                            align='WORLD',
-                            location=(arm_x, arm_y, room_z + 1.1)
-                        )
-                        arm = bpy.context.active_object
-                        arm.name = f"MilitechArmory_Testing_Arm_{j}"
-
-                        # Assign material
-                        arm.data.materials.append(equipment_material)
-
-                        room_objects.append(arm)
-
-                        # Create arm tool
-                        bpy.ops.mesh.primitive_cube_add(
-                            size=1.0,
-                            enter_editmode=False,
-                            align='WORLD',
-                            location=(arm_x, arm_y, room_z + 0.8)
-                        )
-                        tool = bpy.context.active_object
-                        tool.name = f"MilitechArmory_Testing_Tool_{j}"
-
-                        # Scale tool
-                        tool.scale.x = 0.1
-                        tool.scale.y = 0.1
-                        tool.scale.z = 0.1
-
-                        # Apply scale
-                        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                        # Assign material
-                        tool.data.materials.append(equipment_material)
-
-                        room_objects.append(tool)
-
-            # Create scientists
-            for i in range(2):
-                scientist_x = room_x - room_size[0] * 0.2 + i * room_size[0] * 0.4
-                scientist_y = room_y - room_size[1] * 0.1
-
-                # Create scientist body
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(scientist_x, scientist_y, room_z + 1.0)
-                )
-                scientist = bpy.context.active_object
-                scientist.name = f"MilitechArmory_Scientist_{i}"
-
-                # Scale scientist
-                scientist.scale.x = 0.3
-                scientist.scale.y = 0.3
-                scientist.scale.z = 0.8
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Create scientist material
-                scientist_material = bpy.data.materials.new(name=f"MilitechArmory_ScientistMaterial_{i}")
-                scientist_material.use_nodes = True
-                nodes = scientist_material.node_tree.nodes
-                links = scientist_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (1.0, 1.0, 1.0, 1.0)  # White lab coat
-                principled.inputs['Roughness'].default_value = 0.9
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                scientist.data.materials.append(scientist_material)
-
-                room_objects.append(scientist)
-
-                # Create scientist head
-                bpy.ops.mesh.primitive_uv_sphere_add(
-                    radius=0.15,
-                    align='WORLD',
-                    location=(scientist_x, scientist_y, room_z + 1.8)
-                )
-                head = bpy.context.active_object
-                head.name = f"MilitechArmory_Scientist_Head_{i}"
-
-                # Create head material
-                head_material = bpy.data.materials.new(name=f"MilitechArmory_HeadMaterial_{i}")
-                head_material.use_nodes = True
-                nodes = head_material.node_tree.nodes
-                links = head_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.8, 0.6, 0.5, 1.0)  # Skin tone
-                principled.inputs['Roughness'].default_value = 0.7
-
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                # Assign material
-                head.data.materials.append(head_material)
-
-                room_objects.append(head)
-
-        elif room_name == "Secure_Vault":
-            # Create central weapon storage
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 1.0)
-            )
-            storage = bpy.context.active_object
-            storage.name = "MilitechArmory_Secure_Storage"
-
-            # Scale storage
-            storage.scale.x = room_size[0] * 0.6
-            storage.scale.y = room_size[1] * 0.6
-            storage.scale.z = 2.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create storage material
-            storage_material = bpy.data.materials.new(name="MilitechArmory_StorageMaterial")
-            storage_material.use_nodes = True
-            nodes = storage_material.node_tree.nodes
-            links = storage_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.2, 0.2, 0.2, 1.0)  # Dark gray
-            principled.inputs['Metallic'].default_value = 0.9
-            principled.inputs['Roughness'].default_value = 0.1
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            storage.data.materials.append(storage_material)
-
-            room_objects.append(storage)
-
-            # Create weapon racks
-            for i in range(4):
-                # Calculate rack position
-                if i == 0:  # Front
-                    rack_x = room_x
-                    rack_y = room_y - room_size[1] * 0.3
-                    rack_rot_z = 0
-                elif i == 1:  # Right
-                    rack_x = room_x + room_size[0] * 0.3
-                    rack_y = room_y
-                    rack_rot_z = math.radians(90)
-                elif i == 2:  # Back
-                    rack_x = room_x
-                    rack_y = room_y + room_size[1] * 0.3
-                    rack_rot_z = 0
-                else:  # Left
-                    rack_x = room_x - room_size[0] * 0.3
-                    rack_y = room_y
-                    rack_rot_z = math.radians(90)
-
-                # Create rack
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(rack_x, rack_y, room_z + 1.0)
-                )
-                rack = bpy.context.active_object
-                rack.name = f"MilitechArmory_Weapon_Rack_{i}"
-
-                # Scale rack
-                rack.scale.x = room_size[0] * 0.5
-                rack.scale.y = 0.1
-                rack.scale.z = 1.8
-
-                # Rotate rack
-                rack.rotation_euler.z = rack_rot_z
-
-                # Apply transformations
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-                # Assign material
-                rack.data.materials.append(storage_material)
-
-                room_objects.append(rack)
-
-                # Create weapons on rack
-                weapon_count = 5
-                for j in range(weapon_count):
-                    # Calculate weapon position
-                    if i == 0 or i == 2:  # Front or back
-                        weapon_x = rack_x - room_size[0] * 0.2 + j * room_size[0] * 0.1
-                        weapon_y = rack_y
-                        weapon_rot_z = 0
-                    else:  # Left or right
-                        weapon_x = rack_x
-                        weapon_y = rack_y - room_size[1] * 0.2 + j * room_size[1] * 0.1
-                        weapon_rot_z = math.radians(90)
-
-                    # Create weapon
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(weapon_x, weapon_y, room_z + 0.5 + j * 0.3)
-                    )
-                    weapon = bpy.context.active_object
-                    weapon.name = f"MilitechArmory_Stored_Weapon_{i}_{j}"
-
-                    # Scale weapon
-                    weapon.scale.x = 0.8
-                    weapon.scale.y = 0.2
-                    weapon.scale.z = 0.2
-
-                    # Rotate weapon
-                    weapon.rotation_euler.z = weapon_rot_z
-
-                    # Apply transformations
-                    bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-                    # Create weapon material
-                    weapon_material = bpy.data.materials.new(name=f"MilitechArmory_StoredWeaponMaterial_{i}_{j}")
-                    weapon_material.use_nodes = True
-                    nodes = weapon_material.node_tree.nodes
-                    links = weapon_material.node_tree.links
-
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-                    # Set properties
-                    principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black
-                    principled.inputs['Metallic'].default_value = 0.9
-                    principled.inputs['Roughness'].default_value = 0.1
-
-                    # Connect nodes
-                    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-                    # Assign material
-                    weapon.data.materials.append(weapon_material)
-
-                    room_objects.append(weapon)
-
-            # Create security scanners
-            for i in range(2):
-                scanner_x = room_x - room_size[0] * 0.2 + i * room_size[0] * 0.4
-                scanner_y = room_y - room_size[1] * 0.4
-
-                # Create scanner base
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=16,
-                    radius=0.2,
-                    depth=0.1,
-                    align='WORLD',
-                    location=(scanner_x, scanner_y, room_z + 0.05)
-                )
-                scanner_base = bpy.context.active_object
-                scanner_base.name = f"MilitechArmory_Vault_Scanner_{i}"
-
-                # Assign material
-                scanner_base.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(scanner_base)
-
-                # Create scanner beam
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=16,
-                    radius=0.05,
-                    depth=3.0,
-                    align='WORLD',
-                    location=(scanner_x, scanner_y, room_z + 1.5)
-                )
-                scanner_beam = bpy.context.active_object
-                scanner_beam.name = f"MilitechArmory_Vault_Scanner_Beam_{i}"
-
-                # Create beam material
-                beam_material = bpy.data.materials.new(name=f"MilitechArmory_BeamMaterial_{i}")
-                beam_material.use_nodes = True
-                nodes = beam_material.node_tree.nodes
-                links = beam_material.node_tree.links
-
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
-
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                emission = nodes.new(type='ShaderNodeEmission')
-
-                # Set properties
-                emission.inputs['Color'].default_value = (0.8, 0.1, 0.1, 0.5)  # Red
-                emission.inputs['Strength'].default_value = 1.0
-
-                # Connect nodes
-                links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-                # Assign material
-                scanner_beam.data.materials.append(beam_material)
-
-                room_objects.append(scanner_beam)
-
-            # Create security turrets
-            for i in range(4):
-                angle = i * (math.pi / 2) + math.pi / 4
-                turret_x = room_x + room_size[0] * 0.4 * math.cos(angle)
-                turret_y = room_y + room_size[1] * 0.4 * math.sin(angle)
-
-                # Create turret base
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=16,
-                    radius=0.2,
-                    depth=0.2,
-                    align='WORLD',
-                    location=(turret_x, turret_y, room_z + room_size[2] - 0.1)
-                )
-                turret_base = bpy.context.active_object
-                turret_base.name = f"MilitechArmory_Security_Turret_Base_{i}"
-
-                # Assign material
-                turret_base.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(turret_base)
-
-                # Create turret body
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(turret_x, turret_y, room_z + room_size[2] - 0.3)
-                )
-                turret_body = bpy.context.active_object
-                turret_body.name = f"MilitechArmory_Security_Turret_Body_{i}"
-
-                # Scale turret body
-                turret_body.scale.x = 0.3
-                turret_body.scale.y = 0.3
-                turret_body.scale.z = 0.2
-
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-                # Assign material
-                turret_body.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(turret_body)
-
-                # Create turret barrel
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=8,
-                    radius=0.05,
-                    depth=0.4,
-                    align='WORLD',
-                    location=(turret_x, turret_y, room_z + room_size[2] - 0.3)
-                )
-                turret_barrel = bpy.context.active_object
-                turret_barrel.name = f"MilitechArmory_Security_Turret_Barrel_{i}"
-
-                # Rotate barrel to point toward center
-                direction = Vector((room_x, room_y, 0)) - Vector((turret_x, turret_y, 0))
-                rot_angle = math.atan2(direction.y, direction.x)
-                turret_barrel.rotation_euler.z = rot_angle
-                turret_barrel.rotation_euler.x = math.radians(90)
-
-                # Apply rotation
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-
-                # Assign material
-                turret_barrel.data.materials.append(interior_materials["Militech_Interior"])
-
-                room_objects.append(turret_barrel)
-
-        elif room_name == "Executive_Office":
-            # Create executive desk
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y, room_z + 0.5)
-            )
-            desk = bpy.context.active_object
-            desk.name = "MilitechArmory_Executive_Desk"
-
-            # Scale desk
-            desk.scale.x = room_size[0] * 0.4
-            desk.scale.y = room_size[1] * 0.2
-            desk.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create desk material
-            desk_material = bpy.data.materials.new(name="MilitechArmory_DeskMaterial")
-            desk_material.use_nodes = True
-            nodes = desk_material.node_tree.nodes
-            links = desk_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.05, 0.05, 0.05, 1.0)  # Very dark gray
-            principled.inputs['Metallic'].default_value = 0.9
-            principled.inputs['Roughness'].default_value = 0.1
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            desk.data.materials.append(desk_material)
-
-            room_objects.append(desk)
-
-            # Create executive chair
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y + room_size[1] * 0.1, room_z + 0.5)
-            )
-            chair = bpy.context.active_object
-            chair.name = "MilitechArmory_Executive_Chair"
-
-            # Scale chair
-            chair.scale.x = 0.6
-            chair.scale.y = 0.6
-            chair.scale.z = 1.0
-
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-            # Create chair material
-            chair_material = bpy.data.materials.new(name="MilitechArmory_ChairMaterial")
-            chair_material.use_nodes = True
-            nodes = chair_material.node_tree.nodes
-            links = chair_material.node_tree.links
-
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
-
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
-
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-            principled.inputs['Roughness'].default_value = 0.8
-
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
-            # Assign material
-            chair.data.materials.append(chair_material)
-
-            room_objects.append(chair)
-
-            # Create chair back
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y + room_size[1] * 0.15, room_z + 1.0)
-            )
-            chair_back = bpy.context.active_object
-            chair_back.name = "MilitechArmory_Chair_Back"
+    # Create room walls, offsetting all four wall centers from the room center at once
+    wall_xys = (np.array((room_x, room_y)) + _WALL_OFFSETS * room_size[:2]).tolist()
+    wall_z = room_z + room_size[2]/2
+    for wall_idx, (wall_x, wall_y) in enumerate(wall_xys):
+        create_mesh_object(f"MilitechArmory_{room_name}_Wall_{wall_idx}", wall_meshes[_WALL_LAYOUT[wall_idx][3]], (wall_x, wall_y, wall_z), collection=rooms_collection)
 
-            # Scale chair back
-            chair_back.scale.x = 0.6
-            chair_back.scale.y = 0.1
-            chair_back.scale.z = 1.0
 
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+def create_militech_security_lobby(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Militech security lobby with scanners, guards and cameras"""
+    # Look up the Militech interior material once
+    interior_material = interior_materials["Militech_Interior"]
 
-            # Assign material
-            chair_back.data.materials.append(chair_material)
+    # Create reception desk
+    desk = create_cube_object("MilitechArmory_Reception_Desk", (room_x, room_y - room_size[1] * 0.2, room_z + 0.5), scale=(room_size[0] * 0.4, room_size[1] * 0.1, 1.0), collection=rooms_collection)
 
-            room_objects.append(chair_back)
+    # Assign material
+    desk.data.materials.append(interior_material)
 
-            # Create computer on desk
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y - room_size[1] * 0.1, room_z + 1.0)
-            )
-            computer = bpy.context.active_object
-            computer.name = "MilitechArmory_Executive_Computer"
+    # Create shared scanner meshes
+    scanner_base_mesh = create_cube_mesh("MilitechArmory_Scanner_Base", (0.5, 0.5, 0.1))
+    scanner_base_mesh.materials.append(interior_material)
+    scanner_arch_mesh = create_torus_mesh("MilitechArmory_Scanner_Arch", major_radius=1.0, minor_radius=0.1,
+                                          major_segments=16, minor_segments=8)
+    transform_mesh(scanner_arch_mesh, scale=(0.5, 0.5, 1.5))
 
-            # Scale computer
-            computer.scale.x = 0.6
-            computer.scale.y = 0.1
-            computer.scale.z = 0.4
+    # Create scanner material
+    scanner_material = get_shared_material("MilitechArmory_ScannerMaterial", (0.8, 0.1, 0.1, 1.0), metallic=0.8, roughness=0.2)  # Red
 
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    # Assign material
+    scanner_arch_mesh.materials.append(scanner_material)
 
-            # Create computer screen material
-            screen_material = bpy.data.materials.new(name="MilitechArmory_ComputerScreenMaterial")
-            screen_material.use_nodes = True
-            nodes = screen_material.node_tree.nodes
-            links = screen_material.node_tree.links
+    # Create security scanners
+    for i in range(2):
+        scanner_x = room_x - room_size[0] * 0.15 + i * room_size[0] * 0.3
+        scanner_y = room_y
 
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
+        # Create scanner base
+        create_mesh_object(f"MilitechArmory_Scanner_Base_{i}", scanner_base_mesh, (scanner_x, scanner_y, room_z + 0.1), collection=rooms_collection)
 
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            emission = nodes.new(type='ShaderNodeEmission')
+        # Create scanner arch
+        create_mesh_object(f"MilitechArmory_Scanner_Arch_{i}", scanner_arch_mesh, (scanner_x, scanner_y, room_z + 1.5), collection=rooms_collection)
 
-            # Set properties
-            emission.inputs['Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-            emission.inputs['Strength'].default_value = 1.0
+    # Create shared guard meshes
+    guard_mesh = create_cube_mesh("MilitechArmory_Guard", (0.4, 0.4, 1.0))
+    head_mesh = create_uv_sphere_mesh("MilitechArmory_Guard_Head", radius=0.2)
 
-            # Connect nodes
-            links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    # Create guard material
+    guard_material = get_shared_material("MilitechArmory_GuardMaterial", (0.1, 0.1, 0.1, 1.0), roughness=0.7)  # Black
 
-            # Assign material
-            computer.data.materials.append(screen_material)
+    # Assign material
+    guard_mesh.materials.append(guard_material)
+    head_mesh.materials.append(guard_material)
 
-            room_objects.append(computer)
+    # Create security guards
+    for i in range(2):
+        guard_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.6
+        guard_y = room_y - room_size[1] * 0.3
 
-            # Create weapon display cases
-            for i in range(3):
-                case_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.3
-                case_y = room_y - room_size[1] * 0.4
+        # Create guard body
+        create_mesh_object(f"MilitechArmory_Guard_{i}", guard_mesh, (guard_x, guard_y, room_z + 1.0), collection=rooms_collection)
 
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(case_x, case_y, room_z + 0.5)
-                )
-                case = bpy.context.active_object
-                case.name = f"MilitechArmory_Trophy_Case_{i}"
+        # Create guard head
+        create_mesh_object(f"MilitechArmory_Guard_Head_{i}", head_mesh, (guard_x, guard_y, room_z + 1.8), collection=rooms_collection)
 
-                # Scale case
-                case.scale.x = 0.4
-                case.scale.y = 0.4
-                case.scale.z = 1.0
+    # Create shared camera meshes, tilted down once; each camera only turns about Z
+    camera_base_mesh = create_cylinder_mesh("MilitechArmory_Camera_Base", vertices=8, radius=0.1, depth=0.2)
+    camera_body_mesh = create_cylinder_mesh("MilitechArmory_Camera_Body", vertices=8, radius=0.05, depth=0.3)
+    camera_lens_mesh = create_cylinder_mesh("MilitechArmory_Camera_Lens", vertices=16, radius=0.03, depth=0.05)
+    transform_mesh(camera_body_mesh, rotation=(_RAD45, 0, 0))
+    transform_mesh(camera_lens_mesh, rotation=(_RAD45, 0, 0))
 
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    # Create lens material
+    lens_material = get_shared_material("MilitechArmory_LensMaterial", (0.0, 0.0, 0.0, 1.0), roughness=0.0, ior=2.0)  # Black
 
-                # Create case material
-                case_material = bpy.data.materials.new(name=f"MilitechArmory_TrophyCaseMaterial_{i}")
-                case_material.use_nodes = True
-                nodes = case_material.node_tree.nodes
-                links = case_material.node_tree.links
+    # Assign materials
+    camera_base_mesh.materials.append(interior_material)
+    camera_body_mesh.materials.append(interior_material)
+    camera_lens_mesh.materials.append(lens_material)
 
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
+    # Create security cameras
+    # The cameras sit on the room axes, so facing the center is simply the opposite angle
+    cos_a, sin_a = unit_circle(4)
+    camera_xs = room_x + room_size[0] * 0.45 * cos_a
+    camera_ys = room_y + room_size[1] * 0.45 * sin_a
+    lens_xs = (camera_xs - 0.15 * cos_a).tolist()
+    lens_ys = (camera_ys - 0.15 * sin_a).tolist()
+    camera_xs = camera_xs.tolist()
+    camera_ys = camera_ys.tolist()
+    camera_rots = (np.arange(4) * _RAD90 + _RAD180).tolist()
+    for i in range(4):
+        camera_x = camera_xs[i]
+        camera_y = camera_ys[i]
+        rot_angle = camera_rots[i]
+
+        # Create camera base
+        create_mesh_object(f"MilitechArmory_Camera_Base_{i}", camera_base_mesh, (camera_x, camera_y, room_z + room_size[2] - 0.1), collection=rooms_collection)
+
+        # Create camera body and rotate it to point toward center
+        create_mesh_object(f"MilitechArmory_Camera_Body_{i}", camera_body_mesh, (camera_x, camera_y, room_z + room_size[2] - 0.25), collection=rooms_collection, rotation_z=rot_angle)
+
+        # Create camera lens and rotate it to match body
+        create_mesh_object(f"MilitechArmory_Camera_Lens_{i}", camera_lens_mesh, (lens_xs[i], lens_ys[i], room_z + room_size[2] - 0.35), collection=rooms_collection, rotation_z=rot_angle)
+
+    # Create waiting area
+    waiting_area = create_cube_object("MilitechArmory_Waiting_Area", (room_x + room_size[0] * 0.3, room_y + room_size[1] * 0.3, room_z + 0.3), scale=(room_size[0] * 0.2, room_size[1] * 0.2, 0.3), collection=rooms_collection)
+
+    # Assign material
+    waiting_area.data.materials.append(interior_material)
+
+    # Create shared chair mesh
+    chair_mesh = create_cube_mesh("MilitechArmory_Waiting_Chair", (0.3, 0.3, 0.3))
+    chair_mesh.materials.append(interior_material)
+
+    # Create chairs in waiting area
+    for i in range(4):
+        chair_x = room_x + room_size[0] * (0.25 + (i % 2) * 0.1)
+        chair_y = room_y + room_size[1] * (0.25 + (i // 2) * 0.1)
+
+        create_mesh_object(f"MilitechArmory_Waiting_Chair_{i}", chair_mesh, (chair_x, chair_y, room_z + 0.5), collection=rooms_collection)
+
+
+def create_militech_showroom(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Militech showroom with the featured weapon and display cases"""
+    # Create central display platform
+    platform = create_cylinder_object("MilitechArmory_Display_Platform", (room_x, room_y, room_z + 0.25),
+                                      vertices=32, radius=room_size[0] * 0.2, depth=0.5, collection=rooms_collection)
+
+    # Create platform material
+    platform_material = get_shared_material("MilitechArmory_PlatformMaterial", (0.8, 0.1, 0.1, 1.0), metallic=0.8, roughness=0.2)  # Red
+
+    # Assign material
+    platform.data.materials.append(platform_material)
+
+    # Create featured weapon on platform
+    featured_weapon = create_cube_object("MilitechArmory_Featured_Weapon", (room_x, room_y, room_z + 1.0), scale=(1.5, 0.3, 0.3), collection=rooms_collection)
+
+    # Create weapon material
+    weapon_material = get_shared_material("MilitechArmory_WeaponMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.9, roughness=0.1)  # Black
+
+    # Assign material
+    featured_weapon.data.materials.append(weapon_material)
+
+    # Create weapon details
+    weapon_barrel = create_cylinder_object("MilitechArmory_Weapon_Barrel", (room_x - 0.5, room_y, room_z + 1.0),
+                                           vertices=16, radius=0.1, depth=1.0, collection=rooms_collection)
+
+    # Rotate barrel
+    transform_mesh(weapon_barrel.data, rotation=(_RAD90, 0, 0))
+
+    # Assign material
+    weapon_barrel.data.materials.append(weapon_material)
+
+    # Create the display case asset, a case with its weapon, once for all showrooms per material mode
+    case_key = ("CASE_ASSET", _flat_materials)
+    case_asset = bpy.data.collections.get(_material_cache.get(case_key, ""))
+    if case_asset is None:
+        case_asset = bpy.data.collections.new("MilitechArmory_DisplayCaseAsset")
+        _material_cache[case_key] = case_asset.name
+        case_mesh = create_cube_mesh("MilitechArmory_Display_Case", (0.8, 0.8, 1.0))
+        case_weapon_mesh = create_cube_mesh("MilitechArmory_Weapon", (0.7, 0.2, 0.2))
+
+        # Create case material
+        case_material = get_shared_material("MilitechArmory_CaseMaterial", (0.3, 0.3, 0.3, 1.0), metallic=0.8, roughness=0.2)  # Gray
+
+        # Assign materials
+        case_mesh.materials.append(case_material)
+        case_weapon_mesh.materials.append(weapon_material)
+
+        # The weapon sits half a unit above the case origin
+        create_mesh_object("MilitechArmory_Display_Case", case_mesh, (0.0, 0.0, 0.0), collection=case_asset)
+        create_mesh_object("MilitechArmory_Weapon", case_weapon_mesh, (0.0, 0.0, 0.5), collection=case_asset)
+
+    # Create weapon display cases around the room, each an instance turned to face the center
+    case_count = 8
+    cos_a, sin_a = unit_circle(case_count)
+    case_xs = room_x + room_size[0] * 0.4 * cos_a
+    case_ys = room_y + room_size[1] * 0.4 * sin_a
+    case_rots = np.arctan2(room_y - case_ys, room_x - case_xs).tolist()
+    case_xs = case_xs.tolist()
+    case_ys = case_ys.tolist()
+    for i in range(case_count):
+        case_x = case_xs[i]
+        case_y = case_ys[i]
+
+        case = bpy.data.objects.new(f"MilitechArmory_Display_Case_{i}", None)
+        case.instance_type = 'COLLECTION'
+        case.instance_collection = case_asset
+        case.matrix_basis = Matrix.LocRotScale((case_x, case_y, room_z + 0.5), Euler((0.0, 0.0, case_rots[i])), None)
+        rooms_collection.objects.link(case)
 
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    # Create shared hologram mesh, scaled and rotated to be vertical
+    holo_mesh = create_grid_mesh("MilitechArmory_Holographic_Display", 1, 1, size=1.0)
+    transform_mesh(holo_mesh, scale=(0.5, 1.0, 1.0), rotation=(_RAD90, 0, 0))
 
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.3, 0.3, 0.3, 1.0)  # Gray
-                principled.inputs['Metallic'].default_value = 0.8
-                principled.inputs['Roughness'].default_value = 0.2
+    # Create hologram material
+    holo_material = get_shared_emission_material("MilitechArmory_HoloMaterial", (0.8, 0.1, 0.1, 1.0))  # Red
 
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+    # Assign material
+    holo_mesh.materials.append(holo_material)
 
-                # Assign material
-                case.data.materials.append(case_material)
+    # Create holographic displays
+    for i in range(4):
+        holo_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.2
+        holo_y = room_y - room_size[1] * 0.4
+
+        create_mesh_object(f"MilitechArmory_Holographic_Display_{i}", holo_mesh, (holo_x, holo_y, room_z + 1.5), collection=rooms_collection)
 
-                room_objects.append(case)
 
-                # Create trophy weapon
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(case_x, case_y, room_z + 1.0)
-                )
-                trophy = bpy.context.active_object
-                trophy.name = f"MilitechArmory_Trophy_Weapon_{i}"
+def create_militech_testing_range(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Militech testing range with shooting lanes, targets and a control room"""
+    # Look up the Militech interior material once
+    interior_material = interior_materials["Militech_Interior"]
 
-                # Scale trophy
-                trophy.scale.x = 0.3
-                trophy.scale.y = 0.1
-                trophy.scale.z = 0.1
+    # Create shared lane meshes
+    divider_mesh = create_cube_mesh("MilitechArmory_Lane_Divider", (0.1, room_size[1] * 0.8, room_size[2] * 0.8))
+    position_mesh = create_cube_mesh("MilitechArmory_Shooting_Position", (room_size[0] * 0.07, room_size[1] * 0.05, 0.5))
+    rest_mesh = create_cube_mesh("MilitechArmory_Weapon_Rest", (room_size[0] * 0.05, room_size[1] * 0.02, 0.1))
+    test_weapon_mesh = create_cube_mesh("MilitechArmory_Test_Weapon", (0.7, 0.2, 0.1))
+
+    # Create weapon material
+    weapon_material = get_shared_material("MilitechArmory_TestWeaponMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.9, roughness=0.1)  # Black
+
+    # Assign materials
+    divider_mesh.materials.append(interior_material)
+    position_mesh.materials.append(interior_material)
+    rest_mesh.materials.append(interior_material)
+    test_weapon_mesh.materials.append(weapon_material)
+
+    # Calculate divider positions and the lane centers between them
+    lane_count = 5
+    divider_xs = room_x + room_size[0] * (-0.3 + 0.15 * np.arange(lane_count))
+    lane_xs = (divider_xs[:-1] + room_size[0] * 0.075).tolist()
+    divider_xs = divider_xs.tolist()
+
+    # Create lane dividers
+    for i in range(lane_count):
+        create_mesh_object(f"MilitechArmory_Lane_Divider_{i}", divider_mesh, (divider_xs[i], room_y, room_z + room_size[2]/2), collection=rooms_collection)
+
+    # Create a shooting position, weapon rest and test weapon in each lane
+    position_y = room_y - room_size[1] * 0.35
+    for i in range(lane_count - 1):
+        position_x = lane_xs[i]
+
+        create_mesh_object(f"MilitechArmory_Shooting_Position_{i}", position_mesh, (position_x, position_y, room_z + 0.5), collection=rooms_collection)
+
+        # Create weapon rest
+        create_mesh_object(f"MilitechArmory_Weapon_Rest_{i}", rest_mesh, (position_x, position_y - 0.3, room_z + 1.0), collection=rooms_collection)
+
+        # Create test weapon
+        create_mesh_object(f"MilitechArmory_Test_Weapon_{i}", test_weapon_mesh, (position_x, position_y - 0.3, room_z + 1.1), collection=rooms_collection)
+
+    # Create shared target base and target meshes
+    target_base_mesh = create_cube_mesh("MilitechArmory_Target_Base", (0.1, 0.1, 1.0))
+    target_base_mesh.materials.append(interior_material)
+    target_mesh = create_circle_mesh("MilitechArmory_Target", vertices=32, radius=0.5)
+
+    # Create target material
+    target_material = get_shared_material("MilitechArmory_TargetMaterial", (0.8, 0.1, 0.1, 1.0), roughness=0.9)  # Red
+
+    # Assign material
+    target_mesh.materials.append(target_material)
+
+    # Create one shared mesh per target ring
+    ring_meshes = []
+    for j in range(3):
+        ring_radius = 0.4 - j * 0.1
+        ring_mesh = create_circle_mesh(f"MilitechArmory_Target_Ring_{j}", vertices=32, radius=ring_radius)
+
+        # Create ring material, alternating black and white
+        if j % 2 == 0:
+            ring_material = get_shared_material("MilitechArmory_RingMaterial_Black", (0.0, 0.0, 0.0, 1.0), roughness=0.9)
+        else:
+            ring_material = get_shared_material("MilitechArmory_RingMaterial_White", (1.0, 1.0, 1.0, 1.0), roughness=0.9)
 
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        # Assign material
+        ring_mesh.materials.append(ring_material)
+        ring_meshes.append(ring_mesh)
 
-                # Create trophy material
-                trophy_material = bpy.data.materials.new(name=f"MilitechArmory_TrophyMaterial_{i}")
-                trophy_material.use_nodes = True
-                nodes = trophy_material.node_tree.nodes
-                links = trophy_material.node_tree.links
+    # Create targets at the end of the range
+    target_y = room_y + room_size[1] * 0.35
+    for i in range(lane_count - 1):
+        target_x = lane_xs[i]
 
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
+        # Create target base
+        create_mesh_object(f"MilitechArmory_Target_Base_{i}", target_base_mesh, (target_x, target_y, room_z + 0.5), collection=rooms_collection)
 
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+        # Create target
+        create_mesh_object(f"MilitechArmory_Target_{i}", target_mesh, (target_x, target_y, room_z + 1.5), collection=rooms_collection)
 
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.8, 0.7, 0.2, 1.0)  # Gold
-                principled.inputs['Metallic'].default_value = 1.0
-                principled.inputs['Roughness'].default_value = 0.1
+        # Create target rings
+        for j, ring_mesh in enumerate(ring_meshes):
+            create_mesh_object(f"MilitechArmory_Target_Ring_{i}_{j}", ring_mesh, (target_x, target_y, room_z + 1.51), collection=rooms_collection)
 
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+    # Create control room
+    control_room = create_cube_object("MilitechArmory_Control_Room", (room_x, room_y - room_size[1] * 0.45, room_z + room_size[2]/2), scale=(room_size[0] * 0.3, room_size[1] * 0.05, room_size[2] * 0.8), collection=rooms_collection)
 
-                # Assign material
-                trophy.data.materials.append(trophy_material)
+    # Assign material
+    control_room.data.materials.append(interior_material)
 
-                room_objects.append(trophy)
+    # Create control room window
+    window = create_cube_object("MilitechArmory_Control_Window", (room_x, room_y - room_size[1] * 0.4, room_z + room_size[2]/2), scale=(room_size[0] * 0.28, 0.05, room_size[2] * 0.4), collection=rooms_collection)
 
-            # Create wall-mounted weapons
-            for i in range(2):
-                weapon_x = room_x - room_size[0] * 0.3 + i * room_size[0] * 0.6
-                weapon_y = room_y + room_size[1] * 0.4
+    # Assign material
+    window.data.materials.append(get_militech_window_material())
 
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(weapon_x, weapon_y, room_z + 1.5)
-                )
-                wall_weapon = bpy.context.active_object
-                wall_weapon.name = f"MilitechArmory_Wall_Weapon_{i}"
 
-                # Scale wall weapon
-                wall_weapon.scale.x = 1.0
-                wall_weapon.scale.y = 0.1
-                wall_weapon.scale.z = 0.2
+def create_militech_rd_lab(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Militech R&D lab with prototypes, lab equipment and scientists"""
+    # Look up the Militech interior material once
+    interior_material = interior_materials["Militech_Interior"]
 
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    # Create central workbench
+    workbench = create_cube_object("MilitechArmory_RD_Workbench", (room_x, room_y, room_z + 0.5), scale=(room_size[0] * 0.7, room_size[1] * 0.4, 1.0), collection=rooms_collection)
 
-                # Create wall weapon material
-                wall_weapon_material = bpy.data.materials.new(name=f"MilitechArmory_WallWeaponMaterial_{i}")
-                wall_weapon_material.use_nodes = True
-                nodes = wall_weapon_material.node_tree.nodes
-                links = wall_weapon_material.node_tree.links
+    # Assign material
+    workbench.data.materials.append(interior_material)
 
-                # Clear default nodes
-                for node in nodes:
-                    nodes.remove(node)
+    # Create shared prototype mesh
+    prototype_mesh = create_cube_mesh("MilitechArmory_Prototype", (0.8, 0.3, 0.2))
 
-                # Create nodes
-                output = nodes.new(type='ShaderNodeOutputMaterial')
-                principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    # Create prototype material
+    prototype_material = get_shared_material("MilitechArmory_PrototypeMaterial", (0.7, 0.7, 0.7, 1.0), metallic=0.9, roughness=0.1)  # Light gray
 
-                # Set properties
-                principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black
-                principled.inputs['Metallic'].default_value = 0.9
-                principled.inputs['Roughness'].default_value = 0.1
+    # Assign material
+    prototype_mesh.materials.append(prototype_material)
 
-                # Connect nodes
-                links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+    # Create prototype weapons on workbench, spaced evenly around the room center
+    prototype_xs = (room_x + room_size[0] * 0.2 * (np.arange(3) - 1)).tolist()
+    prototype_y = room_y
+    for i in range(3):
+        prototype_x = prototype_xs[i]
 
-                # Assign material
-                wall_weapon.data.materials.append(wall_weapon_material)
+        create_mesh_object(f"MilitechArmory_Prototype_{i}", prototype_mesh, (prototype_x, prototype_y, room_z + 1.0), collection=rooms_collection)
 
-                room_objects.append(wall_weapon)
+        # Draw the offsets and shapes of all prototype parts at once
+        parts_count = int(_rng.integers(3, 6))
+        part_xs = (prototype_x + _rng.uniform(-0.4, 0.4, parts_count)).tolist()
+        part_ys = (prototype_y + _rng.uniform(-0.2, 0.2, parts_count)).tolist()
+        part_is_cube = (_rng.random(parts_count) > 0.5).tolist()
+        part_sizes = _rng.uniform(0.1, 0.2, parts_count).tolist()
+        part_radii = _rng.uniform(0.05, 0.1, parts_count).tolist()
+        part_depths = _rng.uniform(0.1, 0.3, parts_count).tolist()
 
-                # Create weapon mount
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(weapon_x, weapon_y - 0.05, room_z + 1.5)
-                )
-                mount = bpy.context.active_object
-                mount.name = f"MilitechArmory_Weapon_Mount_{i}"
+        # Create prototype parts
+        for j in range(parts_count):
+            part_location = (part_xs[j], part_ys[j], room_z + 1.1)
 
-                # Scale mount
-                mount.scale.x = 1.1
-                mount.scale.y = 0.05
-                mount.scale.z = 0.3
+            # Randomize part shape
+            part_name = f"MilitechArmory_Prototype_Part_{i}_{j}"
+            if part_is_cube[j]:
+                part_size = part_sizes[j]
+                part = create_cube_object(part_name, part_location, scale=(part_size, part_size, part_size), collection=rooms_collection)
+            else:
+                part = create_cylinder_object(part_name, part_location, vertices=8,
+                                              radius=part_radii[j], depth=part_depths[j], collection=rooms_collection)
 
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+            # Assign material
+            part.data.materials.append(prototype_material)
 
-                # Assign material
-                mount.data.materials.append(interior_materials["Militech_Interior"])
+    # Create equipment material, shared by every piece of equipment and its details
+    equipment_material = get_shared_material("MilitechArmory_EquipmentMaterial", (0.3, 0.3, 0.3, 1.0), metallic=0.8, roughness=0.2)  # Gray
 
-                room_objects.append(mount)
+    # Create equipment around the lab, two pieces along each side wall
+    equipment_types = ["3D_Printer", "Scanner", "Computer", "Testing_Rig"]
+    eq_xs = (room_x + room_size[0] * 0.3 * np.array((-1, -1, 1, 1))).tolist()
+    eq_ys = (room_y + room_size[1] * (np.arange(4) % 2 * 0.6 - 0.3)).tolist()
+    for i, eq_type in enumerate(equipment_types):
+        eq_x = eq_xs[i]
+        eq_y = eq_ys[i]
 
-            # Create executive
-            bpy.ops.mesh.primitive_cube_add(
-                size=1.0,
-                enter_editmode=False,
-                align='WORLD',
-                location=(room_x, room_y + room_size[1] * 0.1, room_z + 1.0)
-            )
-            executive = bpy.context.active_object
-            executive.name = "MilitechArmory_Executive"
+        equipment = create_cube_object(f"MilitechArmory_{eq_type}", (eq_x, eq_y, room_z + 0.5), scale=(0.8, 0.8, 1.0), collection=rooms_collection)
 
-            # Scale executive
-            executive.scale.x = 0.4
-            executive.scale.y = 0.4
-            executive.scale.z = 0.8
+        # Assign material
+        equipment.data.materials.append(equipment_material)
 
-            # Apply scale
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+        # Create equipment details
+        if eq_type == "3D_Printer":
+            # Create printer head
+            printer_head = create_cube_object("MilitechArmory_Printer_Head", (eq_x, eq_y, room_z + 1.0), scale=(0.2, 0.2, 0.2), collection=rooms_collection)
 
-            # Create executive material
-            executive_material = bpy.data.materials.new(name="MilitechArmory_ExecutiveMaterial")
-            executive_material.use_nodes = True
-            nodes = executive_material.node_tree.nodes
-            links = executive_material.node_tree.links
+            # Assign material
+            printer_head.data.materials.append(equipment_material)
 
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
+            # Create printing platform
+            platform = create_cube_object("MilitechArmory_Printing_Platform", (eq_x, eq_y, room_z + 0.7), scale=(0.6, 0.6, 0.1), collection=rooms_collection)
 
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+            # Assign material
+            platform.data.materials.append(equipment_material)
 
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black suit
-            principled.inputs['Roughness'].default_value = 0.7
+        elif eq_type == "Scanner":
+            # Create scanner arm
+            scanner_arm = create_cylinder_object("MilitechArmory_Scanner_Arm", (eq_x, eq_y, room_z + 1.0),
+                                                 vertices=8, radius=0.1, depth=1.0, collection=rooms_collection)
 
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+            # Rotate arm
+            transform_mesh(scanner_arm.data, rotation=(_RAD90, 0, 0))
 
             # Assign material
-            executive.data.materials.append(executive_material)
+            scanner_arm.data.materials.append(equipment_material)
 
-            room_objects.append(executive)
+            # Create scanner head
+            scanner_head = create_cube_object("MilitechArmory_Scanner_Head", (eq_x, eq_y + 0.5, room_z + 1.0), scale=(0.3, 0.1, 0.2), collection=rooms_collection)
 
-            # Create executive head
-            bpy.ops.mesh.primitive_uv_sphere_add(
-                radius=0.2,
-                align='WORLD',
-                location=(room_x, room_y + room_size[1] * 0.1, room_z + 1.8)
-            )
-            head = bpy.context.active_object
-            head.name = "MilitechArmory_Executive_Head"
+            # Assign material
+            scanner_head.data.materials.append(equipment_material)
 
-            # Create head material
-            head_material = bpy.data.materials.new(name="MilitechArmory_HeadMaterial")
-            head_material.use_nodes = True
-            nodes = head_material.node_tree.nodes
-            links = head_material.node_tree.links
+        elif eq_type == "Computer":
+            # Create monitor
+            monitor = create_cube_object("MilitechArmory_Computer_Monitor", (eq_x, eq_y, room_z + 1.0), scale=(0.6, 0.1, 0.4), collection=rooms_collection)
 
-            # Clear default nodes
-            for node in nodes:
-                nodes.remove(node)
+            # Create monitor screen material
+            screen_material = get_shared_emission_material("MilitechArmory_ScreenMaterial", (0.8, 0.1, 0.1, 1.0))  # Red
 
-            # Create nodes
-            output = nodes.new(type='ShaderNodeOutputMaterial')
-            principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+            # Assign material
+            monitor.data.materials.append(screen_material)
 
-            # Set properties
-            principled.inputs['Base Color'].default_value = (0.8, 0.6, 0.5, 1.0)  # Skin tone
-            principled.inputs['Roughness'].default_value = 0.7
+            # Create keyboard
+            keyboard = create_cube_object("MilitechArmory_Computer_Keyboard", (eq_x, eq_y + 0.3, room_z + 0.6), scale=(0.4, 0.2, 0.05), collection=rooms_collection)
 
-            # Connect nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+            # Assign material
+            keyboard.data.materials.append(equipment_material)
+
+        elif eq_type == "Testing_Rig":
+            # Create testing platform
+            test_platform = create_cube_object("MilitechArmory_Testing_Platform", (eq_x, eq_y, room_z + 0.7), scale=(0.6, 0.6, 0.1), collection=rooms_collection)
 
             # Assign material
-            head.data.materials.append(head_material)
+            test_platform.data.materials.append(equipment_material)
+
+            # Create shared testing arm and tool meshes
+            arm_mesh = create_cylinder_mesh("MilitechArmory_Testing_Arm", vertices=8, radius=0.05, depth=0.8)
+            arm_mesh.materials.append(equipment_material)
+            tool_mesh = create_cube_mesh("MilitechArmory_Testing_Tool", (0.1, 0.1, 0.1))
+            tool_mesh.materials.append(equipment_material)
+
+            # Create testing arms
+            for j in range(2):
+                arm_x = eq_x
+                arm_y = eq_y - 0.3 + j * 0.6
+
+                create_mesh_object(f"MilitechArmory_Testing_Arm_{j}", arm_mesh, (arm_x, arm_y, room_z + 1.1), collection=rooms_collection)
+
+                # Create arm tool
+                create_mesh_object(f"MilitechArmory_Testing_Tool_{j}", tool_mesh, (arm_x, arm_y, room_z + 0.8), collection=rooms_collection)
+
+    # Create scientist and head materials
+    scientist_material = get_shared_material("MilitechArmory_ScientistMaterial", (1.0, 1.0, 1.0, 1.0), roughness=0.9)  # White lab coat
+    head_material = get_shared_material("MilitechArmory_HeadMaterial", (0.8, 0.6, 0.5, 1.0), roughness=0.7)  # Skin tone
+
+    # Create one scientist mesh holding the body and the head above it, with its origin on the floor
+    head_verts, head_faces = uv_sphere_geometry(radius=0.15)
+    scientist_verts = np.concatenate((CUBE_VERTS * (0.3, 0.3, 0.8) + (0.0, 0.0, 1.0), head_verts + (0.0, 0.0, 1.8)))
+    scientist_faces = CUBE_FACES + [tuple(index + len(CUBE_VERTS) for index in face) for face in head_faces]
+    scientist_mesh = create_mesh_from_faces("MilitechArmory_Scientist", scientist_verts, scientist_faces)
+
+    # Assign materials, slot 0 to the body faces and slot 1 to the head faces
+    scientist_mesh.materials.append(scientist_material)
+    scientist_mesh.materials.append(head_material)
+    scientist_mesh.polygons.foreach_set("material_index", np.repeat((0, 1), (len(CUBE_FACES), len(head_faces))))
+    scientist_mesh.update()
+
+    # Create scientists
+    scientist_xs = (room_x + room_size[0] * (np.arange(2) * 0.4 - 0.2)).tolist()
+    scientist_y = room_y - room_size[1] * 0.1
+    for i in range(2):
+        create_mesh_object(f"MilitechArmory_Scientist_{i}", scientist_mesh, (scientist_xs[i], scientist_y, room_z), collection=rooms_collection)
+
+
+def create_militech_secure_vault(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Militech secure vault with weapon racks, scanners and ceiling turrets"""
+    # Look up the Militech interior material once
+    interior_material = interior_materials["Militech_Interior"]
+
+    # Create central weapon storage
+    storage = create_cube_object("MilitechArmory_Secure_Storage", (room_x, room_y, room_z + 1.0), scale=(room_size[0] * 0.6, room_size[1] * 0.6, 2.0), collection=rooms_collection)
+
+    # Create storage material
+    storage_material = get_shared_material("MilitechArmory_StorageMaterial", (0.2, 0.2, 0.2, 1.0), metallic=0.9, roughness=0.1)  # Dark gray
+
+    # Assign material
+    storage.data.materials.append(storage_material)
+
+    # Create shared rack and stored weapon meshes; each object only turns about Z
+    rack_mesh = create_cube_mesh("MilitechArmory_Weapon_Rack", (room_size[0] * 0.5, 0.1, 1.8))
+    stored_weapon_mesh = create_cube_mesh("MilitechArmory_Stored_Weapon", (0.8, 0.2, 0.2))
+
+    # Create weapon material
+    weapon_material = get_shared_material("MilitechArmory_StoredWeaponMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.9, roughness=0.1)  # Black
+
+    # Assign materials
+    rack_mesh.materials.append(storage_material)
+    stored_weapon_mesh.materials.append(weapon_material)
+
+    # Spread the weapons along each rack, stacking each one higher than the last
+    weapon_count = 5
+    weapon_offsets = np.arange(weapon_count) * 0.1 - 0.2
+    weapon_zs = room_z + 0.5 + np.arange(weapon_count) * 0.3
+
+    # Lay out the racks, then line each rack's weapons up along its spread axis
+    rack_layout = np.array(_RACK_LAYOUT)
+    rack_xyzs = np.empty((len(rack_layout), 3))
+    rack_xyzs[:, 0] = room_x + room_size[0] * rack_layout[:, 0]
+    rack_xyzs[:, 1] = room_y + room_size[1] * rack_layout[:, 1]
+    rack_xyzs[:, 2] = room_z + 1.0
+    rack_rots = rack_layout[:, 2]
+    spread_axes = rack_layout[:, 3].astype(int)
+    weapon_xyzs = np.repeat(rack_xyzs, weapon_count, axis=0).reshape(len(rack_layout), weapon_count, 3)
+    weapon_xyzs[np.arange(len(rack_layout)), :, spread_axes] += np.take(room_size, spread_axes)[:, None] * weapon_offsets
+    weapon_xyzs[:, :, 2] = weapon_zs
 
-            room_objects.append(head)
+    # Create weapon racks
+    link_mesh_objects([f"MilitechArmory_Weapon_Rack_{i}" for i in range(len(rack_layout))], rack_mesh,
+                      rack_xyzs, rooms_collection, rotations_z=rack_rots)
+
+    # Create weapons on racks, each turned like its rack
+    link_mesh_objects([f"MilitechArmory_Stored_Weapon_{i}_{j}" for i in range(len(rack_layout)) for j in range(weapon_count)],
+                      stored_weapon_mesh, weapon_xyzs.reshape(-1, 3), rooms_collection,
+                      rotations_z=np.repeat(rack_rots, weapon_count))
+
+    # Create shared scanner base and beam meshes
+    scanner_base_mesh = create_cylinder_mesh("MilitechArmory_Vault_Scanner", vertices=16, radius=0.2, depth=0.1)
+    scanner_beam_mesh = create_cylinder_mesh("MilitechArmory_Vault_Scanner_Beam", vertices=16, radius=0.05, depth=3.0)
+
+    # Create beam material
+    beam_material = get_shared_emission_material("MilitechArmory_BeamMaterial", (0.8, 0.1, 0.1, 0.5))  # Red
 
-    # Create connecting corridors between rooms
-    corridor_data = [
-        {
-            "start": "Security_Lobby",
-            "end": "Showroom",
-            "width": building_size.x * 0.2,
-            "height": building_size.z * 0.15,
-            "vertical": True
-        },
-        {
-            "start": "Showroom",
-            "end": "Testing_Range",
-            "width": building_size.x * 0.2,
-            "height": building_size.z * 0.15,
-            "vertical": True
-        },
-        {
-            "start": "Showroom",
-            "end": "RD_Lab",
-            "width": building_size.x * 0.2,
-            "height": building_size.z * 0.15,
-            "vertical": True
-        },
-        {
-            "start": "Testing_Range",
-            "end": "Secure_Vault",
-            "width": building_size.x * 0.2,
-            "height": building_size.z * 0.15,
-            "vertical": True
-        },
-        {
-            "start": "RD_Lab",
-            "end": "Executive_Office",
-            "width": building_size.x * 0.2,
-            "height": building_size.z * 0.15,
-            "vertical": True
-        }
-    ]
+    # Assign materials
+    scanner_base_mesh.materials.append(interior_material)
+    scanner_beam_mesh.materials.append(beam_material)
+
+    # Create security scanners by the vault entrance
+    scanner_xyzs = np.empty((2, 3))
+    scanner_xyzs[:, 0] = room_x + room_size[0] * (np.arange(2) * 0.4 - 0.2)
+    scanner_xyzs[:, 1] = room_y - room_size[1] * 0.4
+    scanner_xyzs[:, 2] = room_z + 0.05
+    link_mesh_objects([f"MilitechArmory_Vault_Scanner_{i}" for i in range(2)], scanner_base_mesh, scanner_xyzs, rooms_collection)
+
+    # Create scanner beams above the bases
+    scanner_xyzs[:, 2] = room_z + 1.5
+    link_mesh_objects([f"MilitechArmory_Vault_Scanner_Beam_{i}" for i in range(2)], scanner_beam_mesh, scanner_xyzs, rooms_collection)
+
+    # Create shared turret meshes, the barrel laid flat once; each barrel only turns about Z
+    turret_base_mesh = create_cylinder_mesh("MilitechArmory_Security_Turret_Base", vertices=16, radius=0.2, depth=0.2)
+    turret_body_mesh = create_cube_mesh("MilitechArmory_Security_Turret_Body", (0.3, 0.3, 0.2))
+    turret_barrel_mesh = create_cylinder_mesh("MilitechArmory_Security_Turret_Barrel", vertices=8, radius=0.05, depth=0.4)
+    transform_mesh(turret_barrel_mesh, rotation=(_RAD90, 0, 0))
+
+    # Assign materials
+    turret_base_mesh.materials.append(interior_material)
+    turret_body_mesh.materials.append(interior_material)
+    turret_barrel_mesh.materials.append(interior_material)
+
+    # Create security turrets in the ceiling corners, barrels aimed at the center
+    turret_angles = np.arange(4) * _RAD90 + _RAD45
+    turret_xyzs = np.empty((4, 3))
+    turret_xyzs[:, 0] = room_x + room_size[0] * 0.4 * np.cos(turret_angles)
+    turret_xyzs[:, 1] = room_y + room_size[1] * 0.4 * np.sin(turret_angles)
+    turret_xyzs[:, 2] = room_z + room_size[2] - 0.1
+    turret_rots = np.arctan2(room_y - turret_xyzs[:, 1], room_x - turret_xyzs[:, 0])
+
+    # Create turret bases
+    link_mesh_objects([f"MilitechArmory_Security_Turret_Base_{i}" for i in range(4)], turret_base_mesh, turret_xyzs, rooms_collection)
+
+    # Create turret bodies below the bases
+    turret_xyzs[:, 2] = room_z + room_size[2] - 0.3
+    link_mesh_objects([f"MilitechArmory_Security_Turret_Body_{i}" for i in range(4)], turret_body_mesh, turret_xyzs, rooms_collection)
 
-    # Find room positions
-    room_positions = {}
-    for room_data in rooms_data:
-        room_name = room_data["name"]
-        room_pos = room_data["position"]
-        floor_level = room_data["floor_level"]
+    # Create turret barrels and rotate them to point toward center
+    link_mesh_objects([f"MilitechArmory_Security_Turret_Barrel_{i}" for i in range(4)], turret_barrel_mesh, turret_xyzs, rooms_collection,
+                      rotations_z=turret_rots)
 
-        # Calculate absolute position
-        room_x = building_loc[0] + room_pos[0]
-        room_y = building_loc[1] + room_pos[1]
-        room_z = building_loc[2] - building_size.z/2 + building_size.z * 0.1 + floor_level * building_size.z * 0.2
 
-        room_positions[room_name] = (room_x, room_y, room_z)
+def create_militech_executive_office(room_x, room_y, room_z, room_size, interior_materials, rooms_collection):
+    """Create the Militech executive office with its desk, trophy cases and executive"""
+    # Look up the Militech interior material once
+    interior_material = interior_materials["Militech_Interior"]
+
+    # Create executive desk
+    desk = create_cube_object("MilitechArmory_Executive_Desk", (room_x, room_y, room_z + 0.5), scale=(room_size[0] * 0.4, room_size[1] * 0.2, 1.0), collection=rooms_collection)
+
+    # Create desk material
+    desk_material = get_shared_material("MilitechArmory_DeskMaterial", (0.05, 0.05, 0.05, 1.0), metallic=0.9, roughness=0.1)  # Very dark gray
+
+    # Assign material
+    desk.data.materials.append(desk_material)
 
-    # Create corridors
-    for corridor in corridor_data:
-        start_name = corridor["start"]
-        end_name = corridor["end"]
-        corridor_width = corridor["width"]
-        corridor_height = corridor["height"]
-        vertical = corridor.get("vertical", False)
+    # Create executive chair
+    chair = create_cube_object("MilitechArmory_Executive_Chair", (room_x, room_y + room_size[1] * 0.1, room_z + 0.5), scale=(0.6, 0.6, 1.0), collection=rooms_collection)
+
+    # Create chair material
+    chair_material = get_shared_material("MilitechArmory_ChairMaterial", (0.8, 0.1, 0.1, 1.0), roughness=0.8)  # Red
+
+    # Assign material
+    chair.data.materials.append(chair_material)
+
+    # Create chair back
+    chair_back = create_cube_object("MilitechArmory_Chair_Back", (room_x, room_y + room_size[1] * 0.15, room_z + 1.0), scale=(0.6, 0.1, 1.0), collection=rooms_collection)
 
-        if start_name in room_positions and end_name in room_positions:
-            start_pos = room_positions[start_name]
-            end_pos = room_positions[end_name]
+    # Assign material
+    chair_back.data.materials.append(chair_material)
+
+    # Create computer on desk
+    computer = create_cube_object("MilitechArmory_Executive_Computer", (room_x, room_y - room_size[1] * 0.1, room_z + 1.0), scale=(0.6, 0.1, 0.4), collection=rooms_collection)
 
-            if vertical:
-                # Create elevator shaft
-                elevator_x = (start_pos[0] + end_pos[0]) / 2
-                elevator_y = (start_pos[1] + end_pos[1]) / 2
-                elevator_z = (start_pos[2] + end_pos[2]) / 2
-                elevator_height = abs(end_pos[2] - start_pos[2])
+    # Create computer screen material
+    screen_material = get_shared_emission_material("MilitechArmory_ComputerScreenMaterial", (0.8, 0.1, 0.1, 1.0))  # Red
 
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(elevator_x, elevator_y, elevator_z)
-                )
-                elevator = bpy.context.active_object
-                elevator.name = f"MilitechArmory_Elevator_{start_name}_to_{end_name}"
+    # Assign material
+    computer.data.materials.append(screen_material)
 
-                # Scale elevator
-                elevator.scale.x = corridor_width
-                elevator.scale.y = corridor_width
-                elevator.scale.z = elevator_height
+    # Create shared trophy case, trophy, wall weapon and mount meshes
+    case_mesh = create_cube_mesh("MilitechArmory_Trophy_Case", (0.4, 0.4, 1.0))
+    trophy_mesh = create_cube_mesh("MilitechArmory_Trophy_Weapon", (0.3, 0.1, 0.1))
+    wall_weapon_mesh = create_cube_mesh("MilitechArmory_Wall_Weapon", (1.0, 0.1, 0.2))
+    mount_mesh = create_cube_mesh("MilitechArmory_Weapon_Mount", (1.1, 0.05, 0.3))
 
-                # Apply scale
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    # Create case material
+    case_material = get_shared_material("MilitechArmory_TrophyCaseMaterial", (0.3, 0.3, 0.3, 1.0), metallic=0.8, roughness=0.2)  # Gray
 
-                # Assign material
-                elevator.data.materials.append(interior_materials["Militech_Interior"])
+    # Create trophy material
+    trophy_material = get_shared_material("MilitechArmory_TrophyMaterial", (0.8, 0.7, 0.2, 1.0), metallic=1.0, roughness=0.1)  # Gold
 
-                room_objects.append(elevator)
+    # Create wall weapon material
+    wall_weapon_material = get_shared_material("MilitechArmory_WallWeaponMaterial", (0.1, 0.1, 0.1, 1.0), metallic=0.9, roughness=0.1)  # Black
 
-                # Create elevator doors
-                for i, pos in enumerate([start_pos, end_pos]):
-                    door_x = pos[0]
-                    door_y = pos[1]
-                    door_z = pos[2] + corridor_height/2
+    # Assign materials
+    case_mesh.materials.append(case_material)
+    trophy_mesh.materials.append(trophy_material)
+    wall_weapon_mesh.materials.append(wall_weapon_material)
+    mount_mesh.materials.append(interior_material)
 
-                    bpy.ops.mesh.primitive_cube_add(
-                        size=1.0,
-                        enter_editmode=False,
-                        align='WORLD',
-                        location=(door_x, door_y, door_z)
-                    )
-                    door = bpy.context.active_object
-                    door.name = f"MilitechArmory_Elevator_Door_{i}_{start_name}_to_{end_name}"
+    # Create weapon display cases along the front wall
+    case_xyzs = np.empty((3, 3))
+    case_xyzs[:, 0] = room_x + room_size[0] * (np.arange(3) * 0.3 - 0.3)
+    case_xyzs[:, 1] = room_y - room_size[1] * 0.4
+    case_xyzs[:, 2] = room_z + 0.5
+    link_mesh_objects([f"MilitechArmory_Trophy_Case_{i}" for i in range(3)], case_mesh, case_xyzs, rooms_collection)
 
-                    # Scale door
-                    door.scale.x = corridor_width * 0.8
-                    door.scale.y = 0.05
-                    door.scale.z = corridor_height * 0.8
+    # Create trophy weapons inside the cases
+    case_xyzs[:, 2] = room_z + 1.0
+    link_mesh_objects([f"MilitechArmory_Trophy_Weapon_{i}" for i in range(3)], trophy_mesh, case_xyzs, rooms_collection)
 
-                    # Apply scale
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
+    # Create wall-mounted weapons on the back wall
+    wall_weapon_xyzs = np.empty((2, 3))
+    wall_weapon_xyzs[:, 0] = room_x + room_size[0] * (np.arange(2) * 0.6 - 0.3)
+    wall_weapon_xyzs[:, 1] = room_y + room_size[1] * 0.4
+    wall_weapon_xyzs[:, 2] = room_z + 1.5
+    link_mesh_objects([f"MilitechArmory_Wall_Weapon_{i}" for i in range(2)], wall_weapon_mesh, wall_weapon_xyzs, rooms_collection)
 
-                    # Create door material
-                    door_material = bpy.data.materials.new(name=f"MilitechArmory_ElevatorDoorMaterial_{i}")
-                    door_material.use_nodes = True
-                    nodes = door_material.node_tree.nodes
-                    links = door_material.node_tree.links
+    # Create weapon mounts just behind the weapons
+    wall_weapon_xyzs[:, 1] -= 0.05
+    link_mesh_objects([f"MilitechArmory_Weapon_Mount_{i}" for i in range(2)], mount_mesh, wall_weapon_xyzs, rooms_collection)
 
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
+    # Create executive
+    executive = create_cube_object("MilitechArmory_Executive", (room_x, room_y + room_size[1] * 0.1, room_z + 1.0), scale=(0.4, 0.4, 0.8), collection=rooms_collection)
 
-                    # Create nodes
-                    output = nodes.new(type='ShaderNodeOutputMaterial')
-                    principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    # Create executive material
+    executive_material = get_shared_material("MilitechArmory_ExecutiveMaterial", (0.1, 0.1, 0.1, 1.0), roughness=0.7)  # Black suit
 
-                    # Set properties
-                    principled.inputs['Base Color'].default_value = (0.8, 0.1, 0.1, 1.0)  # Red
-                    principled.inputs['Metallic'].default_value = 0.9
-                    principled.inputs['Roughness'].default_value = 0.1
+    # Assign material
+    executive.data.materials.append(executive_material)
 
-                    # Connect nodes
-                    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+    # Create executive head
+    head = create_mesh_object("MilitechArmory_Executive_Head", create_uv_sphere_mesh("MilitechArmory_Executive_Head", radius=0.2), (room_x, room_y + room_size[1] * 0.1, room_z + 1.8), rooms_collection)
 
-                    # Assign material
-                    door.data.materials.append(door_material)
+    # Create head material
+    head_material = get_shared_material("MilitechArmory_HeadMaterial", (0.8, 0.6, 0.5, 1.0), roughness=0.7)  # Skin tone
 
-                    room_objects.append(door)
-            else:
-                # Create horizontal corridor
-                corridor_x = (start_pos[0] + end_pos[0]) / 2
-                corridor_y = (start_pos[1] + end_pos[1]) / 2
-                corridor_z = start_pos[2]  # Use start room's z position
+    # Assign material
+    head.data.materials.append(head_material)
 
-                # Calculate corridor direction and length
-                direction = Vector((end_pos[0], end_pos[1], 0)) - Vector((start_pos[0], start_pos[1], 0))
-                length = direction.length
-                direction.normalize()
 
-                bpy.ops.mesh.primitive_cube_add(
-                    size=1.0,
-                    enter_editmode=False,
-                    align='WORLD',
-                    location=(corridor_x, corridor_y, corridor_z + corridor_height/2)
-                )
-                corridor_obj = bpy.context.active_object
-                corridor_obj.name = f"MilitechArmory_Corridor_{start_name}_to_{end_name}"
+# Room-specific builders for the Militech Armory, keyed by room name
+MILITECH_ROOM_BUILDERS = {
+    "Security_Lobby": create_militech_security_lobby,
+    "Showroom": create_militech_showroom,
+    "Testing_Range": create_militech_testing_range,
+    "RD_Lab": create_militech_rd_lab,
+    "Secure_Vault": create_militech_secure_vault,
+    "Executive_Office": create_militech_executive_office,
+}
 
-                # Scale corridor
-                corridor_obj.scale.x = length
-                corridor_obj.scale.y = corridor_width
-                corridor_obj.scale.z = corridor_height
 
-                # Rotate corridor to point from start to end
-                corridor_obj.rotation_euler.z = math.atan2(direction.y, direction.x)
+def create_militech_armory_rooms(militech_objects, materials, interior_materials, merge_static=True):
+    """Create rooms for Militech Armory (Upper Tier corporate weapons manufacturer)
+	Neon Crucible - Militech Armory Rooms Implementation
+	Blender 4.2 Python Script for generating rooms per floor for the Militech Armory building
+	in the Neon Crucible cyberpunk world.
+	merge_static=False keeps every prop as its own object instead of merging same-material props per room.
+	"""
+    # Seed the numpy generator once so a seeded random module reproduces the whole armory
+    seed_rng()
 
-                # Apply transformations
-                bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
+    # Extract objects from the militech_objects dictionary
+    building = militech_objects.get("building")
+    collection = militech_objects.get("collection")
 
-                # Assign material
-                corridor_obj.data.materials.append(interior_materials["Militech_Interior"])
+    if not building or not collection:
+        print("Error: Missing required Militech Armory objects")
+        return None
 
-                room_objects.append(corridor_obj)
+    # Create a subcollection for room objects
+    if "MilitechArmory_Rooms" not in bpy.data.collections:
+        rooms_collection = bpy.data.collections.new("MilitechArmory_Rooms")
+        collection.children.link(rooms_collection)
+    else:
+        rooms_collection = bpy.data.collections["MilitechArmory_Rooms"]
 
-    # Move all objects to the rooms collection
-    for obj in room_objects:
-        if obj.name not in rooms_collection.objects:
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            bpy.ops.object.move_to_collection(collection_index=bpy.data.collections.find(rooms_collection.name))
+    # Keep the rooms collection out of the viewport while it fills up
+    was_hidden = rooms_collection.hide_viewport
+    rooms_collection.hide_viewport = True
+
+    try:
+        # Look up the Militech interior material once
+        interior_material = interior_materials["Militech_Interior"]
+
+        # Get building location and dimensions
+        building_loc = building.location
+        building_size = building.dimensions
+
+        # Define room positions relative to building center
+        rooms_data = [
+            {
+                "name": "Security_Lobby",
+                "position": (0, 0, 0),
+                "size": (building_size.x * 0.7, building_size.y * 0.7, building_size.z * 0.15),
+                "floor_level": 0
+            },
+            {
+                "name": "Showroom",
+                "position": (0, 0, 0),
+                "size": (building_size.x * 0.7, building_size.y * 0.7, building_size.z * 0.15),
+                "floor_level": 1
+            },
+            {
+                "name": "Testing_Range",
+                "position": (building_size.x * 0.3, 0, 0),
+                "size": (building_size.x * 0.4, building_size.y * 0.8, building_size.z * 0.15),
+                "floor_level": 2
+            },
+            {
+                "name": "RD_Lab",
+                "position": (-building_size.x * 0.3, 0, 0),
+                "size": (building_size.x * 0.4, building_size.y * 0.8, building_size.z * 0.15),
+                "floor_level": 2
+            },
+            {
+                "name": "Secure_Vault",
+                "position": (0, -building_size.y * 0.3, 0),
+                "size": (building_size.x * 0.5, building_size.y * 0.4, building_size.z * 0.15),
+                "floor_level": 3
+            },
+            {
+                "name": "Executive_Office",
+                "position": (0, building_size.y * 0.3, 0),
+                "size": (building_size.x * 0.5, building_size.y * 0.4, building_size.z * 0.15),
+                "floor_level": 3
+            }
+        ]
+
+        # Calculate absolute room positions in one pass over the room table
+        room_offsets = np.array([room_data["position"] for room_data in rooms_data], dtype=float)
+        floor_levels = np.array([room_data["floor_level"] for room_data in rooms_data])
+        room_xyz = np.empty((len(rooms_data), 3))
+        room_xyz[:, 0] = building_loc[0] + room_offsets[:, 0]
+        room_xyz[:, 1] = building_loc[1] + room_offsets[:, 1]
+        room_xyz[:, 2] = building_loc[2] - building_size.z/2 + building_size.z * 0.1 + floor_levels * building_size.z * 0.2
+        room_positions = {room_data["name"]: tuple(xyz) for room_data, xyz in zip(rooms_data, room_xyz.tolist())}
+
+        # Floor/ceiling slab and wall meshes, shared by all rooms of the same size
+        shell_meshes = {}
+
+        # Create each room
+        for room_data in rooms_data:
+            room_name = room_data["name"]
+            room_size = room_data["size"]
+            room_x, room_y, room_z = room_positions[room_name]
+
+            # Create the shell meshes the first time this room size comes up
+            if room_size not in shell_meshes:
+                slab_mesh = create_cube_mesh(f"MilitechArmory_{room_name}_Slab", (room_size[0], room_size[1], 0.1))
+                slab_mesh.materials.append(interior_material)
+
+                # One wall mesh per width axis, already scaled and rotated into place
+                wall_meshes = {}
+                for wall_dx, wall_dy, wall_rot_z, width_axis in _WALL_LAYOUT:
+                    if width_axis not in wall_meshes:
+                        wall_mesh = create_cube_mesh(f"MilitechArmory_{room_name}_Wall_{width_axis}")
+                        transform_mesh(wall_mesh, scale=(room_size[width_axis], 0.1, room_size[2]), rotation=(0, 0, wall_rot_z))
+                        wall_mesh.materials.append(interior_material)
+                        wall_meshes[width_axis] = wall_mesh
+
+                shell_meshes[room_size] = (slab_mesh, wall_meshes)
+
+            slab_mesh, wall_meshes = shell_meshes[room_size]
+
+            # Objects linked from here on belong to this room
+            room_start = len(rooms_collection.objects)
+
+            # Create room floor, ceiling and walls
+            create_militech_room_shell(room_name, room_x, room_y, room_z, room_size, slab_mesh, wall_meshes, rooms_collection)
+
+            # Add room-specific elements
+            room_builder = MILITECH_ROOM_BUILDERS.get(room_name)
+            if room_builder:
+                room_builder(room_x, room_y, room_z, room_size, interior_materials, rooms_collection)
+
+            # Merge the room's static props that share materials into one object per material set
+            if merge_static:
+                merge_static_objects(f"MilitechArmory_{room_name}", rooms_collection.objects[room_start:], rooms_collection)
+
+        # Every connecting corridor shares the same cross-section
+        corridor_width = building_size.x * 0.2
+        corridor_height = building_size.z * 0.15
+
+        # Create connecting corridors between rooms
+        corridor_data = [
+            {
+                "start": "Security_Lobby",
+                "end": "Showroom",
+                "width": corridor_width,
+                "height": corridor_height,
+                "vertical": True
+            },
+            {
+                "start": "Showroom",
+                "end": "Testing_Range",
+                "width": corridor_width,
+                "height": corridor_height,
+                "vertical": True
+            },
+            {
+                "start": "Showroom",
+                "end": "RD_Lab",
+                "width": corridor_width,
+                "height": corridor_height,
+                "vertical": True
+            },
+            {
+                "start": "Testing_Range",
+                "end": "Secure_Vault",
+                "width": corridor_width,
+                "height": corridor_height,
+                "vertical": True
+            },
+            {
+                "start": "RD_Lab",
+                "end": "Executive_Office",
+                "width": corridor_width,
+                "height": corridor_height,
+                "vertical": True
+            }
+        ]
+
+        # Create the shared elevator door mesh, sized for the common corridor cross-section
+        door_mesh = create_cube_mesh("MilitechArmory_Elevator_Door", (corridor_width * 0.8, 0.05, corridor_height * 0.8))
+
+        # Create door material
+        door_material = get_shared_material("MilitechArmory_ElevatorDoorMaterial", (0.8, 0.1, 0.1, 1.0), metallic=0.9, roughness=0.1)  # Red
 
-    return rooms_collection
+        # Assign material
+        door_mesh.materials.append(door_material)
+
+        # Stack the endpoints of every corridor between existing rooms and solve their transforms in one pass
+        corridors = [corridor for corridor in corridor_data if corridor["start"] in room_positions and corridor["end"] in room_positions]
+        starts = np.array([room_positions[corridor["start"]] for corridor in corridors]).reshape(-1, 3)
+        ends = np.array([room_positions[corridor["end"]] for corridor in corridors]).reshape(-1, 3)
+        deltas = ends - starts
+        corridor_mids = ((starts + ends) / 2).tolist()
+        corridor_lengths = np.hypot(deltas[:, 0], deltas[:, 1]).tolist()
+        corridor_headings = np.arctan2(deltas[:, 1], deltas[:, 0]).tolist()
+        shaft_heights = np.abs(deltas[:, 2]).tolist()
+
+        # Every elevator shaft gets a door at each end, at the corridor's mid-height
+        shafts = np.array([corridor.get("vertical", False) for corridor in corridors], dtype=bool)
+        door_xyzs = np.stack((starts[shafts], ends[shafts]), axis=1).reshape(-1, 3)
+        door_xyzs[:, 2] += corridor_height / 2
+        door_names = [f"MilitechArmory_Elevator_Door_{j}_{corridor['start']}_to_{corridor['end']}"
+                      for corridor in corridors if corridor.get("vertical", False) for j in range(2)]
+
+        # Shafts and corridors of the same size share one mesh
+        corridor_meshes = {}
+
+        # Create corridors
+        for i, corridor in enumerate(corridors):
+            start_name = corridor["start"]
+            end_name = corridor["end"]
+            corridor_width = corridor["width"]
+            corridor_height = corridor["height"]
+            vertical = shafts[i]
 
+            if vertical:
+                # Create elevator shaft
+                elevator_x, elevator_y, elevator_z = corridor_mids[i]
+                elevator_name = f"MilitechArmory_Elevator_{start_name}_to_{end_name}"
+                shaft_size = (corridor_width, corridor_width, shaft_heights[i])
 
+                # Create the shaft mesh the first time this size comes up
+                if shaft_size not in corridor_meshes:
+                    shaft_mesh = create_cube_mesh(elevator_name, shaft_size)
+                    shaft_mesh.materials.append(interior_material)
+                    corridor_meshes[shaft_size] = shaft_mesh
 
-# Main function to implement rooms for all buildings
-def implement_building_rooms(building_objects, materials, interior_materials):
-    """Implement rooms per floor for all buildings"""
-    # Implement rooms for each building
-    rooms = {}
-
-    # NeoTech Labs Tower
-    if "neotech_tower" in building_objects:
-        rooms["NeoTech_Rooms"] = create_neotech_rooms(
-            building_objects["neotech_tower"],
-            materials,
-            interior_materials
-        )
+                create_mesh_object(elevator_name, corridor_meshes[shaft_size], (elevator_x, elevator_y, elevator_z), rooms_collection)
+            else:
+                # Create horizontal corridor
+                corridor_x, corridor_y = corridor_mids[i][:2]
+                corridor_z = starts[i, 2]  # Use start room's z position
+                corridor_name = f"MilitechArmory_Corridor_{start_name}_to_{end_name}"
+                corridor_size = (corridor_lengths[i], corridor_width, corridor_height)
 
-    # Specter Station
-    if "specter_station" in building_objects:
-        rooms["Specter_Rooms"] = create_specter_rooms(
-            building_objects["specter_station"],
-            materials,
-            interior_materials
-        )
+                # Create the corridor mesh the first time this size comes up
+                if corridor_size not in corridor_meshes:
+                    corridor_mesh = create_cube_mesh(corridor_name, corridor_size)
+                    corridor_mesh.materials.append(interior_material)
+                    corridor_meshes[corridor_size] = corridor_mesh
 
-	# Black Nexus
-    if "black_nexus" in building_objects:
-        rooms["BlackNexus_Rooms"] = create_black_nexus_rooms(
-            building_objects["black_nexus"],
-            materials,
-            interior_materials
-        )
+                # Rotate corridor to point from start to end
+                create_mesh_object(corridor_name, corridor_meshes[corridor_size], (corridor_x, corridor_y, corridor_z + corridor_height/2),
+                                   rooms_collection, rotation_z=corridor_headings[i])
 
-	# Wire Nest
-    if "wire_nest" in building_objects:
-        rooms["WireNest_Rooms"] = create_wire_nest_rooms(
-            building_objects["wire_nest"],
-            materials,
-            interior_materials
-        )
+        # Create all elevator doors on the shared door mesh in one pass
+        link_mesh_objects(door_names, door_mesh, door_xyzs, rooms_collection)
+    finally:
+        # Reveal the rooms again, even if a room builder failed
+        rooms_collection.hide_viewport = was_hidden
 
-	# Rust Vault
-    if "rust_vault" in building_objects:
-        rooms["RustVault_Rooms"] = create_rust_vault_rooms(
-            building_objects["rust_vault"],
-            materials,
-            interior_materials
-        )
+    return rooms_collection
 
-	# Militech Armory
-    if "militech_armory" in building_objects:
-        rooms["MilitechArmory_Rooms"] = create_militech_armory_rooms(
-            building_objects["militech_armory"],
-            materials,
-            interior_materials
-        )
+
+# Building key, rooms key and room creator for each building
+BUILDING_ROOM_CREATORS = (
+    ("neotech_tower", "NeoTech_Rooms", create_neotech_rooms),
+    ("specter_station", "Specter_Rooms", create_specter_rooms),
+    ("black_nexus", "BlackNexus_Rooms", create_black_nexus_rooms),
+    ("wire_nest", "WireNest_Rooms", create_wire_nest_rooms),
+    ("rust_vault", "RustVault_Rooms", create_rust_vault_rooms),
+    ("militech_armory", "MilitechArmory_Rooms", create_militech_armory_rooms),
+)
+
+
+# Main function to implement rooms for all buildings
+def implement_building_rooms(building_objects, materials, interior_materials, use_node_materials=True):
+    """Implement rooms per floor for all buildings"""
+    # Shared materials skip their node trees when only previewed in the solid viewport
+    global _flat_materials
+    was_flat = _flat_materials
+    _flat_materials = not use_node_materials
+
+    try:
+        # Implement rooms for each building present, in table order
+        rooms = {}
+        for building_key, rooms_key, create_rooms in BUILDING_ROOM_CREATORS:
+            if building_key in building_objects:
+                rooms[rooms_key] = create_rooms(building_objects[building_key], materials, interior_materials)
+    finally:
+        # Later direct creator calls go back to the previous material mode
+        _flat_materials = was_flat
 
     return rooms